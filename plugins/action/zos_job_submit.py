@@ -8,7 +8,19 @@ __metaclass__ = type
 from ansible.plugins.action import ActionBase
 from ansible.errors import AnsibleError, AnsibleFileNotFound
 from ansible.module_utils._text import to_bytes, to_text
+from ansible import constants as C
+from ansible_collections.ibm.ibm_zos_core.plugins.module_utils.encode import (
+    ASCII_ENCODINGS,
+    EncodeError,
+    to_ebcdic,
+)
+from ansible_collections.ibm.ibm_zos_core.plugins.module_utils.jcl import (
+    decode_jcl,
+    jcl_errors,
+    validate_jcl,
+)
 import os
+import tempfile
 
 
 class ActionModule(ActionBase):
@@ -23,7 +35,7 @@ class ActionModule(ActionBase):
             return result
 
         module_args = self._task.args.copy()
-        if module_args["location"] == "LOCAL":
+        if module_args.get("location") == "LOCAL":
 
             source = self._task.args.get("src", None)
 
@@ -70,6 +82,28 @@ class ActionModule(ActionBase):
                 self._remove_tmp_path(tmp)
                 return result
 
+            # Check the JCL on the controller so that errors are found
+            # before anything is copied or submitted.
+            validation = None
+            if module_args.get("validate"):
+                try:
+                    validation = self._validate_jcl(
+                        source_full, module_args.get("encoding") or "UTF-8"
+                    )
+                except (EncodeError, IOError, OSError) as e:
+                    self._remove_tmp_path(tmp)
+                    result["failed"] = True
+                    result["msg"] = "Unable to read the JCL to validate it. {0}".format(
+                        to_text(e)
+                    )
+                    return result
+                if jcl_errors(validation):
+                    self._remove_tmp_path(tmp)
+                    result["failed"] = True
+                    result["msg"] = "JCL validation failed, no job was submitted."
+                    result["validation"] = validation
+                    return result
+
             # if self._connection._shell.path_has_trailing_slash(dest):
             #     dest_file = self._connection._shell.join_path(dest, source_rel)
             # else:
@@ -87,8 +121,30 @@ class ActionModule(ActionBase):
 
             tmp_src = self._connection._shell.join_path(tmp, "source")
 
+            # Convert ASCII based JCL to EBCDIC here so the module can
+            # submit the transferred file as is.
+            encoding = module_args.get("encoding") or "UTF-8"
+            converted_source = None
+            if encoding.upper() in ASCII_ENCODINGS:
+                try:
+                    converted_source = self._convert_to_ebcdic(source_full, encoding)
+                except (EncodeError, IOError, OSError) as e:
+                    self._remove_tmp_path(tmp)
+                    result["failed"] = True
+                    result["msg"] = (
+                        "The Local file encoding conversion failed. "
+                        "Please check the source file. {0}".format(to_text(e))
+                    )
+                    return result
+
             remote_path = None
-            remote_path = self._transfer_file(source_full, tmp_src)
+            try:
+                remote_path = self._transfer_file(
+                    converted_source or source_full, tmp_src
+                )
+            finally:
+                if converted_source:
+                    os.remove(converted_source)
 
             if remote_path:
                 self._fixup_perms2((tmp, remote_path))
@@ -97,6 +153,8 @@ class ActionModule(ActionBase):
             copy_module_args = {}
             module_args = self._task.args.copy()
             module_args["temp_file"] = dest_path
+            if validation is not None:
+                module_args["validate"] = False
 
             copy_module_args.update(
                 dict(
@@ -120,6 +178,8 @@ class ActionModule(ActionBase):
                     task_vars=task_vars,
                 )
             )
+            if validation is not None:
+                result["validation"] = validation
         else:
             result.update(
                 self._execute_module(
@@ -130,3 +190,39 @@ class ActionModule(ActionBase):
             )
 
         return result
+
+    def _validate_jcl(self, source, encoding):
+        """Check the structure of a local JCL file.
+
+        Arguments:
+            source {str} -- Path to the local source file.
+            encoding {str} -- The encoding of the local source file.
+
+        Returns:
+            list[dict] -- The findings, each with the src, line, severity and message.
+        """
+        with open(to_bytes(source, errors="surrogate_or_strict"), "rb") as f:
+            contents = f.read()
+        return [
+            dict(src=self._task.args.get("src"), **finding)
+            for finding in validate_jcl(decode_jcl(contents, encoding))
+        ]
+
+    def _convert_to_ebcdic(self, source, encoding):
+        """Write an IBM-1047 copy of a local file to the controller's
+        temporary directory.
+
+        Arguments:
+            source {str} -- Path to the local source file.
+            encoding {str} -- The encoding of the local source file.
+
+        Returns:
+            str -- Path to the converted copy.
+        """
+        with open(to_bytes(source, errors="surrogate_or_strict"), "rb") as f:
+            contents = f.read()
+        converted = to_ebcdic(contents, encoding, "IBM-1047")
+        fd, converted_source = tempfile.mkstemp(dir=C.DEFAULT_LOCAL_TMP)
+        with os.fdopen(fd, "wb") as f:
+            f.write(converted)
+        return converted_source
@@ -20,6 +20,15 @@ __metaclass__ = type
 
 LISTDS_COMMAND = "  LISTDS '{0}'"
 LISTCAT_COMMAND = "  LISTCAT ENT({0}) ALL"
+LISTDS_MEMBERS_COMMAND = "  LISTDS '{0}' MEMBERS"
+
+# LISTCAT attribute of the DATA component for each VSAM cluster type
+VSAM_ORGANIZATIONS = {
+    "INDEXED": "KSDS",
+    "NONINDEXED": "ESDS",
+    "NUMBERED": "RRDS",
+    "LINEAR": "LDS",
+}
 
 
 class DataSetUtils(object):
@@ -105,6 +114,37 @@ class DataSetUtils(object):
 
         return temp_ds_name
 
+    @staticmethod
+    def list_members(module, data_set):
+        """Reads the directory of a partitioned data set with a single
+        LISTDS command.
+
+        Arguments:
+            module {AnsibleModule} -- The AnsibleModule object from currently
+                                      running module.
+            data_set {str} -- Name of the partitioned data set
+
+        Returns:
+            list[str] -- The member names, in directory order
+
+        Raises:
+            MVSCmdExecError: When the data set can not be listed
+        """
+        rc, out, err = module.run_command(
+            "mvscmdauth --pgm=IKJEFT01 --systsprt=* --systsin=stdin",
+            data=LISTDS_MEMBERS_COMMAND.format(data_set),
+        )
+        if rc != 0 or re.findall(r"NOT IN CATALOG|NOT FOUND|NOT LISTED", out):
+            raise MVSCmdExecError(rc, out, err)
+        members = []
+        directory = out.split("--MEMBERS--", 1)
+        if len(directory) == 2:
+            for line in directory[1].splitlines():
+                member = re.match(r"^\s+([A-Z$#@][A-Z0-9$#@]{0,7})(\s|$)", line)
+                if member:
+                    members.append(member.group(1))
+        return members
+
     def get_data_set_volume(self):
         """Retrieves the volume name where the input data set is stored.
 
@@ -124,10 +164,11 @@ class DataSetUtils(object):
     def get_data_set_lrecl(self):
         """Retrieves the record length of the input data set. Record length
         specifies the length, in bytes, of each record in the data set.
+        For a VSAM data set, the maximum record length of its DATA component.
 
         Returns:
             int -- The record length, in bytes, of each record
-            None -- If the data set does not exist or the data set is VSAM
+            None -- If the data set does not exist
 
         Raises:
             AttributeError -- When input data set is a USS file or directory
@@ -163,6 +204,83 @@ class DataSetUtils(object):
             )
         return self.ds_info.get('recfm')
 
+    def get_data_set_dsntype(self):
+        """Retrieves the data set name type of the input data set, as
+        reported by LISTCAT.
+
+        Returns:
+            str -- Data set name type
+            None -- If the data set does not exist or LISTCAT does not report it
+
+        Raises:
+            AttributeError -- When input data set is a USS file or directory
+
+        Possible return values:
+            'LIBRARY' -- Partitioned data set extended (PDSE)
+            'PDS'     -- Partitioned data set
+        """
+        if self.uss_path:
+            raise AttributeError(
+                "USS file or directory has no attribute 'dsntype'"
+            )
+        return self.ds_info.get('dsntype')
+
+    def get_data_set_data_class(self):
+        """Retrieves the SMS data class of the input data set, as reported
+        by LISTCAT.
+
+        Returns:
+            str -- The data class
+            None -- If the data set does not exist or has no data class
+
+        Raises:
+            AttributeError -- When input data set is a USS file or directory
+        """
+        if self.uss_path:
+            raise AttributeError(
+                "USS file or directory has no attribute 'data_class'"
+            )
+        return self.ds_info.get('data_class')
+
+    def get_vsam_allocation(self):
+        """Retrieves the primary space allocated to the DATA component of a
+        VSAM input data set, as reported by LISTCAT.
+
+        Returns:
+            dict -- The space_type (TRACK or CYLINDER) and primary quantity
+            None -- If the data set does not exist or is not VSAM
+
+        Raises:
+            AttributeError -- When input data set is a USS file or directory
+        """
+        if self.uss_path:
+            raise AttributeError(
+                "USS file or directory has no attribute 'vsam_allocation'"
+            )
+        return self.ds_info.get('vsam_allocation')
+
+    def get_vsam_type(self):
+        """Retrieves the cluster type of a VSAM input data set.
+
+        Returns:
+            str -- VSAM cluster type
+            None -- If the data set does not exist or is not VSAM
+
+        Raises:
+            AttributeError -- When input data set is a USS file or directory
+
+        Possible return values:
+            'KSDS' -- Key Sequenced
+            'ESDS' -- Entry Sequenced
+            'RRDS' -- Relative Record
+            'LDS'  -- Linear
+        """
+        if self.uss_path:
+            raise AttributeError(
+                "USS file or directory has no attribute 'vsam_type'"
+            )
+        return self.ds_info.get('vsam_type')
+
     def _gather_data_set_info(self):
         """Retrieves information about the input data set using LISTDS and
         LISTCAT commands.
@@ -252,6 +370,28 @@ class DataSetUtils(object):
             result['volser'] = ''.join(
                 re.findall(r"-[A-Z|0-9]*", volser_output[0])
             ).replace('-', '')
+            dsntype = re.search(r"DSNTYPE-*([A-Z]+)", output)
+            if dsntype:
+                result['dsntype'] = dsntype.group(1)
+            vsam_type = re.search(
+                r"\b({0})\b".format("|".join(VSAM_ORGANIZATIONS)), output
+            )
+            data_class = re.search(r"DATACLASS\s*-+\s*(\S+)", output)
+            if data_class and data_class.group(1) != "(NULL)":
+                result['data_class'] = data_class.group(1)
+            if vsam_type and re.search(r"^0?CLUSTER", output, re.MULTILINE):
+                result['vsam_type'] = VSAM_ORGANIZATIONS.get(vsam_type.group(1))
+                # the DATA component is listed before the INDEX component
+                max_lrecl = re.search(r"MAXLRECL-*([0-9]+)", output)
+                if max_lrecl:
+                    result['lrecl'] = max_lrecl.group(1)
+                space_type = re.search(r"SPACE-TYPE-*([A-Z]+)", output)
+                space_primary = re.search(r"SPACE-PRI-*([0-9]+)", output)
+                if space_type and space_primary:
+                    result['vsam_allocation'] = dict(
+                        space_type=space_type.group(1),
+                        primary=int(space_primary.group(1)),
+                    )
         return result
 
 
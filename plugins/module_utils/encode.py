@@ -0,0 +1,138 @@
+# Copyright (c) IBM Corporation 2020
+# Apache License, Version 2.0 (see https://opensource.org/licenses/Apache-2.0)
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import codecs
+
+# Encodings accepted for a LOCAL source file mapped to Python codec names
+ASCII_ENCODINGS = {
+    "UTF-8": "utf-8",
+    "ASCII": "ascii",
+    "ISO-8859-1": "latin-1",
+}
+
+EBCDIC_ENCODINGS = ["EBCDIC", "IBM-037", "IBM-1047"]
+
+# Byte positions where IBM-1047 differs from IBM-037 ([, ], ^, ¬, Ý, ¨)
+IBM_1047_SWAPS = [(0x5F, 0xB0), (0xAD, 0xBA), (0xBB, 0xBD)]
+
+# z/OS iconv converts the ASCII line feed to the EBCDIC new line (0x15)
+# rather than to the EBCDIC line feed (0x25) used by Python's cp037.
+NEW_LINE_SWAPS = [(0x15, 0x25)]
+
+
+def _build_decoding_table(base_codec, swaps):
+    """Build a 256 character decoding table for an EBCDIC code page
+    by swapping byte positions of a code page known to Python.
+
+    Arguments:
+        base_codec {str} -- The Python codec the table is derived from.
+        swaps {list[tuple[int, int]]} -- Byte positions to exchange.
+
+    Raises:
+        EncodeError: When the resulting table is not a one to one mapping.
+
+    Returns:
+        str -- The decoding table, indexed by EBCDIC byte value.
+    """
+    table = list(bytes(bytearray(range(256))).decode(base_codec))
+    for first, second in swaps:
+        table[first], table[second] = table[second], table[first]
+    table = "".join(table)
+    if len(table) != 256 or len(set(table)) != 256:
+        raise EncodeError(
+            "Code page table derived from {0} is not a valid single byte mapping.".format(
+                base_codec
+            )
+        )
+    return table
+
+
+DECODING_TABLES = {
+    "IBM-037": _build_decoding_table("cp037", NEW_LINE_SWAPS),
+    "IBM-1047": _build_decoding_table("cp037", NEW_LINE_SWAPS + IBM_1047_SWAPS),
+}
+
+ENCODING_TABLES = dict(
+    (code_page, codecs.charmap_build(table))
+    for code_page, table in DECODING_TABLES.items()
+)
+
+
+def to_ebcdic(contents, from_encoding="UTF-8", to_code_page="IBM-1047"):
+    """Convert the contents of a file from an ASCII based encoding
+    to an EBCDIC code page, the way z/OS iconv would.
+
+    Arguments:
+        contents {bytes} -- The raw contents to convert.
+
+    Keyword Arguments:
+        from_encoding {str} -- The encoding of contents. (default: {"UTF-8"})
+        to_code_page {str} -- The EBCDIC code page to produce. (default: {"IBM-1047"})
+
+    Raises:
+        EncodeError: When the encodings are not supported or the
+        contents can not be represented in the target code page.
+
+    Returns:
+        bytes -- The converted contents.
+    """
+    codec = ASCII_ENCODINGS.get((from_encoding or "UTF-8").upper())
+    encoding_table = ENCODING_TABLES.get(to_code_page.upper())
+    if codec is None:
+        raise EncodeError(
+            "Unsupported source encoding {0}. Expected one of: {1}.".format(
+                from_encoding, ", ".join(ASCII_ENCODINGS)
+            )
+        )
+    if encoding_table is None:
+        raise EncodeError(
+            "Unsupported code page {0}. Expected one of: {1}.".format(
+                to_code_page, ", ".join(ENCODING_TABLES)
+            )
+        )
+    try:
+        text = contents.decode(codec)
+        converted, length = codecs.charmap_encode(text, "strict", encoding_table)
+    except (UnicodeDecodeError, UnicodeEncodeError) as e:
+        raise EncodeError(
+            "Unable to convert from {0} to {1}. {2}".format(
+                from_encoding, to_code_page, str(e)
+            )
+        )
+    return converted
+
+
+def from_ebcdic(contents, from_code_page="IBM-1047"):
+    """Convert EBCDIC contents back to text.
+
+    Arguments:
+        contents {bytes} -- The EBCDIC contents to convert.
+
+    Keyword Arguments:
+        from_code_page {str} -- The EBCDIC code page of contents. (default: {"IBM-1047"})
+
+    Raises:
+        EncodeError: When the code page is not supported.
+
+    Returns:
+        str -- The decoded text.
+    """
+    decoding_table = DECODING_TABLES.get(from_code_page.upper())
+    if decoding_table is None:
+        raise EncodeError(
+            "Unsupported code page {0}. Expected one of: {1}.".format(
+                from_code_page, ", ".join(DECODING_TABLES)
+            )
+        )
+    text, length = codecs.charmap_decode(contents, "strict", decoding_table)
+    return text
+
+
+class EncodeError(Exception):
+    def __init__(self, message):
+        self.msg = "An error occurred during encoding conversion. {0}".format(message)
+        super(EncodeError, self).__init__(self.msg)
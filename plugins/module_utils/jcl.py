@@ -0,0 +1,605 @@
+# Copyright (c) IBM Corporation 2020
+# Apache License, Version 2.0 (see https://opensource.org/licenses/Apache-2.0)
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import re
+from ansible_collections.ibm.ibm_zos_core.plugins.module_utils.encode import (
+    ASCII_ENCODINGS,
+    EBCDIC_ENCODINGS,
+    from_ebcdic,
+)
+
+JCL_OPERATIONS = [
+    "JOB",
+    "EXEC",
+    "DD",
+    "PROC",
+    "PEND",
+    "SET",
+    "IF",
+    "ELSE",
+    "ENDIF",
+    "INCLUDE",
+    "JCLLIB",
+    "OUTPUT",
+    "CNTL",
+    "ENDCNTL",
+    "XMIT",
+    "COMMAND",
+    "EXPORT",
+    "SCHEDULE",
+    "NOTIFY",
+]
+
+EXEC_KEYWORDS = [
+    "PGM",
+    "PROC",
+    "PARM",
+    "PARMDD",
+    "COND",
+    "REGION",
+    "REGIONX",
+    "TIME",
+    "ACCT",
+    "ADDRSPC",
+    "DPRTY",
+    "DYNAMNBR",
+    "MEMLIMIT",
+    "PERFORM",
+    "RD",
+    "CCSID",
+    "TVSMSG",
+    "TVSAMCOM",
+]
+
+DD_POSITIONALS = ["*", "DATA", "DUMMY", "DYNAM"]
+
+DD_KEYWORDS = [
+    "ACCODE",
+    "AMP",
+    "AVGREC",
+    "BLKSIZE",
+    "BLKSZLIM",
+    "BUFNO",
+    "BURST",
+    "CCSID",
+    "CHARS",
+    "CHKPT",
+    "CNTL",
+    "COPIES",
+    "DATACLAS",
+    "DCB",
+    "DDNAME",
+    "DEST",
+    "DISP",
+    "DLM",
+    "DSID",
+    "DSKEYLBL",
+    "DSN",
+    "DSNAME",
+    "DSNTYPE",
+    "DSORG",
+    "EATTR",
+    "EXPDT",
+    "FCB",
+    "FILEDATA",
+    "FLASH",
+    "FREE",
+    "FREEVOL",
+    "GDGORDER",
+    "HOLD",
+    "KEYLABL1",
+    "KEYLABL2",
+    "KEYENCD1",
+    "KEYENCD2",
+    "KEYLEN",
+    "KEYOFF",
+    "LABEL",
+    "LGSTREAM",
+    "LIKE",
+    "LRECL",
+    "MAXGENS",
+    "MGMTCLAS",
+    "MODIFY",
+    "OUTLIM",
+    "OUTPUT",
+    "PATH",
+    "PATHDISP",
+    "PATHMODE",
+    "PATHOPTS",
+    "PROTECT",
+    "QNAME",
+    "RECFM",
+    "RECORG",
+    "REFDD",
+    "RETPD",
+    "RLS",
+    "ROACCESS",
+    "SECMODEL",
+    "SEGMENT",
+    "SPACE",
+    "SPIN",
+    "STORCLAS",
+    "SUBSYS",
+    "SYMBOLS",
+    "SYMLIST",
+    "SYSOUT",
+    "TERM",
+    "UCS",
+    "UNIT",
+    "VOL",
+    "VOLUME",
+]
+
+NAME_REGEX = re.compile(r"^[A-Z$#@][A-Z0-9$#@]{0,7}$")
+DD_NAME_REGEX = re.compile(r"^[A-Z$#@][A-Z0-9$#@]{0,7}(\.[A-Z$#@][A-Z0-9$#@]{0,7})?$")
+KEYWORD_REGEX = re.compile(r"^[A-Z][A-Z0-9]*(\.[A-Z$#@][A-Z0-9$#@]{0,7})?$")
+SYMBOL_REGEX = re.compile(r"(?<!&)&([A-Z$#@][A-Z0-9$#@]{0,7})")
+QUOTED_REGEX = re.compile(r"'[^']*'")
+
+
+def decode_jcl(contents, encoding=None):
+    """Decode the raw contents of a JCL source. JCL always begins with
+    "//", so EBCDIC contents are recognized by their first bytes when no
+    encoding is given.
+
+    Arguments:
+        contents {bytes} -- The raw contents.
+
+    Keyword Arguments:
+        encoding {str} -- The encoding of contents, e.g. "UTF-8" or "IBM-1047". (default: {None})
+
+    Returns:
+        str -- The JCL text.
+    """
+    if encoding is None:
+        encoding = "IBM-1047" if contents.lstrip(b"\x40").startswith(b"\x61") else "UTF-8"
+    encoding = encoding.upper()
+    if encoding in EBCDIC_ENCODINGS:
+        code_page = "IBM-1047" if encoding == "EBCDIC" else encoding
+        return from_ebcdic(contents, code_page)
+    return contents.decode(ASCII_ENCODINGS.get(encoding, encoding), "replace")
+
+
+def validate_jcl(text):
+    """Check the structure of JCL without submitting it: card columns,
+    continuations, statement syntax, EXEC and DD parameters, IF/ENDIF
+    nesting and symbol references.
+
+    Arguments:
+        text {str} -- The JCL to check.
+
+    Returns:
+        list[dict] -- The findings, each with the line number, a severity of
+        "error" or "warning" and a message. Errors would make JES reject the
+        job; warnings are likely mistakes.
+    """
+    return JCLValidator().validate(text)
+
+
+def jcl_errors(findings):
+    """Select the findings that would make JES reject the job.
+
+    Arguments:
+        findings {list[dict]} -- The findings from validate_jcl.
+
+    Returns:
+        list[dict] -- The findings with severity "error".
+    """
+    return [finding for finding in findings if finding.get("severity") == "error"]
+
+
+class JCLValidator(object):
+    def __init__(self):
+        """Validates one JCL stream. Use validate_jcl rather than this
+        class directly."""
+        self.findings = []
+        self.statement = None
+        self.in_data = False
+        self.data_delimiter = "/*"
+        self.data_ends_at_jcl = True
+        self.seen_job = False
+        self.in_step = False
+        self.in_proc = False
+        self.open_ifs = []
+        self.step_names = set()
+        self.dd_names = set()
+        self.symbols = set()
+        self.proc_symbols = set()
+
+    def validate(self, text):
+        for line_number, card in enumerate(text.splitlines(), 1):
+            self._check_card(line_number, card)
+        if self.statement:
+            self._error(
+                self.statement.get("line"),
+                "The statement is continued but the JCL ends.",
+            )
+            self._finish_statement()
+        self._end_job()
+        if not self.seen_job:
+            self._error(1, "No JOB statement found.")
+        return sorted(self.findings, key=lambda finding: finding.get("line"))
+
+    def _error(self, line, message):
+        self.findings.append(dict(line=line, severity="error", message=message))
+
+    def _warning(self, line, message):
+        self.findings.append(dict(line=line, severity="warning", message=message))
+
+    def _check_card(self, line_number, card):
+        card = card.rstrip("\r\n")
+        if len(card) > 80:
+            self._error(line_number, "The line is longer than 80 columns.")
+        if self.in_data:
+            if card.startswith(self.data_delimiter):
+                self.in_data = False
+                return
+            if not (self.data_ends_at_jcl and card.startswith("//")):
+                return
+            self.in_data = False
+        if card.startswith("//*"):
+            return
+        if not card.startswith("//"):
+            if self.statement:
+                self._error(
+                    line_number,
+                    "Expected the continuation of the statement on line {0}.".format(
+                        self.statement.get("line")
+                    ),
+                )
+                self._finish_statement()
+            if not card.startswith("/*"):
+                self._warning(
+                    line_number,
+                    "The line is not a JCL statement and not in-stream data; "
+                    "JES will read it as a SYSIN DD * data set.",
+                )
+            return
+        if len(card) > 71 and card[71] != " ":
+            self._warning(
+                line_number, "Column 72 is not blank; it is ignored in JCL statements."
+            )
+        card = card[:71]
+        if not card[2:].strip():
+            if self.statement:
+                self._finish_statement()
+            self._end_job()
+            return
+        if self.statement:
+            if self._continue_statement(line_number, card):
+                return
+            self._finish_statement()
+        self._start_statement(line_number, card)
+
+    def _start_statement(self, line_number, card):
+        fields = card[2:]
+        name = ""
+        if not fields.startswith(" "):
+            name = fields.split(" ", 1)[0]
+            fields = fields[len(name):]
+        words = fields.split(None, 1)
+        if not words:
+            self._error(line_number, "The statement has no operation.")
+            return
+        operation = words[0]
+        rest = words[1] if len(words) > 1 else ""
+        if operation.upper() not in JCL_OPERATIONS:
+            self._error(line_number, "Unknown operation {0}.".format(operation))
+            return
+        if operation != operation.upper() or name != name.upper():
+            self._error(
+                line_number, "The name and operation fields must be in upper case."
+            )
+        if operation.upper() == "IF":
+            # the relational expression of IF may contain blanks
+            operands, open_quote = rest.strip(), False
+        else:
+            operands, open_quote = _split_operand_field(rest)
+        self.statement = dict(
+            line=line_number,
+            name=name.upper(),
+            operation=operation.upper(),
+            operands=operands,
+            open_quote=open_quote,
+        )
+        if not self._is_continued():
+            self._finish_statement()
+
+    def _continue_statement(self, line_number, card):
+        statement = self.statement
+        if card[2] != " ":
+            return False
+        column = len(card) - len(card[2:].lstrip()) + 1
+        text = card[column - 1:]
+        if statement.get("operation") == "IF":
+            if text.split(None, 1)[0].upper() in JCL_OPERATIONS:
+                return False
+            statement["operands"] += " " + text.strip()
+        elif statement.get("open_quote"):
+            if column != 16:
+                self._error(
+                    line_number, "A continued quoted string must resume in column 16."
+                )
+            operands, open_quote = _split_operand_field(text, in_quote=True)
+            statement["operands"] += operands
+            statement["open_quote"] = open_quote
+        else:
+            if column < 4 or column > 16:
+                self._error(
+                    line_number,
+                    "A continued parameter must start in columns 4 through 16.",
+                )
+            operands, open_quote = _split_operand_field(text)
+            statement["operands"] += operands
+            statement["open_quote"] = open_quote
+        if not self._is_continued():
+            self._finish_statement()
+        return True
+
+    def _is_continued(self):
+        statement = self.statement
+        if statement.get("open_quote"):
+            return True
+        if statement.get("operation") == "IF":
+            return "THEN" not in statement.get("operands").upper().split()
+        return statement.get("operands").endswith(",")
+
+    def _finish_statement(self):
+        statement = self.statement
+        self.statement = None
+        line = statement.get("line")
+        operation = statement.get("operation")
+        name = statement.get("name")
+        operands = statement.get("operands")
+        if operation == "EXEC":
+            self.in_step = True
+            self.dd_names = set()
+        if operation == "IF":
+            self._check_if(statement)
+            return
+        if statement.get("open_quote"):
+            self._error(line, "A quoted string is not closed.")
+            return
+        parameters = _split_parameters(operands)
+        if parameters is None:
+            self._error(line, "The parentheses are not balanced.")
+            return
+        if operation != "JOB" and not self.seen_job:
+            self._error(line, "The JCL must start with a JOB statement.")
+            self.seen_job = True
+        check = getattr(self, "_check_" + operation.lower(), None)
+        if check:
+            check(line, name, parameters)
+        elif name and not NAME_REGEX.match(name):
+            self._error(line, "Invalid name {0}.".format(name))
+        self._check_symbols(line, operation, parameters)
+
+    def _check_job(self, line, name, parameters):
+        self.seen_job = True
+        self._end_job()
+        if not name:
+            self._error(line, "The JOB statement has no job name.")
+        elif not NAME_REGEX.match(name):
+            self._error(line, "Invalid job name {0}.".format(name))
+
+    def _check_exec(self, line, name, parameters):
+        if name:
+            if not NAME_REGEX.match(name):
+                self._error(line, "Invalid step name {0}.".format(name))
+            elif name in self.step_names:
+                self._warning(line, "Step name {0} is used more than once.".format(name))
+            self.step_names.add(name)
+        if not parameters:
+            self._error(line, "The EXEC statement needs PGM=, PROC= or a procedure name.")
+            return
+        first_key, first_value = _keyword(parameters[0])
+        if first_key is None:
+            return
+        if first_key not in ["PGM", "PROC"]:
+            self._error(line, "The EXEC statement needs PGM=, PROC= or a procedure name.")
+            return
+        if first_key == "PGM" and not (
+            NAME_REGEX.match(first_value)
+            or first_value.startswith("*.")
+            or "&" in first_value
+        ):
+            self._error(line, "Invalid program name {0}.".format(first_value))
+        for parameter in parameters[1:]:
+            key, value = _keyword(parameter)
+            if key is None:
+                self._error(line, "Unexpected positional parameter {0}.".format(parameter))
+            elif not KEYWORD_REGEX.match(key):
+                self._error(line, "Invalid keyword {0}.".format(key))
+            elif first_key == "PGM" and key.split(".")[0] not in EXEC_KEYWORDS:
+                self._warning(line, "Unknown EXEC parameter {0}.".format(key))
+
+    def _check_dd(self, line, name, parameters):
+        if name:
+            if not DD_NAME_REGEX.match(name):
+                self._error(line, "Invalid DD name {0}.".format(name))
+            elif name in self.dd_names:
+                self._warning(line, "DD name {0} is used more than once in the step.".format(name))
+            self.dd_names.add(name)
+        if (
+            not self.in_step
+            and not self.in_proc
+            and name not in ["JOBLIB", "JOBCAT", ""]
+        ):
+            self._error(line, "DD statement {0} comes before the first EXEC statement.".format(name))
+        data_delimiter = "/*"
+        for index, parameter in enumerate(parameters):
+            key, value = _keyword(parameter)
+            if key is None:
+                if index != 0 or parameter.upper() not in DD_POSITIONALS:
+                    self._error(line, "Unexpected positional parameter {0}.".format(parameter))
+                continue
+            if not KEYWORD_REGEX.match(key):
+                self._error(line, "Invalid keyword {0}.".format(key))
+            elif key not in DD_KEYWORDS:
+                self._warning(line, "Unknown DD parameter {0}.".format(key))
+            if key == "DLM":
+                data_delimiter = value.strip("'")[:2]
+        if parameters and parameters[0] in ["*", "DATA"]:
+            self.in_data = True
+            self.data_delimiter = data_delimiter
+            self.data_ends_at_jcl = parameters[0] == "*" and data_delimiter == "/*"
+
+    def _check_proc(self, line, name, parameters):
+        self.in_proc = True
+        self.proc_symbols = set()
+        for parameter in parameters:
+            key, value = _keyword(parameter)
+            if key is None:
+                self._error(line, "Unexpected positional parameter {0}.".format(parameter))
+            else:
+                self.proc_symbols.add(key)
+
+    def _check_pend(self, line, name, parameters):
+        self.in_proc = False
+        self.proc_symbols = set()
+
+    def _check_set(self, line, name, parameters):
+        if not parameters:
+            self._error(line, "The SET statement needs at least one symbol.")
+        for parameter in parameters:
+            key, value = _keyword(parameter)
+            if key is None or not NAME_REGEX.match(key):
+                self._error(line, "Invalid SET parameter {0}.".format(parameter))
+            else:
+                self.symbols.add(key)
+
+    def _check_if(self, statement):
+        line = statement.get("line")
+        self.open_ifs.append(line)
+        expression = statement.get("operands")
+        if "THEN" not in expression.upper().split():
+            self._error(line, "The IF statement has no THEN.")
+        elif _split_parameters(expression.replace(" ", "")) is None:
+            self._error(line, "The parentheses are not balanced.")
+
+    def _check_else(self, line, name, parameters):
+        if not self.open_ifs:
+            self._error(line, "ELSE without IF.")
+
+    def _check_endif(self, line, name, parameters):
+        if not self.open_ifs:
+            self._error(line, "ENDIF without IF.")
+        else:
+            self.open_ifs.pop()
+
+    def _check_symbols(self, line, operation, parameters):
+        if operation in ["SET", "PROC", "JOB"]:
+            return
+        defined = self.symbols | self.proc_symbols
+        for parameter in parameters:
+            if "&" not in parameter:
+                continue
+            key, value = _keyword(parameter)
+            if key in ["DSN", "DSNAME"]:
+                # an undefined &NAME in a data set name is a temporary data set
+                continue
+            for symbol in SYMBOL_REGEX.findall(_unquoted(parameter)):
+                if symbol not in defined and not symbol.startswith("SYS"):
+                    self._warning(
+                        line,
+                        "Symbol &{0} is not defined by a SET or PROC statement.".format(
+                            symbol
+                        ),
+                    )
+
+    def _end_job(self):
+        for line in self.open_ifs:
+            self._error(line, "The IF statement has no ENDIF.")
+        self.in_step = False
+        self.in_proc = False
+        self.open_ifs = []
+        self.step_names = set()
+        self.dd_names = set()
+        self.symbols = set()
+        self.proc_symbols = set()
+
+
+def _split_operand_field(text, in_quote=False):
+    """Separate the operands from the comments that follow them.
+
+    Arguments:
+        text {str} -- The text following the operation field.
+
+    Keyword Arguments:
+        in_quote {bool} -- Whether text starts inside a quoted string. (default: {False})
+
+    Returns:
+        str -- The operand field.
+        bool -- Whether a quoted string is still open at the end of text.
+    """
+    text = text.lstrip() if not in_quote else text
+    if not in_quote and "'" not in text:
+        return text.split(" ", 1)[0], False
+    for index, character in enumerate(text):
+        if character == "'":
+            in_quote = not in_quote
+        elif character == " " and not in_quote:
+            return text[:index], False
+    return text.rstrip() if not in_quote else text, in_quote
+
+
+def _split_parameters(operands):
+    """Split an operand field on the commas outside of quotes and parentheses.
+
+    Arguments:
+        operands {str} -- The operand field.
+
+    Returns:
+        Union[list[str], NoneType] -- The parameters, or None when the
+        parentheses are not balanced.
+    """
+    if not operands:
+        return []
+    if "'" not in operands and "(" not in operands and ")" not in operands:
+        return operands.split(",")
+    parameters = []
+    depth = 0
+    in_quote = False
+    current = ""
+    for character in operands:
+        if character == "'":
+            in_quote = not in_quote
+        elif not in_quote and character == "(":
+            depth += 1
+        elif not in_quote and character == ")":
+            depth -= 1
+            if depth < 0:
+                return None
+        elif not in_quote and depth == 0 and character == ",":
+            parameters.append(current)
+            current = ""
+            continue
+        current += character
+    if depth != 0:
+        return None
+    parameters.append(current)
+    return parameters
+
+
+def _keyword(parameter):
+    """Split a KEY=value parameter.
+
+    Returns:
+        tuple[Union[str, NoneType], str] -- The upper case key and the value,
+        or None and the parameter when it is positional.
+    """
+    if "=" not in parameter:
+        return None, parameter
+    unquoted = _unquoted(parameter)
+    if "=" not in unquoted or unquoted.startswith("("):
+        return None, parameter
+    key, value = parameter.split("=", 1)
+    return key.upper(), value
+
+
+def _unquoted(parameter):
+    return QUOTED_REGEX.sub("", parameter) if "'" in parameter else parameter
@@ -8,14 +8,76 @@ __metaclass__ = type
 from tempfile import NamedTemporaryFile
 from os import chmod, path, remove
 from stat import S_IEXEC, S_IREAD, S_IWRITE
+from time import sleep, time
 import json
 import re
 from ansible_collections.ibm.ibm_zos_core.plugins.module_utils.better_arg_parser import (
     BetterArgParser,
 )
 
+try:
+    from zoautil_py import Jobs
+except Exception:
+    Jobs = ""
+
+"""Fields printed for each job by SDSF_ST_REXX, in order"""
+SDSF_ST_COLUMNS = [
+    "job_id",
+    "job_name",
+    "owner",
+    "queue",
+    "class",
+    "position",
+    "system",
+    "ret_code",
+    "date_read",
+    "time_read",
+    "date_started",
+    "time_started",
+    "date_ended",
+    "time_ended",
+]
+
+SDSF_ST_REXX = """/* REXX */
+parse arg 'JOBID=' jobid ' OWNER=' owner ' JOBNAME=' jobname,
+  ' SORT=' sortby ' MAXROWS=' maxrows
+rc=isfcalls('ON')
+ISFDATE='YYYYMMDD -'
+ISFCOLS='JNAME JOBID OWNERID QUEUE JCLASS POS ESYSID RETCODE',
+'DATER TIMER DATEE TIMEE DATEN TIMEN'
+jobid = strip(jobid)
+if jobid <> '' then ISFFILTER='JOBID EQ '||jobid
+owner = strip(owner)
+if owner <> '' then ISFOWNER=owner
+jobname = strip(jobname)
+if jobname <> '' then ISFPREFIX=jobname
+sortby = strip(sortby)
+if sortby <> '' then ISFSORT=sortby
+Address SDSF "ISFEXEC ST (ALTERNATE DELAYED)"
+if rc<>0 then do
+  Say 'ERROR' rc isfmsg
+  rc=isfcalls('OFF')
+  Exit 8
+end
+Say 'ROWS|'isfrows
+maxrows = strip(maxrows)
+if maxrows = '' then maxrows = isfrows
+do ix=1 to min(isfrows, maxrows)
+  Say 'JOB|'JOBID.ix'|'JNAME.ix'|'OWNERID.ix'|'QUEUE.ix'|'JCLASS.ix'|',
+  ||POS.ix'|'ESYSID.ix'|'RETCODE.ix'|'DATER.ix'|'TIMER.ix'|',
+  ||DATEE.ix'|'TIMEE.ix'|'DATEN.ix'|'TIMEN.ix
+end
+rc=isfcalls('OFF')
+return 0
+"""
+
+"""Job statuses reported by Jobs.list once a job has left execution"""
+JOB_FINAL_STATUSES = ["CC", "ABEND", "JCLERR", "CANCELED", "SEC"]
 
-def job_output(module, job_id=None, owner=None, job_name=None, dd_name=None):
+
+def job_output(
+    module, job_id=None, owner=None, job_name=None, dd_name=None, retry_policy=None
+):
     """Get the output from a z/OS job based on various search criteria.
 
     Arguments:
@@ -26,6 +88,7 @@ def job_output(module, job_id=None, owner=None, job_name=None, dd_name=None):
         owner {str} -- The owner of the job (default: {''})
         job_name {str} -- The job name search for (default: {''})
         dd_name {str} -- The data definition to retrieve (default: {''})
+        retry_policy {RetryPolicy} -- Retries the listing, and while SDSF does not list job_id yet (default: {None})
 
     Raises:
         RuntimeError: When job output cannot be retrieved successfully but job exists.
@@ -52,17 +115,26 @@ def job_output(module, job_id=None, owner=None, job_name=None, dd_name=None):
     owner = parsed_args.get("owner") or ""
     ddname = parsed_args.get("ddname") or ""
 
-    job_detail_json = {}
-    rc, out, err = _get_job_json_str(module, job_id, owner, job_name, dd_name)
-    if rc != 0:
-        raise RuntimeError(
-            "Failed to retrieve job output. RC: {0} Error: {1}".format(
-                str(rc), str(err)
+    def list_jobs():
+        rc, out, err = _get_job_json_str(module, job_id, owner, job_name, dd_name)
+        if rc != 0:
+            raise RuntimeError(
+                "Failed to retrieve job output. RC: {0} Error: {1}".format(
+                    str(rc), str(err)
+                )
             )
+        if not out:
+            raise RuntimeError("Failed to retrieve job output. No job output found.")
+        return json.loads(out, strict=False)
+
+    if retry_policy and job_id:
+        job_detail_json = retry_policy.run(
+            list_jobs, retry_if=lambda jobs: not jobs.get("jobs")
         )
-    if not out:
-        raise RuntimeError("Failed to retrieve job output. No job output found.")
-    job_detail_json = json.loads(out, strict=False)
+    elif retry_policy:
+        job_detail_json = retry_policy.run(list_jobs)
+    else:
+        job_detail_json = list_jobs()
     for job in job_detail_json.get("jobs"):
         job["ret_code"] = {} if job.get("ret_code") is None else job.get("ret_code")
         job["ret_code"]["code"] = _get_return_code_num(
@@ -75,6 +147,266 @@ def job_output(module, job_id=None, owner=None, job_name=None, dd_name=None):
     return job_detail_json
 
 
+def job_complete(status):
+    """Determine if a Jobs.list status means the job has finished.
+
+    Arguments:
+        status {str} -- The status of the job as reported by Jobs.list (eg. "AC", "CC")
+
+    Returns:
+        bool -- If the job is no longer waiting or running.
+    """
+    status = (status or "").strip().upper()
+    for final_status in JOB_FINAL_STATUSES:
+        if status.startswith(final_status):
+            return True
+    return False
+
+
+def wait_for_jobs(job_ids, wait_time_s, polling_interval=1):
+    """Block until every job has finished or wait_time_s elapses.
+    Only jobs which have not finished yet are polled on each pass.
+
+    Arguments:
+        job_ids {list[str]} -- The job IDs to wait for.
+        wait_time_s {int} -- The maximum number of seconds to wait for all jobs.
+
+    Keyword Arguments:
+        polling_interval {int} -- Seconds between passes over the pending jobs. (default: {1})
+
+    Returns:
+        list[str] -- The job IDs which finished.
+        list[str] -- The job IDs still waiting or running when the time expired.
+        int -- The number of seconds waited.
+    """
+    start = time()
+    deadline = start + wait_time_s
+    pending = list(job_ids)
+    finished = []
+    while pending:
+        for job_id in list(pending):
+            try:
+                jobs = Jobs.list(job_id=job_id)
+            except IndexError:
+                # JES has not made the job visible yet, try again next pass
+                continue
+            if jobs and job_complete(jobs[0].get("status")):
+                pending.remove(job_id)
+                finished.append(job_id)
+        if not pending or time() + polling_interval > deadline:
+            break
+        sleep(polling_interval)
+    return finished, pending, int(round(time() - start))
+
+
+def job_status_class(status):
+    """Classify the status of a job as reported by Jobs.list or by the
+    SDSF RETCODE column.
+
+    Arguments:
+        status {str} -- The job status. (eg. "AC", "CC", "ABENDU0012", "JCL ERROR")
+
+    Returns:
+        str -- One of "active", "completed", "abended", "jcl_error",
+        "canceled" or "other".
+    """
+    status = (status or "").strip().upper()
+    if status.startswith("AC"):
+        return "active"
+    if status.startswith("CC"):
+        return "completed"
+    if status.startswith("ABEND"):
+        return "abended"
+    if status.replace(" ", "").startswith("JCLERR"):
+        return "jcl_error"
+    if status.startswith("CANCEL"):
+        return "canceled"
+    return "other"
+
+
+def status_ret_code(status, return_code):
+    """Build the ret_code of a job, in the format used by job_output, from
+    the status and return code reported by Jobs.list.
+
+    Arguments:
+        status {str} -- The job status. (eg. "CC", "ABEND", "AC")
+        return_code {str} -- The return code. (eg. "0000", "S0C4", "?")
+
+    Returns:
+        dict -- The msg, code, msg_code and msg_txt of the job.
+    """
+    status = (status or "").strip().upper()
+    return_code = (return_code or "").strip().upper()
+    msg = status
+    if return_code and return_code != "?" and return_code not in status:
+        msg = "{0} {1}".format(status, return_code)
+    return dict(
+        msg=msg,
+        code=_get_return_code_num(msg),
+        msg_code=_get_return_code_str(msg),
+        msg_txt="",
+    )
+
+
+def job_status(job_id):
+    """Get the status and return code of a job from Jobs.list without
+    reading its spool files.
+
+    Arguments:
+        job_id {str} -- The job ID.
+
+    Returns:
+        dict[str, list[dict]] -- The job in the format of job_output, with
+        an empty ddnames list. No jobs when JES does not know the job.
+    """
+    try:
+        listed = Jobs.list(job_id=job_id)
+    except IndexError:
+        listed = []
+    jobs = []
+    for job in listed:
+        jobs.append(
+            dict(
+                job_id=job.get("id"),
+                job_name=job.get("name"),
+                owner=job.get("owner"),
+                ret_code=status_ret_code(job.get("status"), job.get("return")),
+                ddnames=[],
+            )
+        )
+    return dict(jobs=jobs)
+
+
+def list_jobs_sdsf(module, job_id="", owner="", job_name=""):
+    """List jobs from the SDSF ST panel in a single pass, including the
+    columns Jobs.list does not report. The spool is not read.
+
+    Arguments:
+        module {AnsibleModule} -- The AnsibleModule object from the running module.
+
+    Keyword Arguments:
+        job_id {str} -- The job ID to search for (default: {''})
+        owner {str} -- The owner filter, may end with * (default: {''})
+        job_name {str} -- The job name filter, may end with * (default: {''})
+
+    Raises:
+        RuntimeError: When SDSF can not list the jobs.
+
+    Returns:
+        list[dict] -- One dict per job with the ST columns listed in SDSF_ST_COLUMNS.
+    """
+    return list_jobs_sdsf_page(module, job_id=job_id, owner=owner, job_name=job_name)[0]
+
+
+def list_jobs_sdsf_page(
+    module, job_id="", owner="", job_name="", sort="", max_rows=None
+):
+    """List jobs from the SDSF ST panel, sorted by SDSF and cut off after
+    max_rows, so only the rows wanted are written out and parsed.
+
+    Arguments:
+        module {AnsibleModule} -- The AnsibleModule object from the running module.
+
+    Keyword Arguments:
+        job_id {str} -- The job ID to search for (default: {''})
+        owner {str} -- The owner filter, may end with * (default: {''})
+        job_name {str} -- The job name filter, may end with * (default: {''})
+        sort {str} -- The ISFSORT columns and directions. (eg. "JNAME A JOBID A") (default: {''})
+        max_rows {int} -- The number of rows to return, all when None. (default: {None})
+
+    Raises:
+        RuntimeError: When SDSF can not list the jobs.
+
+    Returns:
+        list[dict] -- One dict per job with the ST columns listed in SDSF_ST_COLUMNS.
+        int -- The number of jobs SDSF listed before max_rows was applied.
+    """
+    tmp = NamedTemporaryFile(delete=True)
+    with open(tmp.name, "w") as f:
+        f.write(SDSF_ST_REXX)
+    chmod(tmp.name, S_IEXEC | S_IREAD | S_IWRITE)
+    args = [
+        "JOBID={0}".format(job_id or ""),
+        "OWNER={0}".format(owner or ""),
+        "JOBNAME={0}".format(job_name or ""),
+        "SORT={0}".format(sort or ""),
+        "MAXROWS={0}".format("" if max_rows is None else max_rows),
+    ]
+    rc, out, err = module.run_command([tmp.name, " ".join(args)])
+    if rc != 0:
+        raise RuntimeError(
+            "Failed to list jobs from SDSF. RC: {0} Error: {1}".format(
+                str(rc), (out + err).strip()
+            )
+        )
+    jobs = []
+    total = None
+    for line in out.splitlines():
+        if line.startswith("ROWS|") and line[5:].strip().isdigit():
+            total = int(line[5:].strip())
+        if not line.startswith("JOB|"):
+            continue
+        values = [value.strip() for value in line.split("|")[1:]]
+        if len(values) != len(SDSF_ST_COLUMNS):
+            continue
+        job = dict(zip(SDSF_ST_COLUMNS, values))
+        job["submitted"] = _sdsf_timestamp(job.pop("date_read"), job.pop("time_read"))
+        job["started"] = _sdsf_timestamp(
+            job.pop("date_started"), job.pop("time_started")
+        )
+        job["ended"] = _sdsf_timestamp(job.pop("date_ended"), job.pop("time_ended"))
+        position = job.get("position")
+        job["position"] = int(position) if position.isdigit() else None
+        jobs.append(job)
+    return jobs, total if total is not None else len(jobs)
+
+
+def _sdsf_timestamp(date, time_of_day):
+    """Combine an SDSF date (YYYY-MM-DD) and time (HH:MM:SS.hh) column.
+
+    Returns:
+        Union[str, NoneType] -- "YYYY-MM-DD HH:MM:SS", or None when the date is blank.
+    """
+    if not re.match(r"^[0-9]{4}-[0-9]{2}-[0-9]{2}$", date or ""):
+        return None
+    time_of_day = (time_of_day or "")[:8]
+    if not re.match(r"^[0-9]{2}:[0-9]{2}:[0-9]{2}$", time_of_day):
+        time_of_day = "00:00:00"
+    return "{0} {1}".format(date, time_of_day)
+
+
+def to_columnar(rows):
+    """Convert a list of dicts into one list per key, so that each key is
+    stored once instead of once per row. Nested dicts are converted the
+    same way; other values, including lists, are kept as they are.
+
+    Arguments:
+        rows {list[dict]} -- The rows to convert.
+
+    Returns:
+        dict[str, list] -- For each key, the value of every row in row
+        order. A row without the key contributes None. A key is only
+        nested when every row holds a dict or None for it.
+    """
+    keys = []
+    for row in rows:
+        for key in row:
+            if key not in keys:
+                keys.append(key)
+    columns = {}
+    for key in keys:
+        values = [row.get(key) for row in rows]
+        if any([isinstance(value, dict) for value in values]) and all(
+            [value is None or isinstance(value, dict) for value in values]
+        ):
+            columns[key] = to_columnar(
+                [value if value is not None else {} for value in values]
+            )
+        else:
+            columns[key] = values
+    return columns
+
+
 def _get_job_json_str(module, job_id="", owner="", job_name="", dd_name=""):
     """Generate JSON output string containing Job info from SDSF.
     Writes a temporary REXX script to the USS filesystem to gather output.
@@ -0,0 +1,102 @@
+# Copyright (c) IBM Corporation 2020
+# Apache License, Version 2.0 (see https://opensource.org/licenses/Apache-2.0)
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+from random import uniform
+from time import sleep, time
+
+
+class RetryPolicy(object):
+    def __init__(
+        self,
+        retry_on=(IndexError,),
+        base_delay_s=0.1,
+        max_delay_s=2.0,
+        deadline_s=10,
+        jitter=True,
+    ):
+        """Retry an operation that fails while z/OS catches up, such as
+        JES not yet listing a job that was just submitted. Delays grow
+        exponentially up to max_delay_s, are randomized when jitter is set
+        so that concurrent tasks do not poll in step, and stop once the next
+        delay would pass deadline_s. Counters accumulate over every call
+        made through the same policy.
+
+        Keyword Arguments:
+            retry_on {tuple[type]} -- Exceptions that cause a retry. (default: {(IndexError,)})
+            base_delay_s {float} -- The delay before the first retry. (default: {0.1})
+            max_delay_s {float} -- The longest delay between attempts. (default: {2.0})
+            deadline_s {float} -- The time limit for each call. (default: {10})
+            jitter {bool} -- Whether to randomize each delay. (default: {True})
+        """
+        self.retry_on = retry_on
+        self.base_delay_s = base_delay_s
+        self.max_delay_s = max_delay_s
+        self.deadline_s = deadline_s
+        self.jitter = jitter
+        self.attempts = 0
+        self.retries = 0
+        self.wait_s = 0.0
+
+    def run(self, operation, retry_if=None):
+        """Call operation until it succeeds or the deadline is reached.
+
+        Arguments:
+            operation {callable} -- Called without arguments.
+
+        Keyword Arguments:
+            retry_if {callable} -- Called with the result; a true value causes a retry. (default: {None})
+
+        Raises:
+            Exception: The last exception in retry_on, when the deadline is reached.
+
+        Returns:
+            object -- The result of the last call to operation.
+        """
+        start = time()
+        attempt = 0
+        while True:
+            attempt += 1
+            self.attempts += 1
+            error = None
+            try:
+                result = operation()
+                if retry_if is None or not retry_if(result):
+                    return result
+            except self.retry_on as e:
+                error = e
+            delay = self.delay(attempt)
+            if time() - start + delay > self.deadline_s:
+                if error is not None:
+                    raise error
+                return result
+            self.retries += 1
+            self.wait_s += delay
+            sleep(delay)
+
+    def delay(self, attempt):
+        """Compute the delay after a failed attempt.
+
+        Arguments:
+            attempt {int} -- The number of the attempt that failed, starting at 1.
+
+        Returns:
+            float -- The number of seconds to wait.
+        """
+        delay = min(self.max_delay_s, self.base_delay_s * (2 ** (attempt - 1)))
+        if self.jitter:
+            delay = uniform(delay / 2, delay)
+        return delay
+
+    def stats(self):
+        """Summarize the retries made through this policy.
+
+        Returns:
+            dict -- The attempts, retries and seconds spent waiting.
+        """
+        return dict(
+            attempts=self.attempts, retries=self.retries, wait_s=round(self.wait_s, 3)
+        )
@@ -0,0 +1,96 @@
+# Copyright (c) IBM Corporation 2020
+# Apache License, Version 2.0 (see https://opensource.org/licenses/Apache-2.0)
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+from os import fdopen, fsync, makedirs, path, remove, rename
+from tempfile import mkstemp
+import fcntl
+import json
+
+
+def read_state(state_path):
+    """Read a JSON state file kept on USS between module runs.
+
+    Arguments:
+        state_path {str} -- The path of the state file.
+
+    Raises:
+        StateFileError: When the file exists but does not hold a JSON object.
+
+    Returns:
+        dict -- The stored state, or an empty dict if the file does not exist.
+    """
+    state_path = path.expanduser(state_path)
+    if not path.isfile(state_path):
+        return {}
+    with open(state_path, "r") as state_file:
+        fcntl.flock(state_file, fcntl.LOCK_SH)
+        try:
+            return _load(state_file, state_path)
+        finally:
+            fcntl.flock(state_file, fcntl.LOCK_UN)
+
+
+def update_state(state_path, update):
+    """Read, change and write back a JSON state file while holding an
+    exclusive lock, so that concurrent module runs do not lose each
+    other's changes. The new contents are written to a temporary file
+    and renamed over the old one, so readers never see a partial file.
+
+    Arguments:
+        state_path {str} -- The path of the state file.
+        update {callable} -- Called with the current state dict; changes it in place.
+
+    Raises:
+        StateFileError: When the file exists but does not hold a JSON object.
+
+    Returns:
+        dict -- The state as written.
+    """
+    state_path = path.expanduser(state_path)
+    state_dir = path.dirname(path.abspath(state_path))
+    if not path.isdir(state_dir):
+        makedirs(state_dir)
+    with open(state_path + ".lock", "a") as lock_file:
+        fcntl.flock(lock_file, fcntl.LOCK_EX)
+        try:
+            state = {}
+            if path.isfile(state_path):
+                with open(state_path, "r") as state_file:
+                    state = _load(state_file, state_path)
+            update(state)
+            fd, temp_path = mkstemp(dir=state_dir)
+            try:
+                with fdopen(fd, "w") as temp_file:
+                    json.dump(state, temp_file, sort_keys=True)
+                    temp_file.flush()
+                    fsync(temp_file.fileno())
+                rename(temp_path, state_path)
+            except Exception:
+                remove(temp_path)
+                raise
+            return state
+        finally:
+            fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+
+def _load(state_file, state_path):
+    contents = state_file.read()
+    if not contents.strip():
+        return {}
+    try:
+        state = json.loads(contents)
+    except ValueError as e:
+        raise StateFileError(state_path, str(e))
+    if not isinstance(state, dict):
+        raise StateFileError(state_path, "Expected a JSON object.")
+    return state
+
+
+class StateFileError(Exception):
+    def __init__(self, state_path, message):
+        self.msg = "Unable to use state file {0}. {1}".format(state_path, message)
+        super(StateFileError, self).__init__(self.msg)
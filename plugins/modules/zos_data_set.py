@@ -46,8 +46,12 @@ options:
         create the data set, returns successful with I(changed=True).
       - >
         If I(state=present) and I(replace=True) and the data set is present on
-        the managed node, delete the data set and create the data set with the
-        desired attributes, returns successful with I(changed=True).
+        the managed node with different attributes, delete the data set and create
+        the data set with the desired attributes, returns successful with I(changed=True).
+      - >
+        If I(state=present) and I(replace=True) and the data set is present on
+        the managed node with the desired attributes, no action taken, returns
+        successful with I(changed=False).
       - >
         If I(state=present) and I(replace=False) and the data set is present
         on the managed node, no action taken, returns successful with I(changed=False).
@@ -141,13 +145,62 @@ options:
         attributes. This may lead to an inconsistent state if data set creations fails.
         after the old data set is deleted.
       - If I(replace=True), all data in the original data set will be lost.
+      - >
+        The data set is only replaced when its type, format or record length, or the
+        I(size) or I(data_class) when provided, differ from the desired ones. The size
+        matches when the space allocated to the data set is the size rounded up to
+        whole tracks or cylinders. Both sets of attributes are returned in I(diff).
     type: bool
     required: false
     default: false
     version_added: "2.9"
+  pattern:
+    description:
+      - >
+        A data set name pattern, used to perform the operation on every cataloged
+        data set whose name matches it. (e.g C(USER.TEST.**))
+      - >
+        C(*) matches zero or more characters within a qualifier, C(**) matches
+        zero or more qualifiers and C(%) matches a single character.
+      - >
+        The first qualifier can not contain wildcards. All the data sets under
+        the qualifiers before the first wildcard are listed with a single
+        IDCAMS C(LISTCAT LEVEL) run, and the matches are processed as a batch.
+      - I(pattern) is mutually exclusive with I(name) and I(batch), and can not be used with I(type=MEMBER).
+    type: str
+    required: false
+    version_added: "2.9"
+  parallel:
+    description:
+      - The maximum number of I(batch) entries processed at the same time.
+      - >
+        Entries for the same data set, or for members of the same data set, are
+        processed one after another in the order they appear in I(batch).
+        Entries for different data sets are processed concurrently.
+      - >
+        When I(parallel) is provided, every entry is processed even if another
+        entry fails, and the outcome of each entry is returned in I(results).
+        An entry is not processed if an earlier entry for the same data set failed.
+      - I(parallel) also applies to the data sets matching I(pattern).
+      - When I(parallel) is not provided, the entries are processed one at a time.
+    type: int
+    required: false
+    version_added: "2.9"
   batch:
     description:
       - Batch can be used to perform operations on multiple data sets in a single module call.
+      - All data sets in the batch are looked up in the catalog with a single IDCAMS run.
+      - >
+        Entries with I(state=cataloged) or I(state=uncataloged) whose data set is not
+        used by any other entry are processed together, with one IEHPROGM run for
+        non-VSAM data sets and one IDCAMS run for VSAM data sets. A failure is reported
+        for each data set that could not be processed, after the others are done.
+      - >
+        Entries with I(type=MEMBER) whose member is not used by any other entry, and
+        whose data set is not used by any entry without I(type=MEMBER), are processed
+        together. The directory of each data set is read once, members are deleted
+        with one IDCAMS run and created with one copy per data set. A failure is
+        reported for each member that could not be processed, after the others are done.
     type: list
     elements: dict
     required: false
@@ -174,8 +227,12 @@ options:
             create the data set, returns successful with I(changed=True).
           - >
             If I(state=present) and I(replace=True) and the data set is present on
-            the managed node, delete the data set and create the data set with the
-            desired attributes, returns successful with I(changed=True).
+            the managed node with different attributes, delete the data set and create
+            the data set with the desired attributes, returns successful with I(changed=True).
+          - >
+            If I(state=present) and I(replace=True) and the data set is present on
+            the managed node with the desired attributes, no action taken, returns
+            successful with I(changed=False).
           - >
             If I(state=present) and I(replace=False) and the data set is present
             on the managed node, no action taken, returns successful with I(changed=False).
@@ -267,6 +324,11 @@ options:
             the same name and desired attributes. This may lead to an inconsistent state if data set creations fails
             after the old data set is deleted.
           - If I(replace=True), all data in the original data set will be lost.
+          - >
+            The data set is only replaced when its type, format or record length, or the
+            I(size) or I(data_class) when provided, differ from the desired ones. The size
+            matches when the space allocated to the data set is the size rounded up to
+            whole tracks or cylinders. Both sets of attributes are returned in I(diff).
         type: bool
         required: false
         default: false
@@ -362,6 +424,24 @@ EXAMPLES = r"""
       - name: user.private.libs2(member2)
         type: MEMBER
 
+- name: Create many data sets, allocating up to 8 of them at the same time
+  zos_data_set:
+    parallel: 8
+    batch:
+      - name: user.private.libs1
+        type: pds
+      - name: user.private.libs1(member1)
+        type: MEMBER
+      - name: user.private.libs2
+        type: seq
+      - name: user.private.libs3
+        type: seq
+
+- name: Delete every data set under USER.TEST whose third qualifier starts with APP
+  zos_data_set:
+    pattern: user.test.app*.**
+    state: absent
+
 - name: Catalog a data set present on volume 222222 if it is uncataloged.
   zos_data_set:
     name: user.private.libs
@@ -391,17 +471,114 @@ changed:
   description: Indicates if any changes were made during module operation.
   type: bool
   returned: On success
+diff:
+  description:
+    - The current and desired attributes of each existing data set considered
+      for replacement with I(replace=True), in the order they were provided.
+  type: list
+  elements: dict
+  returned: When an existing data set is considered for replacement
+  contains:
+    before:
+      description: The type, format and record length of the existing data set.
+      type: dict
+    after:
+      description: The desired attributes of the data set.
+      type: dict
+  sample:
+    - before_header: USER.PRIVATE.LIBS
+      after_header: USER.PRIVATE.LIBS
+      before:
+        type: PDS
+        format: FB
+        record_length: 80
+      after:
+        type: PDS
+        format: FB
+        record_length: 80
+data_sets:
+  description: The names of the data sets that matched I(pattern).
+  type: list
+  elements: str
+  returned: When I(pattern) is provided
+  sample:
+    - USER.TEST.APP1.LOAD
+    - USER.TEST.APP1.SRC
+plan:
+  description:
+    - The operations that would be performed for each entry, in the order they
+      were provided, computed in check mode without changing any data set.
+    - The catalog is read with a single IDCAMS run, and the table of contents of
+      a volume is only read for data sets that are not cataloged when I(volume) is provided.
+  type: list
+  elements: dict
+  returned: In check mode
+  contains:
+    name:
+      description: The name of the data set.
+      type: str
+    state:
+      description: The desired state of the data set.
+      type: str
+    actions:
+      description:
+        - The operations that would be performed, in order, empty when the data set
+          is already in the desired state.
+        - Each operation is one of C(catalog), C(uncatalog), C(create), C(replace) or C(delete).
+      type: list
+      elements: str
+  sample:
+    - name: USER.PRIVATE.LIBS
+      state: absent
+      actions:
+        - catalog
+        - delete
+results:
+  description: The outcome of each entry, in the order they were provided.
+  type: list
+  elements: dict
+  returned: When I(parallel) is provided
+  contains:
+    name:
+      description: The name of the data set.
+      type: str
+    state:
+      description: The desired state of the data set.
+      type: str
+    changed:
+      description: Whether the entry changed the data set.
+      type: bool
+    failed:
+      description: Whether the entry failed or was not processed.
+      type: bool
+    msg:
+      description: The error, when the entry failed or was not processed.
+      type: str
+  sample:
+    - name: USER.PRIVATE.LIBS1
+      state: present
+      changed: true
+      failed: false
+      msg: ""
 """
 
 import tempfile
+from os import path
+from shutil import rmtree
 from math import ceil
-from collections import OrderedDict
+from threading import RLock
+from concurrent.futures import ThreadPoolExecutor
+from collections import Counter, OrderedDict
 from ansible_collections.ibm.ibm_zos_core.plugins.module_utils.vtoc import (
     VolumeTableOfContents,
 )
+from ansible_collections.ibm.ibm_zos_core.plugins.module_utils.data_set_utils import (
+    DataSetUtils,
+    MVSCmdExecError,
+)
 
 try:
-    from zoautil_py import Datasets, types, MVSCmd
+    from zoautil_py import Datasets
 except Exception:
     Datasets = ""
 import re
@@ -427,6 +604,16 @@ DATA_SET_FORMATS = [
     "U",
 ]
 
+# 3390 geometry, used to compare allocated space with a requested size
+TRACK_BYTES = 56664
+
+TRACKS_PER_CYLINDER = 15
+
+# Attributes Datasets.create() uses when they are not provided
+DEFAULT_DATA_SET_TYPE = "SEQ"
+
+DEFAULT_DATA_SET_FORMAT = "FB"
+
 DEFAULT_RECORD_LENGTHS = {
     "FB": 80,
     "FBA": 80,
@@ -470,10 +657,26 @@ NON_VSAM_UNCATALOG_COMMAND = " UNCATLG DSNAME={0}"
 
 VSAM_UNCATALOG_COMMAND = " DELETE '{0}' NOSCRATCH"
 
+MEMBER_DELETE_COMMAND = " DELETE '{0}'"
+
+LISTCAT_ENTRY_COMMAND = " LISTCAT ENTRIES('{0}')"
+
+LISTCAT_LEVEL_COMMAND = " LISTCAT LEVEL('{0}')"
+
+VSAM_DATA_SET_TYPES = ["KSDS", "ESDS", "RRDS", "LDS"]
+
+# VSAM cluster types tried in turn when recataloging a VSAM data set
+# that has no INDEX component in the VTOC, "" is the IDCAMS default
+NON_INDEXED_VSAM_CATALOG_TYPES = ["NONINDEXED", "NUMBERED", "LINEAR", ""]
+
+VSAM_CATALOG_NEXT_TYPE = " IF LASTCC > 0 THEN -\n"
+
+VSAM_CATALOG_RESET_MAXCC = " IF LASTCC = 0 THEN SET MAXCC = 0\n"
+
 # ------------- Functions to validate arguments ------------- #
 
 
-def get_individual_data_set_parameters(params):
+def get_individual_data_set_parameters(params, pattern_matches=None):
     """Builds a list of data set parameters
     to be used in future operations.
 
@@ -481,27 +684,36 @@ def get_individual_data_set_parameters(params):
         params {dict} -- The parameters from
         Ansible's AnsibleModule object module.params.
 
+    Keyword Arguments:
+        pattern_matches {list[str]} -- The names of the data sets matching
+        the top-level parameter "pattern". (default: {None})
+
     Raises:
-        ValueError: Raised if top-level parameters "name"
-        and "batch" are both provided.
-        ValueError: Raised if neither top-level parameters "name"
-        or "batch" are provided.
+        ValueError: Raised if more than one of the top-level parameters
+        "name", "batch" and "pattern" are provided.
+        ValueError: Raised if none of the top-level parameters "name",
+        "batch" or "pattern" are provided.
 
     Returns:
         [list] -- A list of dicts where each list item
         represents one data set. Each dictionary holds the parameters
         (passed to the zos_data_set module) for the data set which it represents.
     """
-    if params.get("name") and params.get("batch"):
+    provided = [option for option in ["name", "batch", "pattern"] if params.get(option)]
+    if len(provided) > 1:
         raise ValueError(
-            'Top-level parameters "name" and "batch" are mutually exclusive.'
+            'Top-level parameters "name", "batch" and "pattern" are mutually exclusive.'
         )
-    elif not params.get("name") and not params.get("batch"):
+    elif not provided:
         raise ValueError(
-            'One of the following parameters is required: "name", "batch".'
+            'One of the following parameters is required: "name", "batch", "pattern".'
         )
     if params.get("name"):
         data_sets_parameter_list = [params]
+    elif params.get("pattern"):
+        data_sets_parameter_list = [
+            dict(params, name=name) for name in pattern_matches or []
+        ]
     else:
         data_sets_parameter_list = params.get("batch")
     return data_sets_parameter_list
@@ -713,6 +925,218 @@ def volume(arg_val, params, original_params):
     return arg_val.upper()
 
 
+def list_catalog_entries(module, names):
+    """Look up data sets in the catalog with a single IDCAMS run,
+    one LISTCAT command per data set.
+
+    Arguments:
+        module {AnsibleModule} -- The AnsibleModule object created in the module.
+        names {list[str]} -- The data set names, without member names.
+
+    Returns:
+        dict -- For each data set name found in the IDCAMS output, a dict
+        with "cataloged" and "vsam" set to whether the data set is cataloged
+        and whether it is a VSAM cluster.
+    """
+    names = list(OrderedDict.fromkeys([name.upper() for name in names]))
+    if not names:
+        return {}
+    stdin = "\n".join([LISTCAT_ENTRY_COMMAND.format(name) for name in names])
+    rc, stdout, stderr = module.run_command(
+        "mvscmdauth --pgm=idcams --sysprint=* --sysin=stdin", data=stdin
+    )
+    # IDCAMS echoes each command before its output, split the output there
+    sections = re.split(
+        r"^\S?\s*LISTCAT ENTRIES\('([^']+)'\)[ ]*$", stdout, flags=re.MULTILINE
+    )
+    entries = {}
+    for name, output in zip(sections[1::2], sections[2::2]):
+        escaped_name = re.escape(name)
+        entries[name] = dict(
+            cataloged=bool(re.search(r"-\s" + escaped_name + r"\s*\n\s+IN-CAT", output)),
+            vsam=bool(
+                re.search(
+                    r"^0CLUSTER[ ]+-+[ ]+" + escaped_name + r"[ ]*$",
+                    output,
+                    re.MULTILINE,
+                )
+            ),
+        )
+    return entries
+
+
+def data_set_pattern_regex(pattern):
+    """Translate a data set name pattern to a regular expression.
+    "*" matches zero or more characters within a qualifier, "**" matches
+    zero or more qualifiers and "%" matches a single character.
+
+    Arguments:
+        pattern {str} -- The data set name pattern.
+
+    Raises:
+        ValueError: When the pattern is not a valid data set name pattern,
+        or its first qualifier contains wildcards.
+
+    Returns:
+        str -- The regular expression matching the data set names.
+    """
+    qualifiers = pattern.upper().split(".")
+    if (
+        len(qualifiers) > 22
+        or not re.fullmatch(r"[A-Z$#@][A-Z0-9$#@-]{0,7}", qualifiers[0])
+        or not all(
+            [
+                qualifier == "**"
+                or re.fullmatch(r"[A-Z$#@*%][A-Z0-9$#@*%-]{0,7}", qualifier)
+                for qualifier in qualifiers
+            ]
+        )
+    ):
+        raise ValueError(
+            "Value {0} is invalid for pattern argument. pattern must be a data set name "
+            "whose first qualifier has no wildcards.".format(pattern)
+        )
+    regex = re.escape(qualifiers[0])
+    for qualifier in qualifiers[1:]:
+        if qualifier == "**":
+            regex += r"(?:\.[A-Z0-9$#@-]+)*"
+        else:
+            regex += r"\." + "".join(
+                [
+                    {"*": "[A-Z0-9$#@-]*", "%": "[A-Z0-9$#@-]"}.get(
+                        char, re.escape(char)
+                    )
+                    for char in qualifier
+                ]
+            )
+    return regex
+
+
+def list_data_sets_matching(module, pattern):
+    """Find the cataloged data sets whose names match a pattern with a
+    single IDCAMS run, listing every entry under the qualifiers that
+    precede the first wildcard.
+
+    Arguments:
+        module {AnsibleModule} -- The AnsibleModule object created in the module.
+        pattern {str} -- The data set name pattern.
+
+    Raises:
+        DatasetPatternError: When the catalog can not be listed.
+
+    Returns:
+        OrderedDict -- For each matching data set, in catalog order, a dict
+        with "cataloged" and "vsam" as returned by list_catalog_entries.
+    """
+    regex = data_set_pattern_regex(pattern)
+    level = []
+    for qualifier in pattern.upper().split("."):
+        if re.search(r"[*%]", qualifier):
+            break
+        level.append(qualifier)
+    rc, stdout, stderr = module.run_command(
+        "mvscmdauth --pgm=idcams --sysprint=* --sysin=stdin",
+        data=LISTCAT_LEVEL_COMMAND.format(".".join(level)),
+    )
+    # no entry under the level is condition code 4
+    if rc > 4:
+        raise DatasetPatternError(pattern, rc)
+    entries = OrderedDict()
+    for entry_type, name in re.findall(
+        r"^\S?(NONVSAM|CLUSTER)[ ]+-+[ ]+(\S+)[ ]*$", stdout, re.MULTILINE
+    ):
+        if re.fullmatch(regex, name):
+            entries[name] = dict(cataloged=True, vsam=entry_type == "CLUSTER")
+    return entries
+
+
+def idcams_condition_codes(output):
+    """Split the condition code of each command out of IDCAMS SYSPRINT.
+
+    Arguments:
+        output {str} -- The SYSPRINT of an IDCAMS run.
+
+    Returns:
+        list[int] -- The condition code of each command, in order.
+    """
+    return [
+        int(code)
+        for code in re.findall(
+            r"(?:HIGHEST CONDITION CODE WAS|FUNCTION TERMINATED\. CONDITION CODE IS)\s+(\d+)",
+            output,
+        )
+    ]
+
+
+def iehprogm_results(output, names):
+    """Find out which IEHPROGM commands ended normally. IEHPROGM echoes
+    each control statement, followed by the messages about it.
+
+    Arguments:
+        output {str} -- The SYSPRINT of an IEHPROGM run.
+        names {list[str]} -- The DSNAME of each command, in order.
+
+    Returns:
+        list[bool] -- Whether each command ended normally.
+    """
+    positions = []
+    start = 0
+    for name in names:
+        match = re.search(r"DSNAME=" + re.escape(name) + r"(?![A-Z0-9.$#@])", output[start:])
+        if match is None:
+            positions.append(None)
+            continue
+        start += match.end()
+        positions.append(start)
+    results = []
+    for index, position in enumerate(positions):
+        if position is None:
+            results.append(False)
+            continue
+        following = [p for p in positions[index + 1:] if p is not None]
+        section = output[position:following[0] if following else len(output)]
+        results.append(
+            re.search(r"(?<!AB)NORMAL END OF TASK RETURNED", section) is not None
+        )
+    return results
+
+
+def size_in_tracks(size):
+    """Convert a size validated by data_set_size to 3390 tracks.
+
+    Arguments:
+        size {str} -- The size, a number followed by K, M or G.
+
+    Returns:
+        int -- The number of tracks needed to hold the size.
+    """
+    match = re.fullmatch(r"([0-9]+)(K|M|G)", size.upper())
+    if not match:
+        return None
+    size_in_bytes = int(match.group(1)) * {"K": 1024, "M": 1024 ** 2, "G": 1024 ** 3}.get(
+        match.group(2)
+    )
+    return int(ceil(size_in_bytes / float(TRACK_BYTES)))
+
+
+def tracks_match(current, requested):
+    """Check an allocated size against a requested one, allowing for the
+    allocation being rounded up to whole cylinders, and for the track
+    gained when data_set_size rounds a TRK or CYL size up to kilobytes.
+
+    Arguments:
+        current {int} -- The allocated tracks, None when unknown.
+        requested {int} -- The requested tracks.
+
+    Returns:
+        bool -- If the allocation matches the request.
+    """
+    if current is None or requested is None:
+        return False
+    cylinders = int(ceil(requested / float(TRACKS_PER_CYLINDER)))
+    return requested - 1 <= current <= cylinders * TRACKS_PER_CYLINDER
+
+
 def convert_size_to_kilobytes(old_size, old_size_unit):
     """Convert unsupported size unit to KB.
     Assumes 3390 disk type."""
@@ -728,15 +1152,190 @@ def convert_size_to_kilobytes(old_size, old_size_unit):
     return new_size
 
 
-class DataSetHandler(object):
+class DataSetStateCache(object):
     def __init__(self, module):
+        """Remembers what one module run learned about the catalog and
+        volume tables of contents, so each data set is looked up in the
+        catalog and each volume is read at most once. The handlers of a
+        module run share one cache and update it as they change data sets
+        and members, possibly from several threads.
+
+        Arguments:
+            module {AnsibleModule} -- The AnsibleModule object created in the module.
+        """
+        self.module = module
+        self.catalog = {}
+        self.volumes = {}
+        self.members = {}
+        self.lock = RLock()
+
+    def load_catalog(self, names):
+        """Look up in the catalog, with a single IDCAMS run, the data sets
+        that were not looked up yet. IDCAMS runs without holding the lock;
+        an entry recorded by another thread meanwhile is kept.
+
+        Arguments:
+            names {list[str]} -- The data set names, without member names.
+        """
+        with self.lock:
+            names = [name.upper() for name in names if name.upper() not in self.catalog]
+        if not names:
+            return
+        entries = list_catalog_entries(self.module, names)
+        with self.lock:
+            for name in names:
+                self.catalog.setdefault(
+                    name, entries.get(name, dict(cataloged=False, vsam=False))
+                )
+
+    def catalog_entry(self, name):
+        """Look up a data set in the catalog, unless it was already
+        looked up during this module run.
+
+        Arguments:
+            name {str} -- The data set name.
+
+        Returns:
+            dict -- Whether the data set is cataloged and whether it is VSAM.
+        """
+        self.load_catalog([name])
+        with self.lock:
+            return self.catalog.get(name.upper(), {})
+
+    def set_catalog_entry(self, name, cataloged, vsam=None):
+        """Record a change made to the catalog.
+
+        Arguments:
+            name {str} -- The data set name.
+            cataloged {bool} -- Whether the data set is now cataloged.
+
+        Keyword Arguments:
+            vsam {bool} -- Whether the data set is VSAM, unchanged if None. (default: {None})
+        """
+        with self.lock:
+            entry = self.catalog.setdefault(
+                name.upper(), dict(cataloged=False, vsam=False)
+            )
+            entry["cataloged"] = cataloged
+            if vsam is not None:
+                entry["vsam"] = vsam
+
+    def volume_data_sets(self, volume):
+        """Read the volume table of contents of a volume, unless it was
+        already read during this module run.
+
+        Arguments:
+            volume {str} -- The volume to read the table of contents of.
+
+        Returns:
+            list[dict] -- The data sets in the table of contents.
+        """
+        volume = volume.upper()
+        with self.lock:
+            if volume in self.volumes:
+                return self.volumes.get(volume)
+        vtoc = VolumeTableOfContents(self.module)
+        data_sets = vtoc.get_volume_entry(volume) or []
+        with self.lock:
+            return self.volumes.setdefault(volume, data_sets)
+
+    def data_set_members(self, name, refresh=False):
+        """Read the directory of a partitioned data set, unless it was
+        already read during this module run.
+
+        Arguments:
+            name {str} -- The partitioned data set name.
+
+        Keyword Arguments:
+            refresh {bool} -- Whether to read the directory again. (default: {False})
+
+        Returns:
+            list[str] -- The member names.
+        """
+        name = name.upper()
+        with self.lock:
+            if not refresh and name in self.members:
+                return self.members.get(name)
+        members = DataSetUtils.list_members(self.module, name)
+        with self.lock:
+            if refresh:
+                self.members[name] = members
+            return self.members.setdefault(name, members)
+
+    def set_members(self, name, members, exist):
+        """Record that members of a partitioned data set were created or deleted.
+
+        Arguments:
+            name {str} -- The partitioned data set name.
+            members {list[str]} -- The member names.
+            exist {bool} -- Whether the members now exist.
+        """
+        name = name.upper()
+        with self.lock:
+            if name not in self.members:
+                return
+            self.members[name] = [
+                member for member in self.members.get(name) if member not in members
+            ]
+            if exist:
+                self.members[name].extend(members)
+
+    def data_set_created(self, name, vsam, planned=False):
+        """Record that a data set was created, with an empty directory.
+        The volume it was allocated on is not known, so every volume read
+        so far is read again when needed.
+
+        Arguments:
+            name {str} -- The data set name.
+            vsam {bool} -- Whether the data set is VSAM.
+
+        Keyword Arguments:
+            planned {bool} -- Whether the data set was only planned in check
+            mode, so the volumes are unchanged. (default: {False})
+        """
+        with self.lock:
+            self.set_catalog_entry(name, True, vsam)
+            if not planned:
+                self.volumes = {}
+            self.members[name.upper()] = []
+
+    def data_set_deleted(self, name):
+        """Record that a data set was deleted, removing it and the
+        components of a VSAM cluster of the same name from the volumes
+        read so far.
+
+        Arguments:
+            name {str} -- The data set name.
+        """
+        name = name.upper()
+        deleted = [name, name + ".DATA", name + ".INDEX"]
+        with self.lock:
+            self.set_catalog_entry(name, False, False)
+            self.members.pop(name, None)
+            for volume, data_sets in self.volumes.items():
+                self.volumes[volume] = [
+                    data_set
+                    for data_set in data_sets
+                    if data_set.get("data_set_name") not in deleted
+                ]
+
+
+class DataSetHandler(object):
+    def __init__(self, module, cache=None):
         """Handles various data set operations.
 
         Arguments:
             module {AnsibleModule} -- The AnsibleModule object created in the module.
+
+        Keyword Arguments:
+            cache {DataSetStateCache} -- The catalog and volume state of data
+            sets, shared by the handlers of one module run and kept current
+            by their operations. (default: {None})
         """
 
         self.module = module
+        self.cache = cache if cache is not None else DataSetStateCache(module)
+        self.diffs = []
 
     def perform_data_set_operations(self, name, state, **extra_args):
         """ Calls functions to perform desired operations on
@@ -756,6 +1355,228 @@ class DataSetHandler(object):
             changed = self._ensure_data_set_uncataloged(name)
         return changed
 
+    def plan_data_set_operations(self, name, state, **extra_args):
+        """Determine the operations perform_data_set_operations would make,
+        without making them. The shared catalog state is updated as if they
+        were made, so later entries for the same data set are planned on top.
+
+        Arguments:
+            name {str} -- The name of the data set.
+            state {str} -- The desired state of the data set.
+
+        Raises:
+            DatasetCatalogError: When the data set would not be found to catalog.
+
+        Returns:
+            list[str] -- The operations, in order. Empty if no changes would be made.
+        """
+        actions = []
+        if extra_args.get("type") == "MEMBER":
+            exists = self._data_set_member_exists(name)
+            base_dsname, member = name.rstrip(")").split("(")
+            if state == "present" and not exists:
+                actions.append("create")
+                self.cache.set_members(base_dsname, [member], True)
+            elif state == "present" and extra_args.get("replace"):
+                actions.append("replace")
+            elif state == "absent" and exists:
+                actions.append("delete")
+                self.cache.set_members(base_dsname, [member], False)
+            return actions
+        volume = extra_args.get("volume")
+        cataloged = self._data_set_cataloged(name)
+        if state == "uncataloged":
+            if cataloged:
+                actions.append("uncatalog")
+                self.cache.set_catalog_entry(name, False)
+            return actions
+        if not cataloged and volume is not None and self._is_in_vtoc(name, volume):
+            actions.append("catalog")
+            self.cache.set_catalog_entry(name, True)
+            cataloged = True
+        if state == "cataloged" and not cataloged:
+            raise DatasetCatalogError(
+                name, volume, "-1", "Data set was not found. Unable to catalog."
+            )
+        elif state == "absent" and cataloged:
+            actions.append("delete")
+            self.cache.data_set_deleted(name)
+        elif state == "present" and not cataloged:
+            actions.append("create")
+            self.cache.data_set_created(
+                name,
+                str(extra_args.get("type")).upper() in VSAM_DATA_SET_TYPES,
+                planned=True,
+            )
+        elif (
+            state == "present"
+            and extra_args.get("replace")
+            and not self._data_set_attributes_match(name, extra_args)
+        ):
+            actions.append("replace")
+            self.cache.data_set_created(
+                name,
+                str(extra_args.get("type")).upper() in VSAM_DATA_SET_TYPES,
+                planned=True,
+            )
+        return actions
+
+    def perform_catalog_operations(self, data_sets):
+        """Catalog and uncatalog many data sets with one run of each
+        utility program, rather than one run per data set.
+
+        Arguments:
+            data_sets {list[dict]} -- The parameters of each data set, with
+            state cataloged or uncataloged.
+
+        Raises:
+            DatasetBatchCatalogError: When any of the operations fail. The
+            other operations are still performed.
+
+        Returns:
+            bool -- If changes were made.
+        """
+        to_catalog = []
+        to_uncatalog = []
+        for data_set in data_sets:
+            name = data_set.get("name")
+            cataloged = self._data_set_cataloged(name)
+            if data_set.get("state") == "cataloged" and not cataloged:
+                to_catalog.append((name, data_set.get("volume")))
+            elif data_set.get("state") == "uncataloged" and cataloged:
+                to_uncatalog.append(name)
+
+        vsam_catalog = []
+        non_vsam_commands = []
+        non_vsam_names = []
+        for name, volume in to_catalog:
+            if self._is_data_set_vsam(name, volume):
+                vsam_catalog.append((name, volume))
+            else:
+                non_vsam_commands.append(
+                    self._build_non_vsam_catalog_command(name, volume)
+                )
+                non_vsam_names.append(name)
+        vsam_uncatalog = []
+        for name in to_uncatalog:
+            if self._is_data_set_vsam(name):
+                vsam_uncatalog.append(name)
+            else:
+                non_vsam_commands.append(NON_VSAM_UNCATALOG_COMMAND.format(name))
+                non_vsam_names.append(name)
+
+        failures = []
+        changed = False
+        if non_vsam_commands:
+            rc, stdout = self._run_utility("iehprogm", "\n".join(non_vsam_commands))
+            results = iehprogm_results(stdout, non_vsam_names)
+            for name, normal_end in zip(non_vsam_names, results):
+                if not normal_end:
+                    failures.append((name, rc))
+                    continue
+                changed = True
+                self.cache.set_catalog_entry(name, name not in to_uncatalog, False)
+        if vsam_uncatalog:
+            rc, stdout = self._run_utility(
+                "idcams",
+                "\n".join(
+                    [VSAM_UNCATALOG_COMMAND.format(name) for name in vsam_uncatalog]
+                ),
+            )
+            codes = idcams_condition_codes(stdout)
+            for index, name in enumerate(vsam_uncatalog):
+                code = codes[index] if index < len(codes) else rc
+                if code != 0:
+                    failures.append((name, code))
+                    continue
+                changed = True
+                self.cache.set_catalog_entry(name, False)
+        # the cluster types of each data set are chained as in
+        # _catalog_vsam_data_set, so the whole batch is one IDCAMS run
+        vsam_catalog = [
+            (name, volume, self._vsam_catalog_types(name, volume))
+            for name, volume in vsam_catalog
+        ]
+        if vsam_catalog:
+            rc, stdout = self._run_utility(
+                "idcams",
+                "".join(
+                    [
+                        VSAM_CATALOG_NEXT_TYPE.join(
+                            [
+                                self._build_vsam_catalog_command(
+                                    name, volume, data_set_type
+                                )
+                                for data_set_type in data_set_types
+                            ]
+                        )
+                        for name, volume, data_set_types in vsam_catalog
+                    ]
+                ),
+            )
+            # a DEFINE skipped by IF LASTCC prints no condition code, so the
+            # codes of each data set end at its first successful type
+            codes = idcams_condition_codes(stdout)
+            for name, volume, data_set_types in vsam_catalog:
+                code = rc if rc != 0 else -1
+                for _ in data_set_types:
+                    if not codes:
+                        break
+                    code = codes.pop(0)
+                    if code == 0:
+                        break
+                if code != 0:
+                    failures.append((name, code))
+                    continue
+                changed = True
+                self.cache.set_catalog_entry(name, True, True)
+        if failures:
+            raise DatasetBatchCatalogError(failures)
+        return changed
+
+    def perform_member_operations(self, data_sets):
+        """Create and delete many members of partitioned data sets, reading
+        the directory of each data set once. Members are deleted with one
+        IDCAMS run, and created with one copy per data set.
+
+        Arguments:
+            data_sets {list[dict]} -- The parameters of each member, with
+            type MEMBER.
+
+        Returns:
+            list[bool] -- Whether each member was changed.
+            list[tuple] -- The name and return code of each member that
+            could not be created or deleted.
+        """
+        to_create = OrderedDict()
+        to_delete = []
+        changes = []
+        for data_set in data_sets:
+            name = data_set.get("name")
+            exists = self._data_set_member_exists(name)
+            base_dsname, member = name.rstrip(")").split("(")
+            if data_set.get("state") == "absent" and exists:
+                to_delete.append(name)
+            elif data_set.get("state") == "present" and (
+                not exists or data_set.get("replace")
+            ):
+                to_create.setdefault(base_dsname, []).append(member)
+            else:
+                changes.append(False)
+                continue
+            changes.append(True)
+        failures = []
+        if to_delete:
+            failures.extend(self._delete_data_set_members(to_delete))
+        for base_dsname, members in to_create.items():
+            failures.extend(self._create_data_set_members(base_dsname, members))
+        failed = [name for name, rc in failures]
+        changes = [
+            changed and data_set.get("name") not in failed
+            for changed, data_set in zip(changes, data_sets)
+        ]
+        return changes, failures
+
     def _ensure_data_set_present(self, name, replace, **extra_args):
         """Creates data set if it does not already exist.
 
@@ -771,13 +1592,145 @@ class DataSetHandler(object):
             name, extra_args.get("volume")
         )
         if present:
-            if not replace:
+            if not replace or self._data_set_attributes_match(name, extra_args):
                 return changed
             self._replace_data_set(name, ds_create_args)
         else:
             self._create_data_set(name, ds_create_args)
         return True
 
+    def _data_set_attributes_match(self, name, extra_args):
+        """Compare the attributes of an existing data set with the requested
+        attributes, and record both for the module diff.
+
+        Arguments:
+            name {str} -- The name of the existing data set.
+            extra_args {dict} -- The requested data set attributes.
+
+        Returns:
+            bool -- If the data set already has the requested attributes.
+        """
+        requested = self._requested_attributes(extra_args)
+        current = self._current_attributes(name, "size" in requested)
+        current = dict([(option, current.get(option)) for option in requested])
+        self.diffs.append(
+            dict(before_header=name, after_header=name, before=current, after=requested)
+        )
+        for option, value in requested.items():
+            if option == "size":
+                if not tracks_match(current.get(option), value):
+                    return False
+            elif current.get(option) != value:
+                return False
+        return True
+
+    def _requested_attributes(self, extra_args):
+        """Determine the attributes a data set created with the
+        provided arguments would have.
+
+        Arguments:
+            extra_args {dict} -- The requested data set attributes.
+
+        Returns:
+            dict -- The type, and for non-VSAM data sets the format and record
+            length, plus the record length of a VSAM data set, the size in
+            tracks and the data class when provided.
+        """
+        data_set_type = extra_args.get("type") or DEFAULT_DATA_SET_TYPE
+        attributes = dict(type=data_set_type)
+        if data_set_type not in VSAM_DATA_SET_TYPES:
+            data_set_format = extra_args.get("format") or DEFAULT_DATA_SET_FORMAT
+            attributes["format"] = data_set_format
+            attributes["record_length"] = extra_args.get(
+                "record_length"
+            ) or DEFAULT_RECORD_LENGTHS.get(data_set_format)
+        elif extra_args.get("record_length"):
+            attributes["record_length"] = extra_args.get("record_length")
+        if extra_args.get("size"):
+            attributes["size"] = size_in_tracks(extra_args.get("size"))
+        if extra_args.get("data_class"):
+            attributes["data_class"] = extra_args.get("data_class").upper()
+        return attributes
+
+    def _current_attributes(self, name, with_size=False):
+        """Read the attributes of an existing data set with LISTDS and LISTCAT.
+        The space of a non-VSAM data set is not in the catalog, so it is
+        read from the volume table of contents.
+
+        Arguments:
+            name {str} -- The name of the data set.
+
+        Keyword Arguments:
+            with_size {bool} -- Whether to read the allocated space. (default: {False})
+
+        Returns:
+            dict -- The type, format, record length, data class and, when
+            asked for, the size in tracks. An attribute is None when it can
+            not be determined.
+        """
+        data_set = DataSetUtils(self.module, name)
+        organization = data_set.get_data_set_type()
+        if organization == "VSAM":
+            data_set_type = data_set.get_vsam_type()
+        elif organization == "PS":
+            data_set_type = "SEQ"
+        elif organization == "PO":
+            data_set_type = {"LIBRARY": "PDSE", "PDS": "PDS"}.get(
+                data_set.get_data_set_dsntype()
+            )
+        else:
+            data_set_type = organization
+        record_length = data_set.get_data_set_lrecl()
+        if record_length is not None and re.fullmatch(r"[0-9]+", record_length):
+            record_length = int(record_length)
+        attributes = dict(
+            type=data_set_type,
+            format=data_set.get_data_set_recfm(),
+            record_length=record_length,
+            data_class=data_set.get_data_set_data_class(),
+        )
+        if with_size and organization == "VSAM":
+            allocation = data_set.get_vsam_allocation() or {}
+            attributes["size"] = {"TRACK": 1, "CYLINDER": TRACKS_PER_CYLINDER}.get(
+                allocation.get("space_type")
+            )
+            if attributes.get("size") is not None:
+                attributes["size"] *= allocation.get("primary")
+        elif with_size and data_set.get_data_set_volume():
+            attributes["size"] = self._allocated_tracks(
+                name, data_set.get_data_set_volume()
+            )
+        return attributes
+
+    def _allocated_tracks(self, name, volume):
+        """Count the tracks in the extents of a data set on a volume.
+
+        Arguments:
+            name {str} -- The name of the data set.
+            volume {str} -- The volume the data set resides on.
+
+        Returns:
+            int -- The number of tracks, or None when the data set is not
+            in the volume table of contents.
+        """
+        data_set = VolumeTableOfContents.find_data_set_in_volume_output(
+            name, self.cache.volume_data_sets(volume)
+        )
+        if not data_set or not data_set.get("extents"):
+            return None
+        tracks = 0
+        for extent in data_set.get("extents"):
+            low = extent.get("low")
+            high = extent.get("high")
+            tracks += (
+                int(high.get("cylinder")) * TRACKS_PER_CYLINDER
+                + int(high.get("track"))
+                - int(low.get("cylinder")) * TRACKS_PER_CYLINDER
+                - int(low.get("track"))
+                + 1
+            )
+        return tracks
+
     def _ensure_data_set_absent(self, name, **extra_args):
         """Deletes provided data set if it exists.
 
@@ -868,13 +1821,7 @@ class DataSetHandler(object):
         Returns:
             bool -- If data is is cataloged.
         """
-        stdin = " LISTCAT ENTRIES('{0}')".format(name)
-        rc, stdout, stderr = self.module.run_command(
-            "mvscmdauth --pgm=idcams --sysprint=* --sysin=stdin", data=stdin
-        )
-        if re.search(r"-\s" + name + r"\s*\n\s+IN-CAT", stdout):
-            return True
-        return False
+        return self.cache.catalog_entry(name).get("cataloged", False)
 
     def _data_set_exists(self, name, volume=None):
         """Determine if a data set exists.
@@ -903,10 +1850,13 @@ class DataSetHandler(object):
         Returns:
             bool -- If data set member exists.
         """
-        rc, stdout, stderr = self.module.run_command("head \"//'{0}'\"".format(name))
-        if rc != 0 or (stderr and "EDC5067I" in stderr):
+        base_dsname, member = name.rstrip(")").split("(")
+        if not self._data_set_cataloged(base_dsname):
+            return False
+        try:
+            return member.upper() in self.cache.data_set_members(base_dsname)
+        except MVSCmdExecError:
             return False
-        return True
 
     def _attempt_catalog_if_necessary(self, name, volume):
         """Attempts to catalog a data set if not already cataloged.
@@ -944,8 +1894,7 @@ class DataSetHandler(object):
         Returns:
             bool -- If data set was found in table of contents for volume.
         """
-        vtoc = VolumeTableOfContents(self.module)
-        data_sets = vtoc.get_volume_entry(volume)
+        data_sets = self.cache.volume_data_sets(volume)
         data_set = VolumeTableOfContents.find_data_set_in_volume_output(name, data_sets)
         if data_set is not None:
             return True
@@ -1001,6 +1950,9 @@ class DataSetHandler(object):
         rc = Datasets.create(name, **extra_args)
         if rc > 0:
             raise DatasetCreateError(name, rc)
+        self.cache.data_set_created(
+            name, str(extra_args.get("type")).upper() in VSAM_DATA_SET_TYPES
+        )
         return
 
     def _delete_data_set(self, name):
@@ -1016,6 +1968,7 @@ class DataSetHandler(object):
         rc = Datasets.delete(name)
         if rc > 0:
             raise DatasetDeleteError(name, rc)
+        self.cache.data_set_deleted(name)
         return
 
     def _create_data_set_member(self, name):
@@ -1038,6 +1991,7 @@ class DataSetHandler(object):
         )
         if rc != 0:
             raise DatasetMemberCreateError(name, rc)
+        self.cache.set_members(base_dsname, [name.rstrip(")").split("(")[1].upper()], True)
         return
 
     def _delete_data_set_member(self, name):
@@ -1053,8 +2007,68 @@ class DataSetHandler(object):
         rc = Datasets.delete_members(name)
         if rc > 0:
             raise DatasetMemberDeleteError(name, rc)
+        base_dsname, member = name.rstrip(")").split("(")
+        self.cache.set_members(base_dsname, [member.upper()], False)
         return
 
+    def _create_data_set_members(self, name, members):
+        """Create empty members of a partitioned data set with a single
+        copy, then read its directory once to find the members created.
+        Existing members are overwritten.
+
+        Arguments:
+            name {str} -- The partitioned data set name.
+            members {list[str]} -- The member names.
+
+        Returns:
+            list[tuple] -- The name, including member name, and return code
+            of each member that was not created.
+        """
+        if not self._data_set_cataloged(name):
+            return [("{0}({1})".format(name, member), -1) for member in members]
+        tmp_dir = tempfile.mkdtemp()
+        try:
+            files = []
+            for member in members:
+                files.append(path.join(tmp_dir, member))
+                open(files[-1], "w").close()
+            rc, stdout, stderr = self.module.run_command(
+                ["cp"] + files + ["//'{0}'".format(name)]
+            )
+        finally:
+            rmtree(tmp_dir, ignore_errors=True)
+        directory = self.cache.data_set_members(name, refresh=True)
+        return [
+            ("{0}({1})".format(name, member), rc if rc != 0 else -1)
+            for member in members
+            if member not in directory
+        ]
+
+    def _delete_data_set_members(self, names):
+        """Delete members of one or more partitioned data sets
+        with a single IDCAMS run.
+
+        Arguments:
+            names {list[str]} -- The data set names, including member names.
+
+        Returns:
+            list[tuple] -- The name and condition code of each member that was not deleted.
+        """
+        rc, stdout = self._run_utility(
+            "idcams",
+            "\n".join([MEMBER_DELETE_COMMAND.format(name) for name in names]),
+        )
+        codes = idcams_condition_codes(stdout)
+        failures = []
+        for index, name in enumerate(names):
+            code = codes[index] if index < len(codes) else rc
+            if code != 0:
+                failures.append((name, code))
+                continue
+            base_dsname, member = name.rstrip(")").split("(")
+            self.cache.set_members(base_dsname, [member], False)
+        return failures
+
     def _catalog_data_set(self, name, volume):
         """Catalog an uncataloged data set
 
@@ -1078,20 +2092,10 @@ class DataSetHandler(object):
             DatasetCatalogError: When attempt at catalog fails.
         """
         iehprogm_input = self._build_non_vsam_catalog_command(name, volume)
-        try:
-            temp_data_set_name = self._create_temp_data_set(name.split(".")[0])
-            self._write_data_set(temp_data_set_name, iehprogm_input)
-            rc, stdout, stderr = self.module.run_command(
-                "mvscmdauth --pgm=iehprogm --sysprint=* --sysin={0}".format(
-                    temp_data_set_name
-                )
-            )
-            if rc != 0 or "NORMAL END OF TASK RETURNED" not in stdout:
-                raise DatasetCatalogError(name, volume, rc)
-        except Exception:
-            raise
-        finally:
-            Datasets.delete(temp_data_set_name)
+        rc, stdout = self._run_utility("iehprogm", iehprogm_input)
+        if rc != 0 or "NORMAL END OF TASK RETURNED" not in stdout:
+            raise DatasetCatalogError(name, volume, rc)
+        self.cache.set_catalog_entry(name, True, False)
         return
 
     def _catalog_vsam_data_set(self, name, volume):
@@ -1104,44 +2108,44 @@ class DataSetHandler(object):
         Raises:
             DatasetCatalogError: When attempt at catalog fails.
         """
-        data_set_name = name.upper()
-        data_set_volume = volume.upper()
-        success = False
-        try:
-            temp_data_set_name = self._create_temp_data_set(name.split(".")[0])
-            command_rc = 0
-            for data_set_type in ["", "LINEAR", "INDEXED", "NONINDEXED", "NUMBERED"]:
-                if data_set_type != "INDEXED":
-                    command = VSAM_CATALOG_COMMAND_NOT_INDEXED.format(
-                        data_set_name, data_set_volume, data_set_type
-                    )
-                else:
-                    command = VSAM_CATALOG_COMMAND_INDEXED.format(
-                        data_set_name, data_set_volume, data_set_type
-                    )
-
-                self._write_data_set(temp_data_set_name, command)
-                dd_statements = []
-                dd_statements.append(
-                    types.DDStatement(ddName="sysin", dataset=temp_data_set_name)
-                )
-                dd_statements.append(types.DDStatement(ddName="sysprint", dataset="*"))
-                command_rc = MVSCmd.execute_authorized(
-                    pgm="idcams", args="", dds=dd_statements
-                )
-                if command_rc == 0:
-                    success = True
-                    break
-            if not success:
-                raise DatasetCatalogError(
-                    name, volume, command_rc, "Attempt to catalog VSAM data set failed."
-                )
-        except Exception:
-            raise
-        finally:
-            Datasets.delete(temp_data_set_name)
+        # each DEFINE only runs if the previous one failed, so all possible
+        # cluster types are tried in a single IDCAMS run
+        commands = [
+            self._build_vsam_catalog_command(name, volume, data_set_type)
+            for data_set_type in self._vsam_catalog_types(name, volume)
+        ]
+        idcams_input = (
+            commands[0]
+            + "".join([VSAM_CATALOG_NEXT_TYPE + command for command in commands[1:]])
+            + VSAM_CATALOG_RESET_MAXCC
+        )
+        command_rc, stdout = self._run_utility("idcams", idcams_input)
+        if command_rc != 0:
+            raise DatasetCatalogError(
+                name, volume, command_rc, "Attempt to catalog VSAM data set failed."
+            )
+        self.cache.set_catalog_entry(name, True, True)
         return
 
+    def _vsam_catalog_types(self, name, volume):
+        """Determine the cluster types a VSAM data set may have from
+        its components in the volume table of contents.
+
+        Arguments:
+            name {str} -- The name of the VSAM cluster.
+            volume {str} -- The volume the data set resides on.
+
+        Returns:
+            list[str] -- The cluster types to try, most likely first.
+        """
+        data_sets = self.cache.volume_data_sets(volume)
+        index = VolumeTableOfContents.find_data_set_in_volume_output(
+            name + ".INDEX", data_sets
+        )
+        if index is not None:
+            return ["INDEXED"]
+        return NON_INDEXED_VSAM_CATALOG_TYPES
+
     def _uncatalog_data_set(self, name):
         """Uncatalog a data set.
 
@@ -1164,20 +2168,10 @@ class DataSetHandler(object):
             DatasetUncatalogError: When uncataloging fails.
         """
         iehprogm_input = NON_VSAM_UNCATALOG_COMMAND.format(name)
-        try:
-            temp_data_set_name = self._create_temp_data_set(name.split(".")[0])
-            self._write_data_set(temp_data_set_name, iehprogm_input)
-            rc, stdout, stderr = self.module.run_command(
-                "mvscmdauth --pgm=iehprogm --sysprint=* --sysin={0}".format(
-                    temp_data_set_name
-                )
-            )
-            if rc != 0 or "NORMAL END OF TASK RETURNED" not in stdout:
-                raise DatasetUncatalogError(name, rc)
-        except Exception:
-            raise
-        finally:
-            Datasets.delete(temp_data_set_name)
+        rc, stdout = self._run_utility("iehprogm", iehprogm_input)
+        if rc != 0 or "NORMAL END OF TASK RETURNED" not in stdout:
+            raise DatasetUncatalogError(name, rc)
+        self.cache.set_catalog_entry(name, False)
         return
 
     def _uncatalog_vsam_data_set(self, name):
@@ -1190,21 +2184,10 @@ class DataSetHandler(object):
             DatasetUncatalogError: When uncataloging fails.
         """
         idcams_input = VSAM_UNCATALOG_COMMAND.format(name)
-        try:
-            temp_data_set_name = self._create_temp_data_set(name.split(".")[0])
-            self._write_data_set(temp_data_set_name, idcams_input)
-            dd_statements = []
-            dd_statements.append(
-                types.DDStatement(ddName="sysin", dataset=temp_data_set_name)
-            )
-            dd_statements.append(types.DDStatement(ddName="sysprint", dataset="*"))
-            rc = MVSCmd.execute_authorized(pgm="idcams", args="", dds=dd_statements)
-            if rc != 0:
-                raise DatasetUncatalogError(name, rc)
-        except Exception:
-            raise
-        finally:
-            Datasets.delete(temp_data_set_name)
+        rc, stdout = self._run_utility("idcams", idcams_input)
+        if rc != 0:
+            raise DatasetUncatalogError(name, rc)
+        self.cache.set_catalog_entry(name, False)
         return
 
     def _is_data_set_vsam(self, name, volume=None):
@@ -1236,8 +2219,7 @@ class DataSetHandler(object):
         Returns:
             bool -- If the data set is VSAM.
         """
-        vtoc = VolumeTableOfContents(self.module)
-        data_sets = vtoc.get_volume_entry(volume)
+        data_sets = self.cache.volume_data_sets(volume)
         vsam_name = name + ".DATA"
         data_set = VolumeTableOfContents.find_data_set_in_volume_output(
             vsam_name, data_sets
@@ -1260,50 +2242,43 @@ class DataSetHandler(object):
         Returns:
             bool -- If the data set is VSAM.
         """
-        stdin = " LISTCAT ENTRIES('{0}')".format(name)
-        rc, stdout, stderr = self.module.run_command(
-            "mvscmdauth --pgm=idcams --sysprint=* --sysin=stdin", data=stdin
-        )
-        if re.search(r"^0CLUSTER[ ]+-+[ ]+" + name + r"[ ]*$", stdout, re.MULTILINE):
-            return True
-        return False
+        return self.cache.catalog_entry(name).get("vsam", False)
 
-    def _create_temp_data_set(self, hlq):
-        """Create a temporary data set.
+    def _run_utility(self, pgm, sysin):
+        """Run a utility program with its control statements passed
+        on stdin, so no SYSIN data set has to be allocated and written.
 
         Arguments:
-            hlq {str} -- The HLQ to use for the temporary data set's name.
+            pgm {str} -- The utility program, either idcams or iehprogm.
+            sysin {str} -- The control statements.
 
         Returns:
-            str -- The name of the temporary data set.
+            int -- The return code of the utility program.
+            str -- The SYSPRINT of the utility program.
         """
-        temp_data_set_name = Datasets.temp_name(hlq)
-        self._create_data_set(
-            temp_data_set_name,
-            {"type": "SEQ", "size": "5M", "format": "FB", "length": 80},
+        rc, stdout, stderr = self.module.run_command(
+            "mvscmdauth --pgm={0} --sysprint=* --sysin=stdin".format(pgm), data=sysin
         )
-        return temp_data_set_name
+        return rc, stdout
 
-    def _write_data_set(self, name, contents):
-        """Write text to a data set.
+    def _build_vsam_catalog_command(self, name, volume, data_set_type):
+        """Build the IDCAMS command to recatalog a VSAM data set.
 
         Arguments:
-            name {str} -- The name of the data set.
-            contents {str} -- The text to write to the data set.
+            name {str} -- The data set to catalog.
+            volume {str} -- The volume the data set resides on.
+            data_set_type {str} -- The cluster type, e.g. INDEXED, or "" for the IDCAMS default.
 
-        Raises:
-            DatasetWriteError: When write to the data set fails.
+        Returns:
+            str -- The command string formatted for use with IDCAMS.
         """
-        # rc = Datasets.write(name, contents)
-        temp = tempfile.NamedTemporaryFile(delete=False)
-        with open(temp.name, "w") as f:
-            f.write(contents)
-        rc, stdout, stderr = self.module.run_command(
-            "cp -O u {0} \"//'{1}'\"".format(temp.name, name)
+        if data_set_type != "INDEXED":
+            return VSAM_CATALOG_COMMAND_NOT_INDEXED.format(
+                name.upper(), volume.upper(), data_set_type
+            )
+        return VSAM_CATALOG_COMMAND_INDEXED.format(
+            name.upper(), volume.upper(), data_set_type
         )
-        if rc != 0:
-            raise DatasetWriteError(name, rc, stderr)
-        return
 
     def _build_non_vsam_catalog_command(self, name, volume):
         """Build the command string to use
@@ -1325,6 +2300,119 @@ class DataSetHandler(object):
         return command_part_1 + "\n" + command_part_2
 
 
+def perform_parallel_operations(
+    module, cache, data_set_param_list, in_catalog_operations, in_member_operations, parallel
+):
+    """Process batch entries on a bounded pool of worker threads.
+    Entries for the same data set, or its members, are processed one
+    after another in their original order by the same worker.
+
+    Arguments:
+        module {AnsibleModule} -- The AnsibleModule object created in the module.
+        cache {DataSetStateCache} -- The catalog and volume state shared by the handlers.
+        data_set_param_list {list[dict]} -- The parameters of each entry.
+        in_catalog_operations {list[bool]} -- Whether each entry is cataloged or
+        uncataloged together with the others selected, before the pool starts.
+        in_member_operations {list[bool]} -- Whether each entry is a member created
+        or deleted together with the others selected, before the pool starts.
+        parallel {int} -- The maximum number of entries processed at the same time.
+
+    Returns:
+        list[dict] -- The outcome of each entry, in the original order.
+        list[dict] -- The attribute comparisons made for replaced data sets, in the original order.
+    """
+    diffs = [[] for parameters in data_set_param_list]
+    results = [
+        dict(
+            name=parameters.get("name"),
+            state=parameters.get("state"),
+            changed=False,
+            failed=False,
+            msg="",
+        )
+        for parameters in data_set_param_list
+    ]
+    catalog_indexes = [
+        index for index, selected in enumerate(in_catalog_operations) if selected
+    ]
+    if catalog_indexes:
+        names = [results[index].get("name") for index in catalog_indexes]
+        was_cataloged = [
+            cache.catalog_entry(name).get("cataloged", False) for name in names
+        ]
+        failures = {}
+        try:
+            DataSetHandler(module, cache).perform_catalog_operations(
+                [data_set_param_list[index] for index in catalog_indexes]
+            )
+        except DatasetBatchCatalogError as e:
+            failures = dict(e.failures)
+        for index, name, cataloged in zip(catalog_indexes, names, was_cataloged):
+            if name in failures:
+                results[index].update(
+                    failed=True,
+                    msg=repr(DatasetBatchCatalogError([(name, failures.get(name))])),
+                )
+            else:
+                results[index]["changed"] = (
+                    cache.catalog_entry(name).get("cataloged", False) != cataloged
+                )
+    member_indexes = [
+        index for index, selected in enumerate(in_member_operations) if selected
+    ]
+    if member_indexes:
+        changes, failures = DataSetHandler(module, cache).perform_member_operations(
+            [data_set_param_list[index] for index in member_indexes]
+        )
+        failures = dict(failures)
+        for index, changed in zip(member_indexes, changes):
+            name = results[index].get("name")
+            results[index]["changed"] = changed
+            if name in failures:
+                results[index].update(
+                    failed=True,
+                    msg=repr(DatasetBatchMemberError([(name, failures.get(name))])),
+                )
+
+    groups = OrderedDict()
+    for index, selected in enumerate(in_catalog_operations):
+        if not selected and not in_member_operations[index]:
+            name = data_set_param_list[index].get("name").split("(")[0]
+            groups.setdefault(name, []).append(index)
+
+    def perform_group_operations(indexes):
+        data_set_handler = DataSetHandler(module, cache)
+        failed = None
+        for index in indexes:
+            if failed is not None:
+                results[index].update(
+                    failed=True,
+                    msg="Not processed because the entry for {0} failed.".format(failed),
+                )
+                continue
+            try:
+                results[index]["changed"] = data_set_handler.perform_data_set_operations(
+                    **data_set_param_list[index]
+                )
+            except Exception as e:
+                results[index].update(failed=True, msg=repr(e))
+                failed = results[index].get("name")
+            diffs[index] = data_set_handler.diffs
+            data_set_handler.diffs = []
+
+    executor = ThreadPoolExecutor(max_workers=parallel)
+    try:
+        futures = [
+            executor.submit(perform_group_operations, indexes)
+            for indexes in groups.values()
+        ]
+        for future in futures:
+            future.result()
+    finally:
+        executor.shutdown(wait=True)
+    return results, [diff for entry_diffs in diffs for diff in entry_diffs]
+
+
 # TODO: Add back safe data set replacement when issues are resolved
 # TODO: switch argument parsing over to BetterArgParser
 
@@ -1362,6 +2450,8 @@ def run_module():
                 # )
             ),
         ),
+        parallel=dict(type="int", required=False),
+        pattern=dict(type="str", required=False),
         # For individual data set args
         name=dict(type="str"),
         state=dict(
@@ -1392,10 +2482,8 @@ def run_module():
 
     module = AnsibleModule(argument_spec=module_args, supports_check_mode=True)
 
-    if module.check_mode:
-        if module.params.get("replace"):
-            result["changed"] = True
-        return result
+    if module.params.get("parallel") is not None and module.params.get("parallel") < 1:
+        module.fail_json(msg="The option parallel must be greater than 0.", **result)
 
     parameter_handlers = OrderedDict()
     parameter_handlers["type"] = data_set_type
@@ -1408,14 +2496,136 @@ def run_module():
     parameter_handlers["volume"] = volume
 
     try:
-        data_set_param_list = get_individual_data_set_parameters(module.params)
-
-        for data_set_params in data_set_param_list:
-            parameters = process_special_parameters(data_set_params, parameter_handlers)
-            data_set_handler = DataSetHandler(module)
-            result["changed"] = data_set_handler.perform_data_set_operations(
-                **parameters
-            ) or result.get("changed", False)
+        # the handlers share what they learn about the catalog and volumes
+        cache = DataSetStateCache(module)
+        pattern_matches = None
+        if module.params.get("pattern"):
+            if str(module.params.get("type")).upper() == "MEMBER":
+                raise ValueError("pattern can not be used with type MEMBER.")
+            matches = list_data_sets_matching(module, module.params.get("pattern"))
+            for name, entry in matches.items():
+                cache.set_catalog_entry(name, entry.get("cataloged"), entry.get("vsam"))
+            pattern_matches = list(matches)
+            result["data_sets"] = pattern_matches
+
+        data_set_param_list = [
+            process_special_parameters(data_set_params, parameter_handlers)
+            for data_set_params in get_individual_data_set_parameters(
+                module.params, pattern_matches
+            )
+        ]
+        # look up every other data set of the batch in the catalog with one IDCAMS run
+        cache.load_catalog(
+            [parameters.get("name").split("(")[0] for parameters in data_set_param_list]
+        )
+
+        # catalog and uncatalog data sets no other entry refers to in one
+        # run of each utility program
+        name_counts = Counter(
+            [parameters.get("name").split("(")[0] for parameters in data_set_param_list]
+        )
+        in_catalog_operations = [
+            parameters.get("state") in ["cataloged", "uncataloged"]
+            and name_counts[parameters.get("name")] == 1
+            for parameters in data_set_param_list
+        ]
+        if in_catalog_operations.count(True) < 2:
+            in_catalog_operations = [False] * len(in_catalog_operations)
+
+        # create and delete members no other entry refers to, of data sets
+        # no other entry creates or deletes, reading each directory once
+        member_counts = Counter(
+            [
+                parameters.get("name")
+                for parameters in data_set_param_list
+                if parameters.get("type") == "MEMBER"
+            ]
+        )
+        data_set_names = [
+            parameters.get("name")
+            for parameters in data_set_param_list
+            if parameters.get("type") != "MEMBER"
+        ]
+        in_member_operations = [
+            parameters.get("type") == "MEMBER"
+            and member_counts[parameters.get("name")] == 1
+            and parameters.get("name").split("(")[0] not in data_set_names
+            for parameters in data_set_param_list
+        ]
+        if in_member_operations.count(True) < 2:
+            in_member_operations = [False] * len(in_member_operations)
+
+        if module.check_mode:
+            data_set_handler = DataSetHandler(module, cache)
+            result["plan"] = []
+            for parameters in data_set_param_list:
+                actions = data_set_handler.plan_data_set_operations(**parameters)
+                result["plan"].append(
+                    dict(
+                        name=parameters.get("name"),
+                        state=parameters.get("state"),
+                        actions=actions,
+                    )
+                )
+                result["changed"] = bool(actions) or result.get("changed")
+            if data_set_handler.diffs:
+                result["diff"] = data_set_handler.diffs
+        elif module.params.get("parallel"):
+            result["results"], diffs = perform_parallel_operations(
+                module,
+                cache,
+                data_set_param_list,
+                in_catalog_operations,
+                in_member_operations,
+                module.params.get("parallel"),
+            )
+            result["changed"] = any(
+                [entry.get("changed") for entry in result.get("results")]
+            )
+            if diffs:
+                result["diff"] = diffs
+            failed = [
+                entry.get("name") for entry in result.get("results") if entry.get("failed")
+            ]
+            if failed:
+                raise DatasetBatchError(failed)
+        else:
+            catalog_operations = [
+                parameters
+                for parameters, selected in zip(data_set_param_list, in_catalog_operations)
+                if selected
+            ]
+            member_operations = [
+                parameters
+                for parameters, selected in zip(data_set_param_list, in_member_operations)
+                if selected
+            ]
+            data_set_param_list = [
+                parameters
+                for parameters, in_catalog, in_member in zip(
+                    data_set_param_list, in_catalog_operations, in_member_operations
+                )
+                if not in_catalog and not in_member
+            ]
+            if catalog_operations:
+                result["changed"] = DataSetHandler(
+                    module, cache
+                ).perform_catalog_operations(catalog_operations)
+            if member_operations:
+                changes, failures = DataSetHandler(
+                    module, cache
+                ).perform_member_operations(member_operations)
+                result["changed"] = any(changes) or result.get("changed")
+                if failures:
+                    raise DatasetBatchMemberError(failures)
+
+            for parameters in data_set_param_list:
+                data_set_handler = DataSetHandler(module, cache)
+                result["changed"] = data_set_handler.perform_data_set_operations(
+                    **parameters
+                ) or result.get("changed", False)
+                if data_set_handler.diffs:
+                    result.setdefault("diff", []).extend(data_set_handler.diffs)
     except Error as e:
         module.fail_json(msg=repr(e), **result)
     except Exception as e:
@@ -1488,12 +2698,42 @@ class DatasetUncatalogError(Error):
         super(DatasetUncatalogError, self).__init__(self.msg)
 
 
-class DatasetWriteError(Error):
-    def __init__(self, data_set, rc, message=""):
-        self.msg = 'An error occurred during write of data set "{0}". RC={1}. {2}'.format(
-            data_set, rc, message
+class DatasetBatchCatalogError(Error):
+    def __init__(self, failures):
+        self.failures = failures
+        self.msg = "An error occurred during catalog or uncatalog of data sets: {0}".format(
+            "; ".join(
+                ['"{0}" RC={1}'.format(data_set, rc) for data_set, rc in failures]
+            )
+        )
+        super(DatasetBatchCatalogError, self).__init__(self.msg)
+
+
+class DatasetBatchMemberError(Error):
+    def __init__(self, failures):
+        self.failures = failures
+        self.msg = "An error occurred during creation or deletion of data set members: {0}".format(
+            "; ".join(
+                ['"{0}" RC={1}'.format(data_set, rc) for data_set, rc in failures]
+            )
+        )
+        super(DatasetBatchMemberError, self).__init__(self.msg)
+
+
+class DatasetPatternError(Error):
+    def __init__(self, pattern, rc):
+        self.msg = 'An error occurred while listing data sets matching "{0}". RC={1}'.format(
+            pattern, rc
+        )
+        super(DatasetPatternError, self).__init__(self.msg)
+
+
+class DatasetBatchError(Error):
+    def __init__(self, data_sets):
+        self.msg = "An error occurred during operations on data sets: {0}. See results for details.".format(
+            ", ".join(data_sets)
         )
-        super(DatasetWriteError, self).__init__(self.msg)
+        super(DatasetBatchError, self).__init__(self.msg)
 
 
 def main():
@@ -0,0 +1,243 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+# Copyright (c) IBM Corporation 2020
+# Apache License, Version 2.0 (see https://opensource.org/licenses/Apache-2.0)
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+ANSIBLE_METADATA = {
+    "metadata_version": "1.1",
+    "status": ["preview"],
+    "supported_by": "community",
+}
+
+DOCUMENTATION = r"""
+---
+module: zos_job_harvest
+short_description: Wait for submitted jobs and collect their results
+description:
+  - Wait for a list of jobs previously submitted with M(zos_job_submit)
+    using I(wait=false), then collect their results.
+  - All jobs are waited on together with a single time limit, so one task
+    can gate on a whole stream of jobs instead of holding a fork per job.
+  - Jobs are identified by the C(handles) returned by M(zos_job_submit) or
+    by plain job IDs.
+version_added: "2.9"
+author: "Xiao Yuan Ma (@bjmaxy)"
+options:
+  handles:
+    description:
+      - The jobs to wait for.
+      - Each item is either a handle returned by M(zos_job_submit) or a job
+        ID. (e.g "JOB00134")
+    type: list
+    elements: raw
+    required: true
+  wait_time_s:
+    description:
+      - The maximum number of seconds to wait for all of the jobs to finish.
+    type: int
+    required: false
+    default: 60
+  max_rc:
+    description:
+      - Specifies the maximum return code allowed for every job without
+        failing the module.
+      - Jobs that are still running when I(wait_time_s) expires have no
+        return code and fail the module when I(max_rc) is set.
+    type: int
+    required: false
+  return_output:
+    description:
+      - Whether to print the DD output.
+      - If false, an empty list will be returned in ddnames field and the
+        spool is not read, only the status and return code of each job are
+        queried.
+    type: bool
+    required: false
+    default: true
+"""
+
+EXAMPLES = r"""
+- name: Submit jobs without waiting for them
+  zos_job_submit:
+    src: "{{ item }}"
+    location: DATA_SET
+    wait: false
+  loop:
+    - TEST.JCL(STEP1)
+    - TEST.JCL(STEP2)
+  register: submitted
+
+- name: Wait up to ten minutes for all of them and check the return codes
+  zos_job_harvest:
+    handles: "{{ submitted.results | map(attribute='handles') | flatten }}"
+    wait_time_s: 600
+    max_rc: 4
+    return_output: false
+
+- name: Wait for jobs by job ID
+  zos_job_harvest:
+    handles:
+      - JOB00134
+      - JOB00135
+"""
+
+RETURN = r"""
+jobs:
+  description:
+     List of jobs output, in the same format as M(zos_job_output).
+     With I(return_output=false) each job holds only I(job_id),
+     I(job_name), I(owner), I(ret_code) and an empty I(ddnames).
+  returned: success
+  type: list
+  elements: dict
+  sample:
+    [
+      {
+        "class": "R",
+        "content_type": "JOB",
+        "ddnames": [],
+        "job_id": "JOB00134",
+        "job_name": "HELLO",
+        "owner": "OMVSADM",
+        "ret_code": {
+          "code": 0,
+          "msg": "CC 0000",
+          "msg_code": "0000",
+          "msg_txt": ""
+        },
+        "subsystem": "STL1"
+      }
+    ]
+pending:
+  description:
+     Job IDs still waiting or running when I(wait_time_s) expired.
+  returned: success
+  type: list
+  elements: str
+  sample: ["JOB00135"]
+duration:
+  description: The number of seconds spent waiting for the jobs.
+  returned: success
+  type: int
+  sample: 12
+changed:
+  description: Indicates if any changes were made during module operation.
+  returned: always
+  type: bool
+message:
+  description: The output message that the module generates.
+  returned: success
+  type: dict
+  sample: {"stdout": "All jobs finished."}
+"""
+
+from ansible.module_utils.basic import AnsibleModule
+from ansible.module_utils.six import string_types
+from ansible_collections.ibm.ibm_zos_core.plugins.module_utils.job import (
+    job_output,
+    job_status,
+    wait_for_jobs,
+)
+import re
+
+
+def handle_job_ids(handles):
+    """Extract the job IDs from a list of handles or job IDs.
+
+    Arguments:
+        handles {list[Union[str, dict]]} -- Handles returned by zos_job_submit or job IDs.
+
+    Raises:
+        ValueError: When an item does not identify a job.
+
+    Returns:
+        list[str] -- The job IDs, in order, without duplicates.
+    """
+    job_ids = []
+    for handle in handles:
+        job_id = handle.get("job_id") if isinstance(handle, dict) else handle
+        if not isinstance(job_id, string_types) or not re.fullmatch(
+            r"(?:JOB|TSU|STC|J|T|S)[0-9]{1,7}", job_id.strip(), re.IGNORECASE
+        ):
+            raise ValueError("Invalid job handle: {0}".format(handle))
+        job_id = job_id.strip().upper()
+        if job_id not in job_ids:
+            job_ids.append(job_id)
+    return job_ids
+
+
+def run_module():
+    module_args = dict(
+        handles=dict(type="list", elements="raw", required=True),
+        wait_time_s=dict(type="int", required=False, default=60),
+        max_rc=dict(type="int", required=False),
+        return_output=dict(type="bool", required=False, default=True),
+    )
+
+    result = dict(changed=False)
+
+    module = AnsibleModule(argument_spec=module_args, supports_check_mode=True)
+
+    wait_time_s = module.params.get("wait_time_s")
+    max_rc = module.params.get("max_rc")
+    return_output = module.params.get("return_output")
+
+    if wait_time_s <= 0:
+        module.fail_json(
+            msg="The option wait_time_s is not valid it must be greater than 0.",
+            **result
+        )
+
+    try:
+        job_ids = handle_job_ids(module.params.get("handles"))
+        pending, duration = wait_for_jobs(job_ids, wait_time_s)[1:]
+        jobs = []
+        for job_id in job_ids:
+            if return_output:
+                job_result = job_output(module, job_id=job_id)
+            else:
+                job_result = job_status(job_id)
+            jobs.extend(job_result.get("jobs", []))
+    except Exception as e:
+        module.fail_json(msg=repr(e), **result)
+
+    result["jobs"] = jobs
+    result["pending"] = pending
+    result["duration"] = duration
+    if pending:
+        result["message"] = {
+            "stdout": "{0} of {1} jobs still running after {2} seconds.".format(
+                len(pending), len(job_ids), wait_time_s
+            )
+        }
+    else:
+        result["message"] = {"stdout": "All jobs finished."}
+
+    if max_rc is not None:
+        failed = [
+            job.get("job_id")
+            for job in jobs
+            if job.get("ret_code", {}).get("code") is None
+            or job.get("ret_code", {}).get("code") > max_rc
+        ]
+        if failed or pending:
+            module.fail_json(
+                msg="Jobs exceeded max_rc {0} or did not finish: {1}".format(
+                    max_rc, ", ".join(sorted(set(failed + pending)))
+                ),
+                **result
+            )
+    module.exit_json(**result)
+
+
+def main():
+    run_module()
+
+
+if __name__ == "__main__":
+    main()
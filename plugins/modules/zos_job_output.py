@@ -54,6 +54,21 @@ options:
       - Data definition name. (e.g "JESJCL", "?")
     type: str
     required: false
+  result_format:
+    description:
+      - The layout of C(jobs).
+      - C(records) returns a list with a dict per job.
+      - C(columnar) returns a dict with a list per job field, holding the
+        value of every job in the same order. C(ret_code) becomes a dict
+        with a list for each of its fields. C(ddnames) becomes a list
+        holding the ddnames of each job, in the same form as with
+        C(records).
+    type: str
+    required: false
+    default: records
+    choices:
+      - records
+      - columnar
 """
 
 EXAMPLES = r"""
@@ -66,6 +81,11 @@ EXAMPLES = r"""
   zos_job_output:
     job_id: "STC02560"
 
+- name: Job output for many jobs as one list per field
+  zos_job_output:
+    job_name: "APP*"
+    result_format: columnar
+
 - name: JES Job output with all ddnames
   zos_job_output:
     job_id: "STC*"
@@ -78,6 +98,7 @@ RETURN = r"""
 jobs:
   description:
       List of jobs output.
+      With I(result_format=columnar), a dict holding a list per field instead.
   returned: success
   type: list
   elements: dict
@@ -325,11 +346,36 @@ changed:
       Indicates if any changes were made during module operation
     type: bool
     returned: on success
+retry_stats:
+  description:
+     How often SDSF was queried again because the job was not listed yet,
+     and how long was spent waiting between attempts.
+  returned: always
+  type: dict
+  contains:
+    attempts:
+      description: The number of queries made.
+      type: int
+      sample: 1
+    retries:
+      description: The number of queries that had to be repeated.
+      type: int
+      sample: 0
+    wait_s:
+      description: The number of seconds spent waiting between queries.
+      type: float
+      sample: 0.0
 """
 
 
 from ansible.module_utils.basic import AnsibleModule
-from ansible_collections.ibm.ibm_zos_core.plugins.module_utils.job import job_output
+from ansible_collections.ibm.ibm_zos_core.plugins.module_utils.job import (
+    job_output,
+    to_columnar,
+)
+from ansible_collections.ibm.ibm_zos_core.plugins.module_utils.retry import (
+    RetryPolicy,
+)
 from tempfile import NamedTemporaryFile
 
 
@@ -339,6 +385,12 @@ def run_module():
         job_name=dict(type="str", required=False),
         owner=dict(type="str", required=False),
         ddname=dict(type="str", required=False),
+        result_format=dict(
+            type="str",
+            required=False,
+            default="records",
+            choices=["records", "columnar"],
+        ),
     )
 
     module = AnsibleModule(argument_spec=module_args, supports_check_mode=True)
@@ -351,11 +403,15 @@ def run_module():
     if not job_id and not job_name and not owner:
         module.fail_json(msg="Please provide a job_id or job_name or owner")
 
+    retry_policy = RetryPolicy(base_delay_s=0.05, max_delay_s=1.0, deadline_s=3)
     try:
-        results = job_output(module, job_id, owner, job_name, ddname)
+        results = job_output(module, job_id, owner, job_name, ddname, retry_policy)
+        if module.params.get("result_format") == "columnar":
+            results["jobs"] = to_columnar(results.get("jobs", []))
         results["changed"] = False
     except Exception as e:
-        module.fail_json(msg=repr(e))
+        module.fail_json(msg=repr(e), retry_stats=retry_policy.stats())
+    results["retry_stats"] = retry_policy.stats()
     module.exit_json(**results)
 
 
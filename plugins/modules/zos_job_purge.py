@@ -0,0 +1,375 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+# Copyright (c) IBM Corporation 2020
+# Apache License, Version 2.0 (see https://opensource.org/licenses/Apache-2.0)
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+ANSIBLE_METADATA = {
+    "metadata_version": "1.1",
+    "status": ["preview"],
+    "supported_by": "community",
+}
+
+DOCUMENTATION = r"""
+---
+module: zos_job_purge
+short_description: Purge finished jobs from the JES spool
+description:
+  - Purge the output of finished jobs from the JES spool in bulk.
+  - Jobs are selected by owner, job name, age and how they ended. All
+    matching jobs are purged from a single SDSF session.
+  - Jobs that are still waiting or executing are never purged.
+  - Keeping the spool small keeps M(zos_job_query), M(zos_job_output) and
+    M(zos_job_submit) fast, since each of them scans the SDSF ST panel.
+version_added: "2.9"
+author: "Ping Xiao (@xiaopingBJ)"
+options:
+  job_name:
+    description:
+      - The job name or job name prefix to purge. (e.g "APP*")
+      - C(%) matches a single character, job names may contain C($), C(#)
+        and C(@) as in M(zos_job_query).
+    type: str
+    required: false
+    default: "*"
+  owner:
+    description:
+      - The owner of the jobs to purge. (e.g "APPUSER", "APP*")
+      - At least one of I(owner) or a I(job_name) other than C(*) is
+        required, so that a task can not purge the whole spool by mistake.
+    type: str
+    required: false
+  age_days:
+    description:
+      - Purge only jobs that entered the system more than I(age_days) days
+        ago. C(0) purges jobs that entered before today.
+      - If not set, jobs of any age are purged.
+    type: int
+    required: false
+  status:
+    description:
+      - How the jobs to purge ended.
+      - C(completed) is a job that ended with a condition code, C(abended)
+        one that ended with a system or user abend, C(jcl_error) one that
+        failed conversion and C(canceled) one that was canceled.
+    type: list
+    elements: str
+    required: false
+    choices:
+      - completed
+      - abended
+      - jcl_error
+      - canceled
+    default:
+      - completed
+      - abended
+      - jcl_error
+      - canceled
+  dry_run:
+    description:
+      - Only count and list the jobs that would be purged.
+      - Check mode does the same.
+    type: bool
+    required: false
+    default: false
+"""
+
+EXAMPLES = r"""
+- name: Count the test jobs older than a week that would be purged
+  zos_job_purge:
+    owner: TESTUSR
+    age_days: 7
+    dry_run: true
+
+- name: Purge every completed or abended APP job older than two days
+  zos_job_purge:
+    job_name: APP*
+    age_days: 2
+    status:
+      - completed
+      - abended
+"""
+
+RETURN = r"""
+matched:
+  description: The number of jobs that matched the filters.
+  returned: success
+  type: int
+  sample: 1204
+purged:
+  description: The number of jobs purged. Always 0 in a dry run.
+  returned: success
+  type: int
+  sample: 1204
+jobs:
+  description: The IDs of the jobs that were purged, or would be in a dry run.
+  returned: success
+  type: list
+  elements: str
+  sample: ["JOB00134", "JOB00135"]
+not_purged:
+  description: The IDs of matching jobs that SDSF could not purge.
+  returned: success
+  type: list
+  elements: str
+  sample: []
+duration:
+  description: The number of seconds the SDSF session took.
+  returned: success
+  type: float
+  sample: 12.4
+purge_rate:
+  description: The number of jobs purged per second.
+  returned: success
+  type: float
+  sample: 97.1
+changed:
+  description: Indicates if any jobs were purged.
+  returned: always
+  type: bool
+message:
+  description: The output message that the module generates.
+  returned: success
+  type: dict
+  sample: {"stdout": "Purged 1204 of 1204 matching jobs."}
+"""
+
+from ansible.module_utils.basic import AnsibleModule
+from ansible_collections.ibm.ibm_zos_core.plugins.module_utils.better_arg_parser import (
+    BetterArgParser,
+)
+from datetime import date, timedelta
+from os import chmod
+from stat import S_IEXEC, S_IREAD, S_IWRITE
+from tempfile import NamedTemporaryFile
+from time import time
+import re
+
+"""a job name or owner, may contain % and end with *, as zos_job_query accepts"""
+JOB_NAME_REGEX = r"^[A-Z$#@%][0-9A-Z$#@%]{0,7}\*?$"
+
+"""SDSF return code prefixes for each status choice"""
+STATUS_CODES = {
+    "completed": "CC",
+    "abended": "ABEND",
+    "jcl_error": "JCLERR",
+    "canceled": "CANCEL",
+}
+
+PURGE_JOBS_REXX = """/* REXX */
+parse arg 'OWNER=' owner ' JOBNAME=' jobname ' BEFORE=' before,
+' STATUS=' statuses ' MODE=' mode
+rc=isfcalls('ON')
+ISFDATE='YYYYMMDD /'
+owner = strip(owner)
+if owner <> '' then ISFOWNER=owner
+jobname = strip(jobname)
+if jobname <> '' then ISFPREFIX=jobname
+before = strip(before)
+statuses = translate(strip(statuses), ' ', ',')
+mode = strip(mode)
+
+Address SDSF "ISFEXEC ST (ALTERNATE DELAYED)"
+if rc<>0 then do
+  Say 'ERROR' rc isfmsg
+  rc=isfcalls('OFF')
+  Exit 8
+end
+do ix=1 to isfrows
+  if strip(QUEUE.ix) == 'EXECUTION' | strip(QUEUE.ix) == 'INPUT' then iterate
+  if before <> '' & \\ (left(DATER.ix, 10) << before) then iterate
+  retcode = strip(RETCODE.ix)
+  select
+    when word(retcode, 1) == 'CC' then status = 'CC'
+    when left(retcode, 5) == 'ABEND' then status = 'ABEND'
+    when retcode == 'JCL ERROR' then status = 'JCLERR'
+    when left(retcode, 6) == 'CANCEL' then status = 'CANCEL'
+    otherwise iterate
+  end
+  if wordpos(status, statuses) == 0 then iterate
+  if mode == 'COUNT' then do
+    Say 'MATCHED' JOBID.ix
+    iterate
+  end
+  Address SDSF "ISFACT ST TOKEN('"TOKEN.ix"') PARM(NP P)"
+  if rc == 0 then Say 'PURGED' JOBID.ix
+  else Say 'FAILED' JOBID.ix rc
+end
+rc=isfcalls('OFF')
+return 0
+"""
+
+
+def purge_jobs(module, owner, job_name, before, statuses, dry_run):
+    """Purge the matching jobs from a single SDSF session.
+
+    Arguments:
+        module {AnsibleModule} -- The AnsibleModule object from the running module.
+        owner {str} -- The owner filter, or None.
+        job_name {str} -- The job name prefix filter, or None.
+        before {str} -- Purge only jobs entered before this date (YYYY/MM/DD), or None.
+        statuses {list[str]} -- The status choices to purge.
+        dry_run {bool} -- Only list the matching jobs.
+
+    Raises:
+        JobPurgeError: When SDSF can not list the jobs.
+
+    Returns:
+        list[str] -- The job IDs purged, or matched in a dry run.
+        list[str] -- The job IDs that could not be purged.
+        float -- The number of seconds the SDSF session took.
+    """
+    args = [
+        "OWNER={0}".format(owner or ""),
+        "JOBNAME={0}".format(job_name or ""),
+        "BEFORE={0}".format(before or ""),
+        "STATUS={0}".format(",".join([STATUS_CODES.get(s) for s in statuses])),
+        "MODE={0}".format("COUNT" if dry_run else "PURGE"),
+    ]
+    tmp = NamedTemporaryFile(delete=True)
+    with open(tmp.name, "w") as f:
+        f.write(PURGE_JOBS_REXX)
+    chmod(tmp.name, S_IEXEC | S_IREAD | S_IWRITE)
+    start = time()
+    rc, out, err = module.run_command([tmp.name, " ".join(args)])
+    duration = time() - start
+    if rc != 0:
+        raise JobPurgeError((out + err).strip())
+    jobs = []
+    failed = []
+    for line in out.splitlines():
+        words = line.split()
+        if len(words) < 2:
+            continue
+        if words[0] in ["PURGED", "MATCHED"]:
+            jobs.append(words[1])
+        elif words[0] == "FAILED":
+            failed.append(words[1])
+    return jobs, failed, duration
+
+
+def cutoff_date(age_days, today=None):
+    """Compute the date jobs must have entered the system before.
+
+    Arguments:
+        age_days {int} -- The minimum age of the jobs in days.
+
+    Keyword Arguments:
+        today {date} -- The current date. (default: {None})
+
+    Returns:
+        str -- The date in the SDSF YYYY/MM/DD format.
+    """
+    today = today or date.today()
+    return (today - timedelta(days=age_days)).strftime("%Y/%m/%d")
+
+
+def job_name_type(contents, resolve_dependencies):
+    if str(contents) != "*" and not re.fullmatch(
+        JOB_NAME_REGEX, str(contents), re.IGNORECASE
+    ):
+        raise ValueError(
+            'Invalid argument type for "{0}". expected "job_name"'.format(contents)
+        )
+    return str(contents)
+
+
+def run_module():
+    module_args = dict(
+        job_name=dict(type="str", required=False, default="*"),
+        owner=dict(type="str", required=False),
+        age_days=dict(type="int", required=False),
+        status=dict(
+            type="list",
+            elements="str",
+            required=False,
+            choices=list(STATUS_CODES),
+            default=list(STATUS_CODES),
+        ),
+        dry_run=dict(type="bool", required=False, default=False),
+    )
+
+    result = dict(changed=False)
+
+    module = AnsibleModule(argument_spec=module_args, supports_check_mode=True)
+
+    arg_defs = dict(
+        job_name=dict(arg_type=job_name_type, default="*"),
+        owner=dict(arg_type=job_name_type, required=False),
+        age_days=dict(arg_type="int", required=False),
+        status=dict(arg_type="list", elements="str", default=list(STATUS_CODES)),
+        dry_run=dict(arg_type="bool", default=False),
+    )
+
+    try:
+        parser = BetterArgParser(arg_defs)
+        parsed_args = parser.parse_args(module.params)
+    except ValueError as e:
+        module.fail_json(msg="Parameter verification failed", stderr=str(e))
+
+    job_name = parsed_args.get("job_name")
+    owner = parsed_args.get("owner")
+    age_days = parsed_args.get("age_days")
+    dry_run = parsed_args.get("dry_run") or module.check_mode
+
+    if not owner and job_name == "*":
+        module.fail_json(
+            msg="At least one of owner or a job_name other than * is required.",
+            **result
+        )
+    if age_days is not None and age_days < 0:
+        module.fail_json(msg="The option age_days must not be negative.", **result)
+
+    try:
+        jobs, failed, duration = purge_jobs(
+            module,
+            owner,
+            job_name,
+            cutoff_date(age_days) if age_days is not None else None,
+            parsed_args.get("status"),
+            dry_run,
+        )
+    except Exception as e:
+        module.fail_json(msg=repr(e), **result)
+
+    purged = 0 if dry_run else len(jobs)
+    result["jobs"] = jobs
+    result["matched"] = len(jobs) + len(failed)
+    result["purged"] = purged
+    result["not_purged"] = failed
+    result["duration"] = round(duration, 2)
+    result["purge_rate"] = round(purged / duration, 1) if duration > 0 else 0.0
+    result["changed"] = purged > 0
+    if dry_run:
+        result["message"] = {
+            "stdout": "{0} jobs would be purged.".format(result.get("matched"))
+        }
+    else:
+        result["message"] = {
+            "stdout": "Purged {0} of {1} matching jobs.".format(
+                purged, result.get("matched")
+            )
+        }
+    if failed:
+        module.fail_json(
+            msg="Unable to purge jobs: {0}".format(", ".join(failed)), **result
+        )
+    module.exit_json(**result)
+
+
+class JobPurgeError(Exception):
+    def __init__(self, message):
+        self.msg = "An error occurred while purging jobs. {0}".format(message)
+        super(JobPurgeError, self).__init__(self.msg)
+
+
+def main():
+    run_module()
+
+
+if __name__ == "__main__":
+    main()
@@ -23,27 +23,196 @@ description:
   - Uses owner to filter the jobs by the job owner.
   - Uses system to filter the jobs by system where the job is running (or ran) on.
   - Uses job_id to filter the jobs by the job id.
+  - Each filter accepts a list. A job is returned when it matches any item
+    of every filter that is set, and each job is returned once.
+  - Each job ID is listed from JES directly. Otherwise each name, or each
+    owner when all job names are wanted, is listed once, skipping patterns
+    that a broader one covers, e.g. C(PAYROLL) when C(PAY*) is given. The
+    listings are matched against every filter on the managed node.
 author: "Ping Xiao (@xiaopingBJ)"
 options:
   job_name:
     description:
-       - The job name to query.
-    type: str
+       - The job name or names to query. A name may end with C(*).
+    type: list
+    elements: str
     required: False
     default: "*"
   owner:
     description:
-      - Identifies the owner of the job.
+      - Identifies the owner or owners of the job. An owner may end with
+        C(*).
       - If no owner is set, the default set is 'none' and all jobs will be
         queried.
-    type: str
+    type: list
+    elements: str
     required: False
   job_id:
     description:
-      - The job number that has been assigned to the job. These normally begin
-        with STC, JOB, TSU and are followed by 5 digits.
+      - The job number or numbers that have been assigned to the job. These
+        normally begin with STC, JOB, TSU and are followed by 5 digits.
+      - May be combined with I(owner) and I(job_name).
+    type: list
+    elements: str
+    required: False
+  status:
+    description:
+      - Return only jobs in one of these states.
+      - C(active) is a job that is executing, C(completed) one that ended
+        with a condition code, C(abended) one that ended with a system or
+        user abend, C(jcl_error) one that failed conversion and C(canceled)
+        one that was canceled.
+    type: list
+    elements: str
+    required: False
+    choices:
+      - active
+      - completed
+      - abended
+      - jcl_error
+      - canceled
+  min_rc:
+    description:
+      - Return only jobs that completed with a return code of at least
+        I(min_rc).
+    type: int
+    required: False
+  max_rc:
+    description:
+      - Return only jobs that completed with a return code of at most
+        I(max_rc).
+    type: int
+    required: False
+  submitted_after:
+    description:
+      - Return only jobs read in by JES at or after this time.
+      - The format is C(YYYY-MM-DD) or C(YYYY-MM-DD HH:MM:SS), in the local
+        time of the managed node.
+      - The time filters need one SDSF listing in addition to the job
+        listing.
     type: str
     required: False
+  submitted_before:
+    description:
+      - Return only jobs read in by JES before this time.
+      - Same format as I(submitted_after).
+    type: str
+    required: False
+  ended_after:
+    description:
+      - Return only jobs that finished executing at or after this time.
+      - Same format as I(submitted_after).
+    type: str
+    required: False
+  ended_before:
+    description:
+      - Return only jobs that finished executing before this time.
+      - Same format as I(submitted_after).
+    type: str
+    required: False
+  backend:
+    description:
+      - Where the job listing is read from.
+      - C(zoau) lists jobs with the Z Open Automation Utilities.
+      - C(sdsf) lists jobs from the SDSF ST panel in a single pass and also
+        returns the job class, the system, the JES queue, the position in
+        the queue and the submit, start and end times with the elapsed time.
+        The spool is not read.
+    type: str
+    required: False
+    default: zoau
+    choices:
+      - zoau
+      - sdsf
+  result_format:
+    description:
+      - The layout of C(jobs).
+      - C(records) returns a list with a dict per job.
+      - C(columnar) returns a dict with a list per field, holding the value
+        of every job in the same order. When every job has a C(ret_code)
+        dict, it becomes a dict with a list for each of its fields. Each
+        field name is sent once rather than once per job, which makes large
+        listings much smaller.
+    type: str
+    required: False
+    default: records
+    choices:
+      - records
+      - columnar
+  snapshot:
+    description:
+      - Return only what changed in the JES queue since an earlier call.
+      - Without I(state_token), every matching job is returned together with
+        a new C(state_token).
+      - With the C(state_token) of the previous call, C(jobs) holds only the
+        jobs that were added or changed status since then, and C(purged)
+        the IDs of jobs that are no longer listed. A new C(state_token) is
+        returned for the next call.
+      - The listings are kept in I(snapshot_file) on the managed node for
+        one day, and each token can be used once. Only the three newest
+        listings taken with the same filters are kept. An unknown, expired
+        or already used token, or one taken with different filters, returns
+        the full listing with C(full_refresh=true).
+      - Can not be combined with I(limit) or I(offset).
+    type: bool
+    required: False
+    default: false
+  state_token:
+    description:
+      - The C(state_token) returned by the previous I(snapshot) call.
+    type: str
+    required: False
+  snapshot_file:
+    description:
+      - The USS file the I(snapshot) listings are kept in.
+    type: path
+    required: False
+    default: ~/.ansible/zos_job_query_snapshots.json
+  sort:
+    description:
+      - Sort the jobs before a page is taken.
+      - C(job_id) sorts by job number, which is the order JES accepted the
+        jobs in until the job numbers wrap around.
+      - If not set, jobs are returned in the order JES lists them.
+      - With I(backend=sdsf), SDSF sorts the listing itself when one job
+        name or owner pattern covers the query and no I(status),
+        I(min_rc), I(max_rc), time or I(snapshot) filter is set. C(job_id)
+        then follows the SDSF order of the job IDs, which groups them by
+        prefix (JOB, STC, TSU) before the job number.
+    type: str
+    required: False
+    choices:
+      - job_id
+      - job_name
+  sort_order:
+    description:
+      - The direction of I(sort). Use C(descending) with I(sort=job_id) to
+        get the newest jobs first.
+    type: str
+    required: False
+    default: ascending
+    choices:
+      - ascending
+      - descending
+  limit:
+    description:
+      - The maximum number of jobs to return.
+      - Only the jobs on the page are converted into results, so a small
+        I(limit) keeps broad queries cheap.
+      - If not set, every job after I(offset) is returned.
+      - With I(backend=sdsf), in the cases where SDSF sorts the listing
+        (see I(sort)), SDSF also stops after the last job of the page, so
+        the jobs after it are not listed. Otherwise the full listing is
+        read and the page is taken from it.
+    type: int
+    required: False
+  offset:
+    description:
+      - The number of jobs to skip before the page starts.
+      - Pass the C(next_offset) of the previous page to continue.
+    type: int
+    required: False
+    default: 0
 '''
 
 EXAMPLES = r'''
@@ -64,6 +233,55 @@ EXAMPLES = r'''
   zos_job_query:
     job_name: IYK3ZNA*
     owner: BROWNAD
+
+- name: list the jobs of several applications in one query
+  zos_job_query:
+    job_name:
+      - PAYR*
+      - BILL*
+      - GLDAILY
+    owner:
+      - PRODBAT
+      - PRODSCH
+
+- name: list the jobs of BROWNAD that ended badly since the start of the day
+  zos_job_query:
+    owner: BROWNAD
+    status:
+      - completed
+      - abended
+      - jcl_error
+    min_rc: 8
+    ended_after: "{{ ansible_date_time.date }}"
+
+- name: list the jobs of BROWNAD with their class, system and elapsed time
+  zos_job_query:
+    owner: BROWNAD
+    backend: sdsf
+
+- name: list a large number of jobs as one list per field
+  zos_job_query:
+    owner: "*"
+    result_format: columnar
+
+- name: take a snapshot of the jobs of BROWNAD
+  zos_job_query:
+    owner: BROWNAD
+    snapshot: true
+  register: jobs_snapshot
+
+- name: list only what changed since the snapshot
+  zos_job_query:
+    owner: BROWNAD
+    snapshot: true
+    state_token: "{{ jobs_snapshot.state_token }}"
+
+- name: list the 20 newest jobs of BROWNAD
+  zos_job_query:
+    owner: BROWNAD
+    sort: job_id
+    sort_order: descending
+    limit: 20
 '''
 
 RETURN = r'''
@@ -75,6 +293,7 @@ changed:
 jobs:
   description:
      The list of z/OS job(s) and status.
+     With I(result_format=columnar), a dict holding a list per field instead.
   returned: success
   type: list
   elements: dict
@@ -112,6 +331,49 @@ jobs:
       sample:
          - "code": 0
          -  "msg": "CC 0000"
+    job_class:
+      description:
+         The job class. Only returned with I(backend=sdsf).
+      type: str
+      sample: A
+    system:
+      description:
+         The system the job executed on. Only returned with I(backend=sdsf).
+      type: str
+      sample: STL1
+    queue:
+      description:
+         The JES queue the job is on, such as INPUT, EXECUTION or PRINT.
+         Only returned with I(backend=sdsf).
+      type: str
+      sample: PRINT
+    position:
+      description:
+         The position of the job in its queue. Only returned with
+         I(backend=sdsf).
+      type: int
+      sample: 12
+    submitted:
+      description:
+         When JES read the job in. Only returned with I(backend=sdsf).
+      type: str
+      sample: "2020-05-12 13:45:12"
+    started:
+      description:
+         When the job started executing. Only returned with I(backend=sdsf).
+      type: str
+      sample: "2020-05-12 13:45:13"
+    ended:
+      description:
+         When the job finished executing. Only returned with I(backend=sdsf).
+      type: str
+      sample: "2020-05-12 13:46:01"
+    elapsed_s:
+      description:
+         Seconds from the start of execution to its end, or until now for an
+         executing job. Only returned with I(backend=sdsf).
+      type: int
+      sample: 48
   sample:
     [
         {
@@ -127,6 +389,58 @@ jobs:
             "ret_code": { "msg": "CANCELED", "code": "null" },
         },
     ]
+total:
+  description:
+     The number of jobs that matched, before I(offset) and I(limit) are
+     applied.
+  returned: success
+  type: int
+  sample: 1327
+next_offset:
+  description:
+     The I(offset) of the next page, or null when this is the last page.
+  returned: success
+  type: int
+  sample: 20
+state_token:
+  description:
+     The token to pass as I(state_token) to get the next changes.
+  returned: when snapshot is true
+  type: str
+  sample: 3f2c9a6e0d9b4c5f8a7e1b2d4c6f8a0e
+purged:
+  description:
+     The IDs of jobs listed at I(state_token) that are no longer listed.
+  returned: when snapshot is true
+  type: list
+  elements: str
+  sample: ["JOB01427"]
+full_refresh:
+  description:
+     True when C(jobs) holds every matching job rather than the changes
+     since I(state_token).
+  returned: when snapshot is true
+  type: bool
+  sample: false
+retry_stats:
+  description:
+     How often JES was queried again because the job list was not ready,
+     and how long was spent waiting between attempts.
+  returned: success
+  type: dict
+  contains:
+    attempts:
+      description: The number of queries made.
+      type: int
+      sample: 1
+    retries:
+      description: The number of queries that had to be repeated.
+      type: int
+      sample: 0
+    wait_s:
+      description: The number of seconds spent waiting between queries.
+      type: float
+      sample: 0.0
 message:
   description:
      Message returned on failure.
@@ -141,16 +455,81 @@ try:
 except Exception:
     Jobs = ""
 from ansible.module_utils.basic import AnsibleModule
+from ansible_collections.ibm.ibm_zos_core.plugins.module_utils.retry import (
+    RetryPolicy,
+)
+from ansible_collections.ibm.ibm_zos_core.plugins.module_utils.job import (
+    job_status_class,
+    list_jobs_sdsf,
+    list_jobs_sdsf_page,
+    to_columnar,
+)
+from ansible_collections.ibm.ibm_zos_core.plugins.module_utils.state_file import (
+    update_state,
+)
+from collections import OrderedDict
+from datetime import datetime
+from fnmatch import fnmatchcase
+from hashlib import sha256
+from time import time
+from uuid import uuid4
+import json
 import re
-from time import sleep
+
+STATUS_CLASSES = ["active", "completed", "abended", "jcl_error", "canceled"]
+
+TIME_FILTERS = ["submitted_after", "submitted_before", "ended_after", "ended_before"]
+
+"""the SDSF ST columns each sort option orders the listing by"""
+SDSF_SORT_COLUMNS = {"job_id": ["JOBID"], "job_name": ["JNAME", "JOBID"]}
+
+"""snapshots older than one day are dropped from the snapshot file"""
+SNAPSHOT_RETENTION_S = 24 * 60 * 60
+
+"""only the newest snapshots taken with the same filters are kept"""
+SNAPSHOTS_PER_QUERY = 3
 
 
 def run_module():
 
     module_args = dict(
-        job_name=dict(type="str", required=False, default="*"),
-        owner=dict(type="str", required=False),
-        job_id=dict(type="str", required=False),
+        job_name=dict(type="list", elements="str", required=False, default=["*"]),
+        owner=dict(type="list", elements="str", required=False),
+        job_id=dict(type="list", elements="str", required=False),
+        status=dict(
+            type="list", elements="str", required=False, choices=STATUS_CLASSES
+        ),
+        min_rc=dict(type="int", required=False),
+        max_rc=dict(type="int", required=False),
+        submitted_after=dict(type="str", required=False),
+        submitted_before=dict(type="str", required=False),
+        ended_after=dict(type="str", required=False),
+        ended_before=dict(type="str", required=False),
+        backend=dict(
+            type="str", required=False, default="zoau", choices=["zoau", "sdsf"]
+        ),
+        result_format=dict(
+            type="str",
+            required=False,
+            default="records",
+            choices=["records", "columnar"],
+        ),
+        snapshot=dict(type="bool", required=False, default=False),
+        state_token=dict(type="str", required=False, no_log=False),
+        snapshot_file=dict(
+            type="path",
+            required=False,
+            default="~/.ansible/zos_job_query_snapshots.json",
+        ),
+        sort=dict(type="str", required=False, choices=["job_id", "job_name"]),
+        sort_order=dict(
+            type="str",
+            required=False,
+            default="ascending",
+            choices=["ascending", "descending"],
+        ),
+        limit=dict(type="int", required=False),
+        offset=dict(type="int", required=False, default=0),
     )
 
     result = dict(changed=False, message="")
@@ -160,67 +539,672 @@ def run_module():
     if module.check_mode:
         return result
 
+    retry_policy = RetryPolicy(base_delay_s=0.05, max_delay_s=1.0, deadline_s=3)
     try:
         validate_arguments(module.params)
-        jobs_raw = query_jobs(module.params)
+        list_args = sdsf_page_listing(module.params)
+        if list_args:
+            jobs_raw, total, next_offset = query_jobs_sdsf_page(
+                module.params, list_args, retry_policy, module
+            )
+        else:
+            jobs_raw = query_jobs(module.params, retry_policy, module)
+            jobs_raw = filter_job_status(
+                jobs_raw,
+                module.params.get("status"),
+                module.params.get("min_rc"),
+                module.params.get("max_rc"),
+            )
+            if any([module.params.get(option) for option in TIME_FILTERS]):
+                jobs_raw = filter_job_times(
+                    module, jobs_raw, module.params, retry_policy
+                )
+            if module.params.get("snapshot"):
+                jobs_raw, snapshot_result = take_snapshot(jobs_raw, module.params)
+                result.update(snapshot_result)
+            jobs_raw, total, next_offset = page_jobs(
+                jobs_raw,
+                module.params.get("limit"),
+                module.params.get("offset"),
+                module.params.get("sort"),
+                module.params.get("sort_order"),
+            )
         jobs = parsing_jobs(jobs_raw)
     except Exception as e:
+        result["retry_stats"] = retry_policy.stats()
         module.fail_json(msg=e, **result)
+    if module.params.get("result_format") == "columnar":
+        jobs = to_columnar(jobs)
     result["jobs"] = jobs
+    result["total"] = total
+    result["next_offset"] = next_offset
+    result["retry_stats"] = retry_policy.stats()
     module.exit_json(**result)
 
 
 def validate_arguments(params):
-    job_name_in = params.get("job_name")
-    job_id = params.get("job_id")
-    owner = params.get("owner")
-    if job_name_in or job_id:
-        if job_name_in and job_name_in != "*":
-            job_name_pattern = re.compile(r"^[a-zA-Z$#@%][0-9a-zA-Z$#@%]{0,7}$")
-            job_name_pattern_with_star = re.compile(
-                r"^[a-zA-Z$#@%][0-9a-zA-Z$#@%]{0,6}\*$"
-            )
+    job_names = params.get("job_name") or []
+    job_ids = params.get("job_id") or []
+    owners = params.get("owner") or []
+    if job_names or job_ids:
+        job_name_pattern = re.compile(r"^[a-zA-Z$#@%][0-9a-zA-Z$#@%]{0,7}$")
+        job_name_pattern_with_star = re.compile(
+            r"^[a-zA-Z$#@%][0-9a-zA-Z$#@%]{0,6}\*$"
+        )
+        for job_name_in in job_names:
+            if job_name_in == "*":
+                continue
             m = job_name_pattern.search(job_name_in)
             n = job_name_pattern_with_star.search(job_name_in)
             if m or n:
                 pass
             else:
                 raise RuntimeError("Failed to validate the job name: " + job_name_in)
-        if job_id:
-            job_id_pattern = re.compile("(JOB|TSU|STC)[0-9]{5}$")
+        job_id_pattern = re.compile("(JOB|TSU|STC)[0-9]{5}$")
+        for job_id in job_ids:
             if not job_id_pattern.search(job_id):
                 raise RuntimeError("Failed to validate the job id: " + job_id)
     else:
         raise RuntimeError("Argument Error:Either job name(s) or job id is required")
-    if job_id and owner:
-        raise RuntimeError("Argument Error:job id can not be co-exist with owner")
+    owner_pattern = re.compile(r"^(?:[a-zA-Z$#@][0-9a-zA-Z$#@]{0,7}|[a-zA-Z$#@]?[0-9a-zA-Z$#@]{0,6}\*)$")
+    for owner in owners:
+        if not owner_pattern.search(owner):
+            raise RuntimeError("Failed to validate the owner: " + owner)
+    for option in TIME_FILTERS:
+        if params.get(option):
+            params[option] = normalize_time(params.get(option), option)
+    if params.get("snapshot") and (params.get("limit") or params.get("offset")):
+        raise RuntimeError(
+            "Argument Error:snapshot can not be used with limit or offset"
+        )
+    if params.get("limit") is not None and params.get("limit") < 1:
+        raise RuntimeError("Argument Error:limit must be greater than 0")
+    if params.get("offset") and params.get("offset") < 0:
+        raise RuntimeError("Argument Error:offset must not be negative")
 
 
-def query_jobs(params, count=0):
-    job_name_in = params.get("job_name")
-    job_id = params.get("job_id")
-    owner = params.get("owner")
+def query_jobs(params, retry_policy, module):
+    """List the jobs matching any of the names, IDs and owners given.
+    Each job ID is listed directly, otherwise each name or owner pattern
+    that no broader one covers is listed once, and the listings are then
+    matched against every pattern.
+
+    Arguments:
+        params {dict} -- The module parameters.
+        retry_policy {RetryPolicy} -- Retries the listing while JES is not ready.
+        module {AnsibleModule} -- The AnsibleModule object from the running module.
+
+    Raises:
+        RuntimeError: When no job matches, unless a snapshot is taken.
+
+    Returns:
+        list[dict] -- The matching jobs as returned by Jobs.list, each job once.
+    """
+    job_names = params.get("job_name") or ["*"]
+    job_ids = params.get("job_id") or []
+    owners = params.get("owner") or []
+
     jobs = []
-    try:
-        if job_id:
-            jobs = Jobs.list(job_id=job_id)
-        elif owner:
-            jobs = Jobs.list(owner=owner, job_name=job_name_in)
+    for list_args in job_listings(job_names, job_ids, owners):
+        if params.get("backend") == "sdsf":
+            jobs.extend(
+                [
+                    sdsf_to_raw(job)
+                    for job in list_jobs_sdsf_retried(module, retry_policy, list_args)
+                ]
+            )
         else:
-            jobs = Jobs.list(job_name=job_name_in)
-        if not jobs:
-            raise RuntimeError(
-                "List FAILED! no such job name been found: " + job_name_in
+            jobs.extend(retry_policy.run(lambda: Jobs.list(**list_args)) or [])
+    jobs = filter_jobs(jobs, job_names, job_ids, owners)
+    if not jobs and not params.get("snapshot"):
+        raise RuntimeError(
+            "List FAILED! no such job name been found: "
+            + ", ".join(job_names + job_ids)
+        )
+    return jobs
+
+
+def sdsf_page_listing(params):
+    """Work out whether SDSF can sort the listing and stop after the last
+    row of the page itself. That is the case for backend=sdsf when a
+    single listing covers the query and no status, return code, time or
+    snapshot filter drops rows after the listing.
+
+    Arguments:
+        params {dict} -- The module parameters.
+
+    Returns:
+        dict -- The arguments of list_jobs_sdsf_page, empty when the jobs
+        must be listed in full and paged by page_jobs.
+    """
+    if params.get("backend") != "sdsf" or params.get("snapshot"):
+        return {}
+    if not (params.get("sort") or params.get("limit")):
+        return {}
+    if any(
+        [
+            params.get(option) is not None and params.get(option) != []
+            for option in ["status", "min_rc", "max_rc"] + TIME_FILTERS
+        ]
+    ):
+        return {}
+    listings = job_listings(
+        params.get("job_name") or ["*"],
+        params.get("job_id") or [],
+        params.get("owner") or [],
+    )
+    if len(listings) != 1:
+        return {}
+    list_args = dict(listings[0])
+    if params.get("sort"):
+        direction = "D" if params.get("sort_order") == "descending" else "A"
+        list_args["sort"] = " ".join(
+            [
+                "{0} {1}".format(column, direction)
+                for column in SDSF_SORT_COLUMNS.get(params.get("sort"))
+            ]
+        )
+    if params.get("limit"):
+        list_args["max_rows"] = (params.get("offset") or 0) + params.get("limit")
+    return list_args
+
+
+def query_jobs_sdsf_page(params, list_args, retry_policy, module):
+    """List one page of jobs from SDSF, sorted by SDSF and cut off after
+    the last row of the page.
+
+    Arguments:
+        params {dict} -- The module parameters.
+        list_args {dict} -- The arguments of list_jobs_sdsf_page, from sdsf_page_listing.
+        retry_policy {RetryPolicy} -- Retries the listing while JES is not ready.
+        module {AnsibleModule} -- The AnsibleModule object from the running module.
+
+    Raises:
+        RuntimeError: When no job matches.
+
+    Returns:
+        list[dict] -- The jobs on the page, in the form Jobs.list returns.
+        int -- The number of jobs that matched.
+        Union[int, NoneType] -- The offset of the next page, or None on the last page.
+    """
+    job_names = params.get("job_name") or ["*"]
+    job_ids = params.get("job_id") or []
+    listed, total = retry_policy.run(
+        lambda: list_jobs_sdsf_page(module, **list_args),
+        retry_if=(lambda page: not page[0]) if list_args.get("job_id") else None,
+    )
+    jobs_raw = filter_jobs(
+        [sdsf_to_raw(job) for job in listed],
+        job_names,
+        job_ids,
+        params.get("owner") or [],
+    )
+    total = total - (len(listed) - len(jobs_raw))
+    if not total:
+        raise RuntimeError(
+            "List FAILED! no such job name been found: "
+            + ", ".join(job_names + job_ids)
+        )
+    return page_jobs(
+        jobs_raw, params.get("limit"), params.get("offset"), total=total
+    )
+
+
+def filter_job_status(jobs_raw, statuses=None, min_rc=None, max_rc=None):
+    """Keep the jobs in one of the given states and return code range.
+
+    Arguments:
+        jobs_raw {list[dict]} -- The jobs as returned by Jobs.list.
+
+    Keyword Arguments:
+        statuses {list[str]} -- The status classes to keep. (default: {None})
+        min_rc {int} -- The lowest return code to keep. (default: {None})
+        max_rc {int} -- The highest return code to keep. (default: {None})
+
+    Returns:
+        list[dict] -- The matching jobs. Jobs without a numeric return code
+        are dropped when min_rc or max_rc is set.
+    """
+    jobs = []
+    for job in jobs_raw:
+        if statuses and job_status_class(job.get("status")) not in statuses:
+            continue
+        if min_rc is not None or max_rc is not None:
+            ret_code = str(job.get("return") or "").strip()
+            if not ret_code.isdigit():
+                continue
+            if job_status_class(job.get("status")) != "completed":
+                continue
+            if min_rc is not None and int(ret_code) < min_rc:
+                continue
+            if max_rc is not None and int(ret_code) > max_rc:
+                continue
+        jobs.append(job)
+    return jobs
+
+
+def list_jobs_sdsf_retried(module, retry_policy, list_args):
+    """List jobs from SDSF through the retry policy. A job looked up by ID
+    is listed again while SDSF does not show it yet, as Jobs.list is.
+
+    Arguments:
+        module {AnsibleModule} -- The AnsibleModule object from the running module.
+        retry_policy {RetryPolicy} -- Retries the listing while JES is not ready.
+        list_args {dict} -- The job_id, job_name and owner to list.
+
+    Returns:
+        list[dict] -- The jobs as returned by list_jobs_sdsf.
+    """
+    return retry_policy.run(
+        lambda: list_jobs_sdsf(module, **list_args),
+        retry_if=(lambda jobs: not jobs) if list_args.get("job_id") else None,
+    )
+
+
+def filter_job_times(module, jobs_raw, params, retry_policy):
+    """Keep the jobs submitted and ended within the time windows.
+    Jobs.list does not report times, so unless the jobs were listed
+    from SDSF, one SDSF listing covering all of the jobs is read.
+
+    Arguments:
+        module {AnsibleModule} -- The AnsibleModule object from the running module.
+        jobs_raw {list[dict]} -- The jobs as returned by Jobs.list.
+        params {dict} -- The module parameters holding the time filters.
+        retry_policy {RetryPolicy} -- Retries the SDSF listing while JES is not ready.
+
+    Returns:
+        list[dict] -- The matching jobs.
+    """
+    if not jobs_raw:
+        return jobs_raw
+    times = {}
+    if "submitted" in jobs_raw[0]:
+        # listed with backend=sdsf, the times are already known
+        times = dict([(job.get("id"), job) for job in jobs_raw])
+    else:
+        for list_args in job_listings(
+            params.get("job_name") or ["*"],
+            params.get("job_id") or [],
+            params.get("owner") or [],
+        ):
+            for job in list_jobs_sdsf_retried(module, retry_policy, list_args):
+                times[job.get("job_id")] = job
+    jobs = []
+    for job in jobs_raw:
+        sdsf_job = times.get(job.get("id"), {})
+        if within_window(
+            sdsf_job.get("submitted"),
+            params.get("submitted_after"),
+            params.get("submitted_before"),
+        ) and within_window(
+            sdsf_job.get("ended"),
+            params.get("ended_after"),
+            params.get("ended_before"),
+        ):
+            jobs.append(job)
+    return jobs
+
+
+def within_window(timestamp, after=None, before=None):
+    """Check a "YYYY-MM-DD HH:MM:SS" timestamp against a time window.
+
+    Arguments:
+        timestamp {str} -- The time to check, or None when unknown.
+
+    Keyword Arguments:
+        after {str} -- The earliest time allowed. (default: {None})
+        before {str} -- The time that must not be reached. (default: {None})
+
+    Returns:
+        bool -- Whether the timestamp is inside the window. An unknown
+        timestamp is only inside a window with no limits.
+    """
+    if not after and not before:
+        return True
+    if not timestamp:
+        return False
+    if after and timestamp < after:
+        return False
+    if before and timestamp >= before:
+        return False
+    return True
+
+
+def normalize_time(value, option):
+    """Validate a time filter and bring it into "YYYY-MM-DD HH:MM:SS" form.
+
+    Arguments:
+        value {str} -- "YYYY-MM-DD" or "YYYY-MM-DD HH:MM:SS".
+        option {str} -- The name of the option, for the error message.
+
+    Raises:
+        RuntimeError: When the value is not in either format.
+
+    Returns:
+        str -- The normalized time.
+    """
+    for time_format in ["%Y-%m-%d %H:%M:%S", "%Y-%m-%d"]:
+        try:
+            return datetime.strptime(value.strip(), time_format).strftime(
+                "%Y-%m-%d %H:%M:%S"
             )
-    except IndexError:
-        if count > 12:
-            raise
-        sleep(0.25)
-        count += 1
-        jobs = query_jobs(params, count)
+        except ValueError:
+            pass
+    raise RuntimeError(
+        "Argument Error:{0} must be YYYY-MM-DD or YYYY-MM-DD HH:MM:SS".format(option)
+    )
+
+
+def job_listings(job_names, job_ids, owners):
+    """Work out the JES listings that together hold every job matching
+    the filters. Each job ID is listed on its own. Otherwise each name
+    pattern is listed once, or each owner pattern when all job names are
+    wanted, and patterns covered by a broader one are not listed again.
+
+    Arguments:
+        job_names {list[str]} -- Job names that may end with "*".
+        job_ids {list[str]} -- Job IDs.
+        owners {list[str]} -- Owners that may end with "*".
+
+    Returns:
+        list[dict] -- The job_id, job_name and owner arguments of each listing.
+    """
+    if job_ids:
+        return [
+            dict(job_id=job_id)
+            for job_id in OrderedDict.fromkeys([job_id.upper() for job_id in job_ids])
+        ]
+    names = listing_patterns(job_names)
+    owner_patterns = listing_patterns(owners)
+    if names == ["*"] and owner_patterns:
+        return [dict(job_name="*", owner=owner) for owner in owner_patterns]
+    if len(owner_patterns) == 1:
+        return [dict(job_name=name, owner=owner_patterns[0]) for name in names]
+    return [dict(job_name=name) for name in names]
+
+
+def listing_patterns(patterns):
+    """Drop the patterns that a broader pattern already covers, e.g.
+    PAYROLL and PAY0* when PAY* is given.
+
+    Arguments:
+        patterns {list[str]} -- Names that may contain "%" and end with "*".
+
+    Returns:
+        list[str] -- The remaining distinct patterns, in the order given.
+    """
+    patterns = list(OrderedDict.fromkeys([pattern.upper() for pattern in patterns]))
+    return [
+        pattern
+        for pattern in patterns
+        if not any(
+            [
+                _pattern_covers(other, pattern)
+                for other in patterns
+                if other != pattern
+            ]
+        )
+    ]
+
+
+def _pattern_covers(broad, narrow):
+    if not broad.endswith("*"):
+        return False
+    prefix = broad[:-1]
+    if len(narrow.rstrip("*")) < len(prefix):
+        return False
+    for broad_char, narrow_char in zip(prefix, narrow):
+        if broad_char != "%" and broad_char != narrow_char:
+            return False
+    return True
+
+
+def filter_jobs(jobs_raw, job_names, job_ids, owners):
+    """Keep the jobs that match any item of every filter that is set.
+
+    Arguments:
+        jobs_raw {list[dict]} -- The jobs as returned by Jobs.list.
+        job_names {list[str]} -- Job names that may end with "*".
+        job_ids {list[str]} -- Job IDs.
+        owners {list[str]} -- Owners that may end with "*".
+
+    Returns:
+        list[dict] -- The matching jobs in listing order, each job once.
+    """
+    job_names = [name.upper() for name in job_names or ["*"]]
+    job_ids = set([job_id.upper() for job_id in job_ids])
+    owners = [owner.upper() for owner in owners]
+    seen = set()
+    jobs = []
+    for job in jobs_raw:
+        job_id = (job.get("id") or "").upper()
+        if job_id in seen:
+            continue
+        if job_ids and job_id not in job_ids:
+            continue
+        if not _matches_any((job.get("name") or "").upper(), job_names):
+            continue
+        if owners and not _matches_any((job.get("owner") or "").upper(), owners):
+            continue
+        seen.add(job_id)
+        jobs.append(job)
     return jobs
 
 
+def _matches_any(value, patterns):
+    for pattern in patterns:
+        # % is the JES wildcard for a single character
+        if fnmatchcase(value, pattern.replace("%", "?")):
+            return True
+    return False
+
+
+def take_snapshot(jobs_raw, params):
+    """Record the listing in the snapshot file and work out what changed
+    since the listing recorded under the state token.
+
+    Arguments:
+        jobs_raw {list[dict]} -- Every job matching the filters.
+        params {dict} -- The module parameters.
+
+    Returns:
+        list[dict] -- The jobs added or changed since the token, or every
+        job on a full refresh.
+        dict -- The state_token, purged and full_refresh results.
+    """
+    query_key = snapshot_query_key(params)
+    current = dict([(job.get("id"), job_fingerprint(job)) for job in jobs_raw])
+    new_token = uuid4().hex
+    now = time()
+    found = {}
+
+    def update(snapshots):
+        for token in list(snapshots):
+            if now - snapshots[token].get("created", 0) > SNAPSHOT_RETENTION_S:
+                del snapshots[token]
+        previous = snapshots.pop(params.get("state_token") or "", None)
+        if previous and previous.get("query") == query_key:
+            found["jobs"] = previous.get("jobs", {})
+        same_query = sorted(
+            [token for token in snapshots if snapshots[token].get("query") == query_key],
+            key=lambda token: snapshots[token].get("created", 0),
+        )
+        for token in same_query[: max(len(same_query) - SNAPSHOTS_PER_QUERY + 1, 0)]:
+            del snapshots[token]
+        snapshots[new_token] = dict(query=query_key, created=now, jobs=current)
+
+    update_state(params.get("snapshot_file"), update)
+    if "jobs" not in found:
+        return jobs_raw, dict(state_token=new_token, purged=[], full_refresh=True)
+    changed_jobs, purged = snapshot_delta(jobs_raw, found.get("jobs"))
+    return (
+        changed_jobs,
+        dict(state_token=new_token, purged=purged, full_refresh=False),
+    )
+
+
+def snapshot_delta(jobs_raw, previous):
+    """Compare a listing with the fingerprints of an earlier one.
+
+    Arguments:
+        jobs_raw {list[dict]} -- The current listing.
+        previous {dict[str, str]} -- The fingerprint of each job ID in the earlier listing.
+
+    Returns:
+        list[dict] -- The jobs that are new or whose fingerprint changed.
+        list[str] -- The job IDs that are no longer listed.
+    """
+    listed = set()
+    changed_jobs = []
+    for job in jobs_raw:
+        listed.add(job.get("id"))
+        if previous.get(job.get("id")) != job_fingerprint(job):
+            changed_jobs.append(job)
+    purged = sorted([job_id for job_id in previous if job_id not in listed])
+    return changed_jobs, purged
+
+
+def job_fingerprint(job):
+    """Summarize the parts of a listed job that change as it runs.
+
+    Arguments:
+        job {dict} -- A job as returned by Jobs.list or sdsf_to_raw.
+
+    Returns:
+        str -- A string that changes whenever the status of the job does.
+    """
+    return "|".join(
+        [
+            str(job.get(key) or "")
+            for key in ["status", "return", "queue", "position", "ended"]
+        ]
+    )
+
+
+def snapshot_query_key(params):
+    """Identify the filters a snapshot was taken with, so a token can not
+    be reused with different filters.
+
+    Arguments:
+        params {dict} -- The module parameters.
+
+    Returns:
+        str -- A digest of the filter parameters.
+    """
+    query = dict(
+        [
+            (option, params.get(option))
+            for option in [
+                "job_name",
+                "owner",
+                "job_id",
+                "status",
+                "min_rc",
+                "max_rc",
+                "backend",
+            ]
+            + TIME_FILTERS
+        ]
+    )
+    return sha256(json.dumps(query, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+def page_jobs(
+    jobs_raw, limit=None, offset=0, sort=None, sort_order="ascending", total=None
+):
+    """Sort the raw job listing and take one page of it.
+
+    Arguments:
+        jobs_raw {list[dict]} -- The jobs as returned by Jobs.list.
+
+    Keyword Arguments:
+        limit {int} -- The maximum number of jobs on the page. (default: {None})
+        offset {int} -- The number of jobs to skip. (default: {0})
+        sort {str} -- Sort by "job_id" or "job_name". (default: {None})
+        sort_order {str} -- "ascending" or "descending". (default: {"ascending"})
+        total {int} -- The number of jobs listed, when jobs_raw holds only
+            the first rows of the listing. (default: {None})
+
+    Returns:
+        list[dict] -- The jobs on the page.
+        int -- The number of jobs before paging.
+        Union[int, NoneType] -- The offset of the next page, or None on the last page.
+    """
+    if sort == "job_id":
+        jobs_raw = sorted(
+            jobs_raw,
+            key=lambda job: _job_number(job.get("id")),
+            reverse=sort_order == "descending",
+        )
+    elif sort == "job_name":
+        jobs_raw = sorted(
+            jobs_raw,
+            key=lambda job: (job.get("name") or "", _job_number(job.get("id"))),
+            reverse=sort_order == "descending",
+        )
+    if total is None:
+        total = len(jobs_raw)
+    offset = offset or 0
+    end = total if limit is None else min(total, offset + limit)
+    next_offset = end if end < total else None
+    return jobs_raw[offset:end], total, next_offset
+
+
+def _job_number(job_id):
+    digits = re.sub(r"[^0-9]", "", job_id or "")
+    return (int(digits) if digits else -1, job_id or "")
+
+
+def sdsf_to_raw(sdsf_job):
+    """Convert a job listed by list_jobs_sdsf to the form Jobs.list
+    returns, keeping the extra SDSF columns.
+
+    Arguments:
+        sdsf_job {dict} -- A job as returned by list_jobs_sdsf.
+
+    Returns:
+        dict -- The job with id, name, owner, status and return keys.
+    """
+    job = dict(sdsf_job)
+    job["id"] = job.pop("job_id")
+    job["name"] = job.pop("job_name")
+    ret_code = job.pop("ret_code").split()
+    if job.get("queue") == "EXECUTION":
+        job["status"], job["return"] = "AC", "?"
+    elif not ret_code:
+        job["status"], job["return"] = "?", "?"
+    elif ret_code[0] == "CC" and len(ret_code) > 1:
+        job["status"], job["return"] = "CC", ret_code[1]
+    elif ret_code[0] == "ABEND" and len(ret_code) > 1:
+        job["status"], job["return"] = "ABEND", ret_code[1]
+    elif job_status_class(" ".join(ret_code)) == "jcl_error":
+        job["status"], job["return"] = "JCLERR", "?"
+    else:
+        job["status"], job["return"] = " ".join(ret_code), "?"
+    return job
+
+
+def elapsed_seconds(started, ended, now=None):
+    """Compute the time a job spent executing.
+
+    Arguments:
+        started {str} -- When execution started, as "YYYY-MM-DD HH:MM:SS", or None.
+        ended {str} -- When execution ended, or None while the job is executing.
+
+    Keyword Arguments:
+        now {datetime} -- The current time. (default: {None})
+
+    Returns:
+        Union[int, NoneType] -- The elapsed seconds, or None if the job never started.
+    """
+    if not started:
+        return None
+    time_format = "%Y-%m-%d %H:%M:%S"
+    start = datetime.strptime(started, time_format)
+    end = datetime.strptime(ended, time_format) if ended else now or datetime.now()
+    return max(0, int((end - start).total_seconds()))
+
+
 def parsing_jobs(jobs_raw):
     jobs = []
     status = ""
@@ -261,6 +1245,17 @@ def parsing_jobs(jobs_raw):
             # 'job_status':status,
             "ret_code": ret_code,
         }
+        if "submitted" in job:
+            job_dict["job_class"] = job.get("class")
+            job_dict["system"] = job.get("system")
+            job_dict["queue"] = job.get("queue")
+            job_dict["position"] = job.get("position")
+            job_dict["submitted"] = job.get("submitted")
+            job_dict["started"] = job.get("started")
+            job_dict["ended"] = job.get("ended")
+            job_dict["elapsed_s"] = elapsed_seconds(
+                job.get("started"), job.get("ended")
+            )
         jobs.append(job_dict)
     return jobs
 
@@ -26,15 +26,127 @@ description:
 version_added: "2.9"
 options:
   src:
-    required: true
+    required: false
     type: str
     description:
       - The source directory or data set containing the JCL to submit.
+      - Required unless I(batch) is provided. Mutually exclusive with I(batch).
       - It could be physical sequential data set or a partitioned data set
         qualified by a member or a path. (e.g "USER.TEST","USER.JCL(TEST)")
       - Or an USS file. (e.g "/u/tester/demo/sample.jcl")
       - Or an LOCAL file in ansible control node.
         (e.g "/User/tester/ansible-playbook/sample.jcl")
+      - With I(location=DATA_SET) the member can be a pattern, where C(*)
+        matches any characters and C(?) or C(%) a single character.
+        (e.g "PROD.JCL(NIGHT*)") The directory is read once and every
+        matching member is submitted as if it was listed in I(batch), in
+        the order given by I(member_order).
+  batch:
+    required: false
+    type: list
+    elements: dict
+    description:
+      - A list of jobs to submit in a single module call.
+      - All jobs are read and handed to the internal reader from one REXX
+        session, so the cost of starting a process is paid once for the
+        whole list rather than once per job.
+      - The jobs are submitted in the order they are listed. I(wait),
+        I(wait_time_s), I(max_rc) and I(return_output) apply to each job.
+      - Mutually exclusive with I(src).
+    suboptions:
+      src:
+        required: true
+        type: str
+        description:
+          - The data set or USS file containing the JCL to submit.
+      location:
+        required: false
+        default: DATA_SET
+        type: str
+        choices:
+          - DATA_SET
+          - USS
+        description:
+          - The JCL location. LOCAL is not supported in I(batch).
+      volume:
+        required: false
+        type: str
+        description:
+          - The volume serial (VOLSER) where the data set resides when it is
+            not cataloged. Ignored for USS.
+  max_active:
+    required: false
+    type: int
+    description:
+      - Submit I(batch) so that at most I(max_active) of its jobs are queued
+        or running in each job class at the same time.
+      - The job class is read from the C(CLASS) parameter of each JOB
+        statement before anything is submitted. Jobs without C(CLASS) share
+        one limit.
+      - New jobs are submitted as earlier ones finish. With I(wait=true) the
+        module also waits for the last jobs to finish.
+      - I(wait_time_s) applies to the whole batch; the module fails if no job
+        starts or finishes within that many seconds.
+      - The time each job spent queued and executing is returned in
+        C(timings).
+      - Requires I(batch) or a member pattern in I(src).
+  member_order:
+    required: false
+    default: ascending
+    type: str
+    choices:
+      - ascending
+      - descending
+    description:
+      - The order in which the members matching a member pattern in I(src)
+        are submitted, by member name.
+  validate:
+    required: false
+    default: false
+    type: bool
+    description:
+      - Check the structure of the JCL before submitting it, so that most
+        JCL errors are found without a JES round trip.
+      - Checks the card columns, continuations, statement syntax, the
+        parameters of EXEC and DD statements, IF/ENDIF nesting and that
+        symbols are defined by a SET or PROC statement.
+      - Nothing is submitted if an error is found. Warnings, such as an
+        unknown DD parameter or an undefined symbol, do not stop the
+        submission.
+      - With I(location=LOCAL) the JCL is checked on the controller before
+        it is copied to z/OS.
+      - The findings are returned in C(validation). Not supported for data
+        sets that are not cataloged.
+  idempotency_key:
+    required: false
+    type: str
+    description:
+      - Skip jobs that already ran successfully, so that a rerun after a
+        partial failure does not submit them again.
+      - Each job is identified by a SHA-256 hash of its JCL and
+        I(idempotency_key). Changing either one submits the job again.
+      - When a job finishes with a return code of at most I(max_rc) (0 when
+        I(max_rc) is not set), its job ID, job name and return code are
+        recorded in I(idempotency_ledger).
+      - A job with a recorded run in the last I(idempotency_window_s) seconds
+        is not submitted; the recorded result is returned in C(jobs) with an
+        empty C(ddnames) and its job ID is listed in C(replayed).
+      - Requires I(wait=true). Not supported for data sets that are not
+        cataloged.
+  idempotency_window_s:
+    required: false
+    default: 86400
+    type: int
+    description:
+      - How many seconds a recorded run is reused for.
+  idempotency_ledger:
+    required: false
+    default: ~/.ansible/zos_job_submit_ledger.json
+    type: path
+    description:
+      - The USS file the runs are recorded in.
+      - Runs are kept for 30 days or I(idempotency_window_s), whichever is
+        longer.
   location:
     required: true
     default: DATA_SET
@@ -55,6 +167,9 @@ options:
     description:
       - Wait for the Job to finish and capture the output. Default is false.
       - User can specify the wait time, see option ``duration_s``.
+      - When false, JES is not queried after the submit. Each entry in
+        I(jobs) holds only the job ID and job name, use M(zos_job_harvest)
+        with the returned I(handles) to collect the results.
   wait_time_s:
     required: false
     default: 60
@@ -98,8 +213,9 @@ options:
       - IBM-1047
     description:
       - The encoding of the local JCL file on the ansible control node.
-      - If it is UTF-8, ASCII, ISO-8859-1, the file will be converted to EBCDIC
-        on the z/OS platform.
+      - If it is UTF-8, ASCII, ISO-8859-1, the file will be converted to
+        IBM-1047 on the ansible control node before it is copied to the z/OS
+        platform.
       - If it is EBCDIC, IBM-037, IBM-1047, the file will be unchanged when
         submitted on the z/OS platform.
 """
@@ -108,7 +224,11 @@ RETURN = r"""
 jobs:
   description:
      List of jobs output.
-  returned: success
+     When a batch fails part way through, only the I(job_id) of each job
+     that was already submitted is returned.
+     With I(wait=false) only the I(job_id) and I(job_name) of each job are
+     returned, I(ret_code) is null.
+  returned: success, or when a batch fails after some jobs were submitted
   type: list
   elements: dict
   contains:
@@ -426,8 +546,122 @@ jobs:
               "subsystem": "STL1"
           }
      ]
+handles:
+  description:
+     One handle per submitted job. Pass them to M(zos_job_harvest) to wait
+     for jobs submitted with I(wait=false).
+  returned: success
+  type: list
+  elements: dict
+  contains:
+    job_id:
+      description: The z/OS job ID of the submitted job.
+      type: str
+      sample: JOB00134
+    job_name:
+      description:
+         The name on the JOB statement of the submitted job. Null when the
+         submit response does not include it, only jobs submitted with
+         I(batch) or a member pattern report it.
+      type: str
+      sample: HELLO
+    submitted:
+      description:
+         The time the job was handed to JES, in seconds since the epoch.
+         Each job in a batch records its own time.
+      type: int
+      sample: 1584104408
+timings:
+  description:
+     The time each job spent waiting for an initiator and executing, when
+     I(max_active) is used. Times are measured by polling JES once per
+     second.
+  returned: when max_active is set
+  type: list
+  elements: dict
+  contains:
+    job_id:
+      description: The z/OS job ID.
+      type: str
+      sample: JOB00134
+    job_class:
+      description: The job class from the JOB statement.
+      type: str
+      sample: A
+    queue_wait_s:
+      description:
+        Seconds from submission until the job was seen executing or finished.
+      type: int
+      sample: 42
+    execution_s:
+      description:
+        Seconds from the job being seen executing until it finished. Null
+        when the job had not finished when the module returned.
+      type: int
+      sample: 7
+retry_stats:
+  description:
+     How often JES was queried again because a submitted job was not listed
+     yet, and how long was spent waiting between attempts.
+  returned: success
+  type: dict
+  contains:
+    attempts:
+      description: The number of queries made.
+      type: int
+      sample: 4
+    retries:
+      description: The number of queries that had to be repeated.
+      type: int
+      sample: 2
+    wait_s:
+      description: The number of seconds spent waiting between queries.
+      type: float
+      sample: 0.31
+validation:
+  description:
+     The findings of the JCL validation, in the order of the jobs and
+     lines. Each finding with severity C(error) would have failed in JES.
+  returned: when validate is true
+  type: list
+  elements: dict
+  contains:
+    src:
+      description: The JCL the finding is in.
+      type: str
+      sample: TEST.JCL(NIGHTLY)
+    line:
+      description: The line number.
+      type: int
+      sample: 12
+    severity:
+      description: C(error) or C(warning).
+      type: str
+      sample: error
+    message:
+      description: What was found.
+      type: str
+      sample: A continued parameter must start in columns 4 through 16.
+members:
+  description:
+     The data sets matching a member pattern in I(src), in the order they
+     were submitted.
+  returned: when src is a member pattern
+  type: list
+  elements: str
+  sample: ["PROD.JCL(NIGHT01)", "PROD.JCL(NIGHT02)"]
+replayed:
+  description:
+     The job IDs of recorded runs that were returned instead of submitting
+     the job again.
+  returned: when idempotency_key is set
+  type: list
+  elements: str
+  sample: ["JOB00134"]
 changed:
-  description: Indicates if any changes were made during module operation.
+  description:
+     Indicates if any changes were made during module operation. False when
+     every job was replayed from I(idempotency_ledger).
   type: bool
   returned: success
 message:
@@ -475,29 +709,96 @@ EXAMPLES = r"""
     location: DATA_SET
     wait: true
     wait_time_s: 30
+
+- name: Submit a stream of jobs in one call
+  zos_job_submit:
+    batch:
+      - src: TEST.UTILs(STEP1)
+      - src: TEST.UNCATLOG.JCL(STEP2)
+        volume: P2SS01
+      - src: /u/tester/demo/step3.jcl
+        location: USS
+    wait: false
+
+- name: Submit a large stream with at most 4 jobs active per job class
+  zos_job_submit:
+    batch: "{{ nightly_jobs }}"
+    max_active: 4
+    wait: true
+    wait_time_s: 600
+
+- name: Submit every NIGHT member, at most 2 active per job class
+  zos_job_submit:
+    src: PROD.JCL(NIGHT*)
+    location: DATA_SET
+    member_order: ascending
+    max_active: 2
+    wait: true
+
+- name: Check the JCL and submit it only if it has no errors
+  zos_job_submit:
+    src: TEST.JCL(NIGHTLY)
+    location: DATA_SET
+    validate: true
+
+- name: Submit a job unless it already completed in the last 12 hours
+  zos_job_submit:
+    src: TEST.JCL(NIGHTLY)
+    location: DATA_SET
+    wait: true
+    max_rc: 4
+    idempotency_key: "nightly-{{ ansible_date_time.date }}"
+    idempotency_window_s: 43200
 """
 
 from ansible.module_utils.basic import AnsibleModule
-from pipes import quote
 
 try:
     from zoautil_py import Jobs
 except Exception:
     Jobs = ""
-from time import sleep
+from time import sleep, time
+from hashlib import sha256
 from os import chmod, path, remove
 from tempfile import NamedTemporaryFile
+from fnmatch import fnmatchcase
 import re
-from ansible_collections.ibm.ibm_zos_core.plugins.module_utils.job import job_output
+from ansible_collections.ibm.ibm_zos_core.plugins.module_utils.job import (
+    job_complete,
+    job_output,
+)
 from ansible_collections.ibm.ibm_zos_core.plugins.module_utils.better_arg_parser import (
     BetterArgParser,
 )
+from ansible_collections.ibm.ibm_zos_core.plugins.module_utils.data_set_utils import (
+    DataSetUtils,
+)
+from ansible_collections.ibm.ibm_zos_core.plugins.module_utils.jcl import (
+    decode_jcl,
+    jcl_errors,
+    validate_jcl,
+)
+from ansible_collections.ibm.ibm_zos_core.plugins.module_utils.retry import (
+    RetryPolicy,
+)
+from ansible_collections.ibm.ibm_zos_core.plugins.module_utils.state_file import (
+    read_state,
+    update_state,
+)
 from stat import S_IEXEC, S_IREAD, S_IWRITE
 
 """time between job query checks to see if a job has completed, default 1 second"""
 POLLING_INTERVAL = 1
 POLLING_COUNT = 60
 
+"""recorded runs are kept in the ledger for at least 30 days"""
+LEDGER_RETENTION_S = 30 * 24 * 60 * 60
+
+"""a partitioned data set with a member pattern, e.g. PROD.JCL(NIGHT*)"""
+MEMBER_PATTERN_REGEX = r"^((?:[A-Z][A-Z0-9]{0,7}[.]){1,21}[A-Z][A-Z0-9]{0,7})\(([A-Z0-9*?%]{1,8})\)$"
+
+LOCAL_ENCODINGS = ["UTF-8", "ASCII", "ISO-8859-1", "EBCDIC", "IBM-037", "IBM-1047"]
+
 
 def submit_pds_jcl(src):
     """ A wrapper around zoautil_py Jobs submit to raise exceptions on failure. """
@@ -536,7 +837,7 @@ ADDRESS MVS "EXECIO * DISKR TEST (STEM A."
 X = SUBMIT('A.')
 SAY X
 """
-    rc, stdout, stderr = copy_rexx_and_run(script, src, vol, module)
+    rc, stdout, stderr = copy_rexx_and_run(script, [src, vol], module)
     if "Error" in stdout:
         raise SubmitJCLError("SUBMIT JOB FAILED: " + stdout)
     elif "" == stdout:
@@ -545,7 +846,173 @@ SAY X
     return jobId
 
 
-def copy_rexx_and_run(script, src, vol, module):
+def run_bulk_engine(sources, mode, module):
+    """ Read many JCL sources from a single REXX session. The sources are
+    listed in a control file. In SUBMIT mode each job is handed to the
+    internal reader with the TSO/E SUBMIT function and the job ID JES
+    assigned is returned, followed by the submit time and the job name
+    from the JOB statement. In SCAN mode the JOB statement of each source is returned
+    instead and nothing is submitted.
+
+    Arguments:
+        sources {list[dict]} -- Each item holds the location, src and volume of one job.
+        mode {str} -- Either SUBMIT or SCAN.
+        module {AnsibleModule} -- The AnsibleModule object from the running module.
+
+    Returns:
+        dict[int, str] -- The text reported for each source, keyed by its index in sources.
+    """
+    script = """/*REXX*/
+PARSE ARG CTLFILE MODE
+ADDRESS TSO
+CALL SYSCALLS 'ON'
+ADDRESS SYSCALL "READFILE (CTLFILE) REQ."
+IF RETVAL = -1 THEN DO
+  SAY '0 Error UNABLE TO READ CONTROL FILE' ERRNO
+  EXIT 8
+END
+DO IX = 1 TO REQ.0
+  /* a USS path is the rest of the line, it may contain blanks */
+  PARSE VAR REQ.IX LOC REST
+  IF LOC = 'USS' THEN SRC = REST
+  ELSE PARSE VAR REST SRC VOL
+  DROP JCL.
+  IF LOC = 'USS' THEN DO
+    ADDRESS SYSCALL "READFILE (SRC) JCL."
+    IF RETVAL = -1 THEN DO
+      SAY IX 'Error UNABLE TO READ' SRC ERRNO
+      ITERATE
+    END
+  END
+  ELSE DO
+    ALLOCCMD = "ALLOC DA('"SRC"') FI(JCLIN) SHR"
+    IF VOL <> '' THEN ALLOCCMD = ALLOCCMD "VOL("VOL")"
+    IF BPXWDYN(ALLOCCMD) <> 0 THEN DO
+      SAY IX 'Error UNABLE TO ALLOCATE' SRC
+      ITERATE
+    END
+    ADDRESS MVS "EXECIO * DISKR JCLIN (STEM JCL. FINIS"
+    READRC = RC
+    CALL BPXWDYN "FREE FI(JCLIN)"
+    IF READRC <> 0 THEN DO
+      SAY IX 'Error UNABLE TO READ' SRC READRC
+      ITERATE
+    END
+  END
+  IF MODE = 'SCAN' THEN DO
+    CARD = ''
+    DO JX = 1 TO JCL.0
+      LINE = STRIP(TRANSLATE(LEFT(JCL.JX, 71)), 'T')
+      IF CARD = '' & WORD(LINE, 2) <> 'JOB' THEN ITERATE
+      CARD = CARD STRIP(SUBSTR(LINE, 3))
+      IF RIGHT(LINE, 1) <> ',' THEN LEAVE
+    END
+    SAY IX 'JOB' CARD
+    ITERATE
+  END
+  JOBNAME = ''
+  DO JX = 1 TO JCL.0
+    LINE = TRANSLATE(LEFT(JCL.JX, 71))
+    IF LEFT(LINE, 2) = '//' & WORD(LINE, 2) = 'JOB' THEN DO
+      JOBNAME = SUBSTR(WORD(LINE, 1), 3)
+      LEAVE
+    END
+  END
+  JOBID = SUBMIT('JCL.')
+  IF JOBID = '' | POS('Error', JOBID) > 0 THEN DO
+    SAY IX JOBID
+    ITERATE
+  END
+  /* the time JES accepted this job, in seconds since the epoch */
+  ADDRESS SYSCALL "time"
+  SAY IX JOBID RETVAL JOBNAME
+END
+RETURN 0
+"""
+    control_file = NamedTemporaryFile(delete=True)
+    with open(control_file.name, "w") as f:
+        for source in sources:
+            if source.get("location") == "USS":
+                f.write("USS {0}\n".format(source.get("src")))
+            else:
+                f.write(
+                    "DATA_SET {0} {1}\n".format(
+                        source.get("src").upper(), (source.get("volume") or "").upper()
+                    )
+                )
+    rc, stdout, stderr = copy_rexx_and_run(script, [control_file.name, mode], module)
+    if rc != 0 and not stdout:
+        raise SubmitJCLError("SUBMIT JOB FAILED: " + stderr)
+    reported = {}
+    for line in stdout.splitlines():
+        index, sep, text = line.strip().partition(" ")
+        if index.isdigit() and 0 < int(index) <= len(sources):
+            reported[int(index) - 1] = text.strip()
+    return reported
+
+
+def submit_jcl_bulk(sources, module):
+    """ Submit many jobs from a single REXX session.
+
+    Arguments:
+        sources {list[dict]} -- Each item holds the location, src and volume of one job.
+        module {AnsibleModule} -- The AnsibleModule object from the running module.
+
+    Returns:
+        list[dict] -- For each source, in order, the job_id, job_name and
+            submitted time or the error message.
+    """
+    reported = run_bulk_engine(sources, "SUBMIT", module)
+    submitted = []
+    for index in range(len(sources)):
+        text = reported.get(index, "")
+        if not text:
+            submitted.append(
+                dict(job_id=None, msg="NO JOB ID IS RETURNED. PLEASE CHECK THE JCL.")
+            )
+        elif "Error" in text:
+            submitted.append(dict(job_id=None, msg="SUBMIT JOB FAILED: " + text))
+        else:
+            words = text.split()
+            submit_time = words[1] if len(words) > 1 else ""
+            submitted.append(
+                dict(
+                    job_id=words[0],
+                    job_name=words[2] if len(words) > 2 else None,
+                    submitted=int(submit_time) if submit_time.isdigit() else int(time()),
+                    msg="",
+                )
+            )
+    return submitted
+
+
+def read_job_classes(sources, module):
+    """ Read the job class from the JOB statement of each source
+    without submitting anything.
+
+    Arguments:
+        sources {list[dict]} -- Each item holds the location, src and volume of one job.
+        module {AnsibleModule} -- The AnsibleModule object from the running module.
+
+    Returns:
+        list[str] -- The job class of each source, None when the JOB statement has no CLASS.
+    """
+    reported = run_bulk_engine(sources, "SCAN", module)
+    classes = []
+    for index, source in enumerate(sources):
+        card = reported.get(index, "")
+        if not card.startswith("JOB"):
+            raise SubmitJCLError(
+                "UNABLE TO READ THE JOB STATEMENT OF {0}: {1}".format(
+                    source.get("src"), card
+                )
+            )
+        match = re.search(r"\bCLASS=([A-Z0-9$#@])", card)
+        classes.append(match.group(1) if match else None)
+    return classes
+
+
+def copy_rexx_and_run(script, args, module):
     delete_on_close = True
     tmp_file = NamedTemporaryFile(delete=delete_on_close)
     with open(tmp_file.name, "w") as f:
@@ -553,18 +1020,18 @@ def copy_rexx_and_run(script, src, vol, module):
     chmod(tmp_file.name, S_IEXEC | S_IREAD | S_IWRITE)
     pathName = path.dirname(tmp_file.name)
     scriptName = path.basename(tmp_file.name)
-    rc, stdout, stderr = module.run_command(["./" + scriptName, src, vol], cwd=pathName)
+    rc, stdout, stderr = module.run_command(["./" + scriptName] + args, cwd=pathName)
     return rc, stdout, stderr
 
 
-def get_job_info(module, jobId, return_output):
+def get_job_info(module, jobId, return_output, retry_policy):
     result = dict()
     try:
-        output = query_jobs_status(jobId)
+        output = query_jobs_status(jobId, retry_policy)
     except SubmitJCLError:
         raise
 
-    result = job_output(module, job_id=jobId)
+    result = job_output(module, job_id=jobId, retry_policy=retry_policy)
 
     if not return_output:
         for job in result.get("jobs", []):
@@ -575,26 +1042,21 @@ def get_job_info(module, jobId, return_output):
     return result
 
 
-def query_jobs_status(jobId):
-    timeout = 10
+def query_jobs_status(jobId, retry_policy):
     output = None
-    while output is None and timeout > 0:
-        try:
-            output = Jobs.list(job_id=jobId)
-            sleep(1)
-            timeout = timeout - 1
-        except IndexError:
-            pass
-        except Exception as e:
-            raise SubmitJCLError(
-                repr(e)
-                + """
-            The output is """
-                + output
-            )
-    if output is None and timeout == 0:
+    try:
+        output = retry_policy.run(
+            lambda: Jobs.list(job_id=jobId), retry_if=lambda jobs: not jobs
+        )
+    except IndexError:
+        pass
+    except Exception as e:
+        raise SubmitJCLError(repr(e))
+    if not output:
         raise SubmitJCLError(
-            "THE JOB CAN NOT BE QUERIED FROM JES (TIMEOUT=10s). PLEASE CHECK THE ZOS SYSTEM. IT IS SLOW TO RESPONSE."
+            "THE JOB CAN NOT BE QUERIED FROM JES (TIMEOUT={0}s). PLEASE CHECK THE ZOS SYSTEM. IT IS SLOW TO RESPONSE.".format(
+                retry_policy.deadline_s
+            )
         )
     return output
 
@@ -671,7 +1133,7 @@ def data_set_or_path_type(contents, resolve_dependencies):
         r"^(?:(?:[A-Z]{1}[A-Z0-9]{0,7})(?:[.]{1})){1,21}[A-Z]{1}[A-Z0-9]{0,7}(?:\([A-Z]{1}[A-Z0-9]{0,7}\)){0,1}$",
         str(contents),
         re.IGNORECASE,
-    ):
+    ) and not re.fullmatch(MEMBER_PATTERN_REGEX, str(contents), re.IGNORECASE):
         if not path.isabs(str(contents)):
             raise ValueError(
                 'Invalid argument type for "{0}". expected "data_set" or "path"'.format(
@@ -689,19 +1151,327 @@ def encoding_type(contents, resolve_dependencies):
     return str(contents)
 
 
+def wait_for_job(jobId, wait_time_s, retry_policy):
+    """ Poll JES until the job is no longer active or wait_time_s elapses.
+    Returns the number of seconds waited. """
+    duration = 0
+    waitJob = query_jobs_status(jobId, retry_policy)
+    while waitJob[0].get("status") == "AC":  # AC means in progress
+        sleep(1)
+        duration = duration + 1
+        waitJob = Jobs.list(job_id=jobId)
+        if waitJob[0].get("status") == "CC":  # CC means completed
+            break
+        if duration == wait_time_s:  # Long running task. timeout return
+            break
+    return duration
+
+
+def job_handle(job_id, job_name=None, submitted=None):
+    """ The handle returned for a submitted job, submitted defaults to now. """
+    return dict(
+        job_id=job_id,
+        job_name=job_name,
+        submitted=submitted if submitted is not None else int(time()),
+    )
+
+
+def submit_batch(batch, module):
+    """ Submit every job in batch through the bulk submission engine.
+    Returns the handle of each job, in the order of batch.
+    Raises SubmitJCLError listing each job that could not be submitted. """
+    for job in batch:
+        if job.get("location") == "LOCAL":
+            raise SubmitJCLError(
+                "LOCAL location is not supported in batch: " + job.get("src")
+            )
+    submitted = submit_jcl_bulk(batch, module)
+    failures = [
+        "{0}: {1}".format(job.get("src"), status.get("msg"))
+        for job, status in zip(batch, submitted)
+        if not status.get("job_id")
+    ]
+    if failures:
+        job_ids = [status.get("job_id") for status in submitted if status.get("job_id")]
+        raise SubmitJCLError(
+            "SUBMIT JOB FAILED FOR {0} OF {1} JOBS. {2}. SUBMITTED: {3}".format(
+                len(failures), len(batch), "; ".join(failures), ", ".join(job_ids)
+            ),
+            job_ids,
+        )
+    return [
+        job_handle(status.get("job_id"), status.get("job_name"), status.get("submitted"))
+        for status in submitted
+    ]
+
+
+def submitted_job_ids(timings):
+    return [timing.get("job_id") for timing in timings if timing.get("job_id")]
+
+
+def submit_throttled(batch, max_active, wait_time_s, wait, module):
+    """ Submit the batch so that at most max_active of its jobs are
+    queued or running in each job class at any time. New jobs are fed
+    in as earlier ones finish, based on the status reported by Jobs.list.
+
+    Arguments:
+        batch {list[dict]} -- Each item holds the location, src and volume of one job.
+        max_active {int} -- The number of unfinished jobs allowed per job class.
+        wait_time_s {int} -- Give up when no job starts or finishes within this many seconds.
+        wait {bool} -- Whether to wait for the last jobs to finish.
+        module {AnsibleModule} -- The AnsibleModule object from the running module.
+
+    Raises:
+        SubmitJCLError: When a wave fails to submit or no progress is made
+            within wait_time_s, with the job IDs submitted so far.
+
+    Returns:
+        list[dict] -- The handle of each job, in the order of batch.
+        list[dict] -- The class, queue wait and execution time of each job.
+    """
+    classes = read_job_classes(batch, module)
+    queue = list(range(len(batch)))
+    in_flight = {}
+    timings = [
+        dict(job_id=None, job_class=job_class, submitted=None, started=None, ended=None)
+        for job_class in classes
+    ]
+    handles = [None] * len(batch)
+    last_change = time()
+    while queue or (wait and in_flight):
+        active = {}
+        for index in in_flight.values():
+            active[classes[index]] = active.get(classes[index], 0) + 1
+        wave = []
+        for index in list(queue):
+            if active.get(classes[index], 0) < max_active:
+                wave.append(index)
+                queue.remove(index)
+                active[classes[index]] = active.get(classes[index], 0) + 1
+        if wave:
+            try:
+                wave_handles = submit_batch([batch[index] for index in wave], module)
+            except SubmitJCLError as e:
+                e.job_ids = submitted_job_ids(timings) + e.job_ids
+                raise
+            last_change = time()
+            for index, handle in zip(wave, wave_handles):
+                in_flight[handle.get("job_id")] = index
+                handles[index] = handle
+                timings[index].update(job_id=handle.get("job_id"), submitted=last_change)
+        if not queue and not wait:
+            break
+        sleep(POLLING_INTERVAL)
+        for job_id, index in list(in_flight.items()):
+            try:
+                status = Jobs.list(job_id=job_id)[0].get("status")
+            except IndexError:
+                continue
+            now = time()
+            if timings[index].get("started") is None and status == "AC":
+                timings[index]["started"] = now
+                last_change = now
+            if job_complete(status):
+                if timings[index].get("started") is None:
+                    timings[index]["started"] = now
+                timings[index]["ended"] = now
+                del in_flight[job_id]
+                last_change = now
+        if time() - last_change > wait_time_s:
+            raise SubmitJCLError(
+                "NO JOB STARTED OR FINISHED WITHIN {0} SECONDS. STILL ACTIVE: {1}. NOT SUBMITTED: {2}".format(
+                    wait_time_s,
+                    ", ".join(in_flight),
+                    ", ".join([batch[index].get("src") for index in queue]),
+                ),
+                submitted_job_ids(timings),
+            )
+    job_timings = []
+    for timing in timings:
+        job_timing = dict(
+            job_id=timing.get("job_id"),
+            job_class=timing.get("job_class"),
+            queue_wait_s=None,
+            execution_s=None,
+        )
+        if timing.get("started") is not None:
+            job_timing["queue_wait_s"] = int(
+                round(timing.get("started") - timing.get("submitted"))
+            )
+        if timing.get("ended") is not None:
+            job_timing["execution_s"] = int(
+                round(timing.get("ended") - timing.get("started"))
+            )
+        job_timings.append(job_timing)
+    return handles, job_timings
+
+
+def expand_member_pattern(src, member_order, module):
+    """Find the members of a partitioned data set matching a member pattern.
+
+    Arguments:
+        src {str} -- The data set and member pattern, e.g. PROD.JCL(NIGHT*).
+        member_order {str} -- Either ascending or descending by member name.
+        module {AnsibleModule} -- The AnsibleModule object from the running module.
+
+    Raises:
+        SubmitJCLError: When the directory can not be read or no member matches.
+
+    Returns:
+        list[str] -- The matching members as data set names, e.g. PROD.JCL(NIGHT01).
+    """
+    data_set, pattern = re.fullmatch(MEMBER_PATTERN_REGEX, src.upper()).groups()
+    try:
+        members = DataSetUtils.list_members(module, data_set)
+    except Exception as e:
+        raise SubmitJCLError("UNABLE TO READ THE DIRECTORY OF {0}: {1}".format(data_set, repr(e)))
+    pattern = pattern.replace("%", "?")
+    members = sorted(
+        [member for member in members if fnmatchcase(member, pattern)],
+        reverse=member_order == "descending",
+    )
+    if not members:
+        raise SubmitJCLError("NO MEMBER OF {0} MATCHES {1}".format(data_set, src))
+    return ["{0}({1})".format(data_set, member) for member in members]
+
+
+def read_jcl_source(job, module):
+    """Read the contents of the JCL a job would be submitted from.
+
+    Arguments:
+        job {dict} -- The location, src and volume of the job.
+        module {AnsibleModule} -- The AnsibleModule object from the running module.
+
+    Raises:
+        SubmitJCLError: When the source can not be read.
+
+    Returns:
+        bytes -- The contents of the source.
+    """
+    if job.get("location") == "DATA_SET":
+        if job.get("volume"):
+            raise SubmitJCLError(
+                "UNABLE TO READ UNCATALOGED DATA SET {0}".format(
+                    job.get("src")
+                )
+            )
+        rc, stdout, stderr = module.run_command(
+            ["cat", "//'{0}'".format(job.get("src"))]
+        )
+        if rc != 0:
+            raise SubmitJCLError(
+                "UNABLE TO READ {0}: {1}".format(job.get("src"), stderr.strip())
+            )
+        return stdout.encode("utf-8")
+    try:
+        with open(job.get("src"), "rb") as jcl_file:
+            return jcl_file.read()
+    except (IOError, OSError) as e:
+        raise SubmitJCLError("UNABLE TO READ {0}: {1}".format(job.get("src"), str(e)))
+
+
+def validate_sources(sources, contents):
+    """Check the structure of the JCL of each job without submitting it.
+
+    Arguments:
+        sources {list[dict]} -- The location and src of each job.
+        contents {list[bytes]} -- The contents of each source, as read by read_jcl_source.
+
+    Returns:
+        list[dict] -- The findings of validate_jcl with the src they were found in.
+    """
+    findings = []
+    for job, source in zip(sources, contents):
+        # cat converts data sets to the encoding of the shell, USS files are read as is
+        encoding = "UTF-8" if job.get("location") == "DATA_SET" else None
+        for finding in validate_jcl(decode_jcl(source, encoding)):
+            findings.append(dict(src=job.get("src"), **finding))
+    return findings
+
+
+def idempotency_digest(contents, idempotency_key):
+    """Compute the key a job run is recorded under in the ledger.
+
+    Arguments:
+        contents {bytes} -- The JCL that is submitted.
+        idempotency_key {str} -- The key supplied by the user.
+
+    Returns:
+        str -- The hex SHA-256 digest of the JCL and the key.
+    """
+    digest = sha256(contents)
+    digest.update(b"\0")
+    digest.update(idempotency_key.encode("utf-8"))
+    return digest.hexdigest()
+
+
+def find_recorded_runs(digests, ledger, window_s, now):
+    """Find the jobs that already ran successfully within the window.
+
+    Arguments:
+        digests {list[str]} -- The digest of each job, in submission order.
+        ledger {dict} -- The ledger, keyed by digest.
+        window_s {int} -- How many seconds a recorded run stays valid.
+        now {float} -- The current time.
+
+    Returns:
+        dict -- The recorded run for each position in digests that has one.
+    """
+    recorded_runs = {}
+    for index, digest in enumerate(digests):
+        entry = ledger.get(digest)
+        if entry and now - entry.get("recorded", 0) <= window_s:
+            recorded_runs[index] = entry
+    return recorded_runs
+
+
+def record_runs(ledger, runs, window_s, now):
+    """Add successful runs to the ledger and drop expired entries.
+
+    Arguments:
+        ledger {dict} -- The ledger, keyed by digest; changed in place.
+        runs {dict} -- The entries to record, keyed by digest.
+        window_s {int} -- How many seconds a recorded run stays valid.
+        now {float} -- The current time.
+    """
+    retention_s = max(window_s, LEDGER_RETENTION_S)
+    for digest in list(ledger):
+        if now - ledger[digest].get("recorded", 0) > retention_s:
+            del ledger[digest]
+    ledger.update(runs)
+
+
 def run_module():
 
     module_args = dict(
-        src=dict(type="str", required=True),
+        src=dict(type="str", required=False),
+        batch=dict(
+            type="list",
+            elements="dict",
+            required=False,
+            options=dict(
+                src=dict(type="str", required=True),
+                location=dict(
+                    type="str", default="DATA_SET", choices=["DATA_SET", "USS"],
+                ),
+                volume=dict(type="str", required=False),
+            ),
+        ),
+        max_active=dict(type="int", required=False),
+        member_order=dict(
+            type="str", default="ascending", choices=["ascending", "descending"]
+        ),
+        validate=dict(type="bool", required=False, default=False),
+        idempotency_key=dict(type="str", required=False, no_log=False),
+        idempotency_window_s=dict(type="int", default=86400),
+        idempotency_ledger=dict(
+            type="path", default="~/.ansible/zos_job_submit_ledger.json"
+        ),
         wait=dict(type="bool", required=False),
         location=dict(
             type="str", default="DATA_SET", choices=["DATA_SET", "USS", "LOCAL"],
         ),
-        encoding=dict(
-            type="str",
-            default="UTF-8",
-            choices=["UTF-8", "ASCII", "ISO-8859-1", "EBCDIC", "IBM-037", "IBM-1047"],
-        ),
+        encoding=dict(type="str", default="UTF-8", choices=LOCAL_ENCODINGS,),
         volume=dict(type="str", required=False),
         return_output=dict(type="bool", required=False, default=True),
         wait_time_s=dict(type="int", default=60),
@@ -709,10 +1479,37 @@ def run_module():
         temp_file=dict(type="path", required=False),
     )
 
-    module = AnsibleModule(argument_spec=module_args, supports_check_mode=True)
+    module = AnsibleModule(
+        argument_spec=module_args,
+        supports_check_mode=True,
+        mutually_exclusive=[["src", "batch"]],
+        required_one_of=[["src", "batch"]],
+    )
 
     arg_defs = dict(
-        src=dict(arg_type=data_set_or_path_type, required=True),
+        src=dict(arg_type=data_set_or_path_type, required=False),
+        batch=dict(
+            arg_type="list",
+            elements="dict",
+            required=False,
+            options=dict(
+                src=dict(arg_type=data_set_or_path_type, required=True),
+                location=dict(
+                    arg_type="str", default="DATA_SET", choices=["DATA_SET", "USS"],
+                ),
+                volume=dict(arg_type="volume", required=False),
+            ),
+        ),
+        max_active=dict(arg_type="int", required=False),
+        member_order=dict(
+            arg_type="str", default="ascending", choices=["ascending", "descending"]
+        ),
+        validate=dict(arg_type="bool", default=False),
+        idempotency_key=dict(arg_type="str", required=False),
+        idempotency_window_s=dict(arg_type="int", default=86400),
+        idempotency_ledger=dict(
+            arg_type="path", default="~/.ansible/zos_job_submit_ledger.json"
+        ),
         wait=dict(arg_type="bool", required=False),
         location=dict(
             arg_type="str", default="DATA_SET", choices=["DATA_SET", "USS", "LOCAL"],
@@ -723,6 +1520,7 @@ def run_module():
         wait_time_s=dict(arg_type="int", required=False, default=60),
         max_rc=dict(arg_type="int", required=False),
         temp_file=dict(arg_type="path", required=False),
+        mutually_exclusive=[["src", "batch"]],
     )
 
     parser = BetterArgParser(arg_defs)
@@ -734,103 +1532,239 @@ def run_module():
     volume = parsed_args.get("volume")
     wait = parsed_args.get("wait")
     src = parsed_args.get("src")
+    batch = parsed_args.get("batch")
+    max_active = parsed_args.get("max_active")
+    member_order = parsed_args.get("member_order")
+    validate = parsed_args.get("validate")
+    idempotency_key = parsed_args.get("idempotency_key")
+    idempotency_window_s = parsed_args.get("idempotency_window_s")
+    idempotency_ledger = parsed_args.get("idempotency_ledger")
     return_output = parsed_args.get("return_output")
     wait_time_s = parsed_args.get("wait_time_s")
     max_rc = parsed_args.get("max_rc")
     # get temporary file names for copied files
     temp_file = parsed_args.get("temp_file")
-    if temp_file:
-        temp_file_2 = NamedTemporaryFile(delete=True)
 
     if wait_time_s <= 0:
         module.fail_json(
             msg="The option wait_time_s is not valid it just be greater than 0.",
             **result
         )
+    member_pattern = (
+        location == "DATA_SET"
+        and src is not None
+        and re.fullmatch(MEMBER_PATTERN_REGEX, src, re.IGNORECASE)
+        and re.search(r"[*?%]", src)
+    )
+    if member_pattern and volume:
+        module.fail_json(
+            msg="A member pattern in src is not supported with volume.", **result
+        )
+    if max_active is not None and (max_active <= 0 or not (batch or member_pattern)):
+        module.fail_json(
+            msg="The option max_active must be greater than 0 and requires batch or a member pattern in src.",
+            **result
+        )
+    if idempotency_key and wait is not True:
+        module.fail_json(
+            msg="The option idempotency_key requires wait=true, the return code of each job is recorded.",
+            **result
+        )
+
+    if member_pattern:
+        try:
+            result["members"] = expand_member_pattern(src, member_order, module)
+        except Exception as e:
+            module.fail_json(msg=repr(e), **result)
+        batch = [dict(src=member, location="DATA_SET") for member in result.get("members")]
+        src = None
 
     DSN_REGEX = r"^(([A-Z]{1}[A-Z0-9]{0,7})([.]{1})){1,21}[A-Z]{1}[A-Z0-9]{0,7}([(]([A-Z]{1}[A-Z0-9]{0,7})[)]){0,1}?$"
 
     # calculate the job elapse time
     duration = 0
+    handles = []
+    timings = None
+    digests = []
+    recorded_runs = {}
+    if idempotency_key or validate:
+        if batch:
+            sources = batch
+        elif location == "LOCAL":
+            sources = [dict(location="USS", src=temp_file)]
+        else:
+            sources = [dict(location=location, src=src, volume=volume)]
+        try:
+            contents = [read_jcl_source(job, module) for job in sources]
+            if validate:
+                result["validation"] = validate_sources(sources, contents)
+            if idempotency_key:
+                digests = [
+                    idempotency_digest(source, idempotency_key) for source in contents
+                ]
+                recorded_runs = find_recorded_runs(
+                    digests,
+                    read_state(idempotency_ledger),
+                    idempotency_window_s,
+                    time(),
+                )
+        except Exception as e:
+            if temp_file:
+                remove(temp_file)
+            module.fail_json(msg=repr(e), **result)
+        if jcl_errors(result.get("validation", [])):
+            if temp_file:
+                remove(temp_file)
+            module.fail_json(
+                msg="JCL validation failed, no job was submitted.", **result
+            )
+    if batch:
+        pending = [index for index in range(len(batch)) if index not in recorded_runs]
+        batch = [batch[index] for index in pending]
+    else:
+        pending = [0] if not recorded_runs else []
     try:
-        if location == "DATA_SET":
+        if not pending:
+            # every job has a recorded run in the idempotency ledger
+            pass
+        elif batch:
+            data_set_name_pattern = re.compile(DSN_REGEX, re.IGNORECASE)
+            for job in batch:
+                if job.get("location") == "DATA_SET" and not data_set_name_pattern.fullmatch(
+                    job.get("src")
+                ):
+                    module.fail_json(
+                        msg="The parameter src for data set is not a valid name pattern: {0}".format(
+                            job.get("src")
+                        ),
+                        **result
+                    )
+            if max_active:
+                start = time()
+                handles, timings = submit_throttled(
+                    batch, max_active, wait_time_s, wait, module
+                )
+                duration = int(round(time() - start))
+            else:
+                handles = submit_batch(batch, module)
+        elif location == "DATA_SET":
             data_set_name_pattern = re.compile(DSN_REGEX, re.IGNORECASE)
             check = data_set_name_pattern.fullmatch(src)
             if check:
                 if volume is None or volume == "":
-                    jobId = submit_pds_jcl(src)
+                    handles.append(job_handle(submit_pds_jcl(src)))
                 else:
-                    jobId = submit_jcl_in_volume(src, volume, module)
+                    handles.append(job_handle(submit_jcl_in_volume(src, volume, module)))
             else:
                 module.fail_json(
                     msg="The parameter src for data set is not a valid name pattern. Please check the src input.",
                     **result
                 )
         elif location == "USS":
-            jobId = submit_uss_jcl(src, module)
+            handles.append(job_handle(submit_uss_jcl(src, module)))
         else:
             # For local file, it has been copied to the temp directory in action plugin.
-            encoding = parsed_args.get("encoding")
-            if encoding == "EBCDIC" or encoding == "IBM-037" or encoding == "IBM-1047":
-                jobId = submit_uss_jcl(temp_file, module)
-            # 'UTF-8' 'ASCII' encoding will be converted.
-            elif (
-                encoding == "UTF-8"
-                or encoding == "ISO-8859-1"
-                or encoding == "ASCII"
-                or encoding is None
-            ):
-                (conv_rc, stdout, stderr) = module.run_command(
-                    "iconv -f ISO8859-1 -t IBM-1047 %s > %s"
-                    % (quote(temp_file), quote(temp_file_2.name)),
-                    use_unsafe_shell=True,
-                )
-                if conv_rc == 0:
-                    jobId = submit_uss_jcl(temp_file_2.name, module)
-                else:
-                    module.fail_json(
-                        msg="The Local file encoding conversion failed. Please check the source file."
-                        + stderr,
-                        **result
-                    )
-            else:
-                module.fail_json(
-                    msg=(
-                        "The Local file encoding format is not supported."
-                        "The supported encoding is UTF-8, ASCII, ISO-8859-1, EBCDIC, IBM-037, IBM-1047. Default is UTF-8."
-                    ),
-                    **result
-                )
+            # 'UTF-8', 'ASCII' and 'ISO-8859-1' files are converted to IBM-1047
+            # on the controller before the copy, so the file is always EBCDIC here.
+            handles.append(job_handle(submit_uss_jcl(temp_file, module)))
     except SubmitJCLError as e:
+        if e.job_ids:
+            result["jobs"] = [dict(job_id=jobId) for jobId in e.job_ids]
         module.fail_json(msg=repr(e), **result)
-    if jobId is None or jobId == "":
-        result["job_id"] = jobId
-        module.fail_json(
-            msg="JOB ID RETURNED IS None. PLEASE CHECK WHETHER THE JCL IS CORRECT.",
-            **result
-        )
+    jobIds = [handle.get("job_id") for handle in handles]
+    for jobId in jobIds:
+        if jobId is None or jobId == "":
+            result["job_id"] = jobId
+            module.fail_json(
+                msg="JOB ID RETURNED IS None. PLEASE CHECK WHETHER THE JCL IS CORRECT.",
+                **result
+            )
 
-    result["job_id"] = jobId
-    if wait is True:
-        try:
-            waitJob = query_jobs_status(jobId)
-        except SubmitJCLError as e:
-            module.fail_json(msg=repr(e), **result)
-        while waitJob[0].get("status") == "AC":  # AC means in progress
-            sleep(1)
-            duration = duration + 1
-            waitJob = Jobs.list(job_id=jobId)
-            if waitJob[0].get("status") == "CC":  # CC means completed
-                break
-            if duration == wait_time_s:  # Long running task. timeout return
-                break
+    all_job_ids = [None] * (len(pending) + len(recorded_runs))
+    for index, jobId in zip(pending, jobIds):
+        all_job_ids[index] = jobId
+    for index, entry in recorded_runs.items():
+        all_job_ids[index] = entry.get("job_id")
+    result["job_id"] = all_job_ids[0] if len(all_job_ids) == 1 else all_job_ids
+    timed_out = False
+    retry_policy = RetryPolicy(deadline_s=10)
+    if wait is True and timings is None:
+        # every job is waited on against the same deadline, so a batch
+        # waits at most wait_time_s in total
+        start = time()
+        for jobId in jobIds:
+            remaining = wait_time_s - int(time() - start)
+            try:
+                if remaining <= 0:
+                    status = query_jobs_status(jobId, retry_policy)[0].get("status")
+                    timed_out = timed_out or status == "AC"
+                    continue
+                job_duration = wait_for_job(jobId, remaining, retry_policy)
+            except SubmitJCLError as e:
+                module.fail_json(msg=repr(e), **result)
+            timed_out = timed_out or job_duration == remaining
+        duration = int(round(time() - start))
 
     try:
-        result = get_job_info(module, jobId, return_output)
-        if wait is True and return_output is True and max_rc is not None:
-            assert_valid_return_code(
-                max_rc, result.get("jobs")[0].get("ret_code").get("code")
+        jobs_by_index = {}
+        for index, entry in recorded_runs.items():
+            jobs_by_index[index] = [
+                dict(
+                    job_id=entry.get("job_id"),
+                    job_name=entry.get("job_name"),
+                    ret_code=entry.get("ret_code"),
+                    ddnames=[],
+                )
+            ]
+        runs = {}
+        for index, handle in zip(pending, handles):
+            jobId = handle.get("job_id")
+            if wait is not True:
+                # JES is not queried for jobs that are not waited on,
+                # zos_job_harvest collects them from the handles
+                jobs_by_index[index] = [
+                    dict(
+                        job_id=jobId,
+                        job_name=handle.get("job_name"),
+                        ret_code=None,
+                        ddnames=[],
+                    )
+                ]
+                continue
+            job_result = get_job_info(module, jobId, return_output, retry_policy)
+            jobs_by_index[index] = job_result.get("jobs", [])
+            ret_code = job_result.get("jobs")[0].get("ret_code")
+            if idempotency_key and ret_code and ret_code.get("code") is not None:
+                if int(ret_code.get("code")) <= (max_rc if max_rc is not None else 0):
+                    runs[digests[index]] = dict(
+                        job_id=jobId,
+                        job_name=job_result.get("jobs")[0].get("job_name"),
+                        ret_code=ret_code,
+                        recorded=int(time()),
+                    )
+        if runs:
+            update_state(
+                idempotency_ledger,
+                lambda ledger: record_runs(ledger, runs, idempotency_window_s, time()),
             )
+        jobs = []
+        for index in sorted(jobs_by_index):
+            jobs.extend(jobs_by_index[index])
+        # keep members and validation set before the jobs were submitted,
+        # job_id is only returned with a failure, each job carries its own
+        result.pop("job_id", None)
+        result.update(jobs=jobs, handles=handles, retry_stats=retry_policy.stats())
+        if timings is not None:
+            result["timings"] = timings
+        if idempotency_key:
+            result["replayed"] = [
+                all_job_ids[index] for index in sorted(recorded_runs)
+            ]
+        if wait is True and return_output is True and max_rc is not None:
+            for index, jobId in zip(pending, jobIds):
+                assert_valid_return_code(
+                    max_rc, jobs_by_index[index][0].get("ret_code").get("code")
+                )
     except SubmitJCLError as e:
         module.fail_json(msg=repr(e), **result)
     except Exception as e:
@@ -839,7 +1773,7 @@ def run_module():
         if temp_file:
             remove(temp_file)
     result["duration"] = duration
-    if duration == wait_time_s:
+    if timed_out:
         result["message"] = {
             "stdout": "Submit JCL operation succeeded but it is a long running job. Timeout is "
             + str(wait_time_s)
@@ -847,7 +1781,7 @@ def run_module():
         }
     else:
         result["message"] = {"stdout": "Submit JCL operation succeeded."}
-    result["changed"] = True
+    result["changed"] = len(jobIds) > 0
     module.exit_json(**result)
 
 
@@ -856,8 +1790,10 @@ class Error(Exception):
 
 
 class SubmitJCLError(Error):
-    def __init__(self, jobs):
+    def __init__(self, jobs, job_ids=None):
         self.msg = 'An error occurred during submission of jobs "{0}"'.format(jobs)
+        self.job_ids = job_ids or []
+        super(SubmitJCLError, self).__init__(self.msg)
 
 
 def main():
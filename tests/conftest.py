@@ -33,20 +33,32 @@ def z_python_interpreter(request):
     yield (interpreter_str, inventory)
 
 
-@pytest.fixture(scope="function")
-def ansible_zos_module(request, z_python_interpreter):
+def initialize_zos_hosts(request, z_python_interpreter, **kwargs):
     """ Initialize pytest-ansible plugin with values from
     our YAML config and inject interpreter path into inventory. """
     interpreter, inventory = z_python_interpreter
     # next two lines perform similar action to ansible_adhoc fixture
     plugin = request.config.pluginmanager.getplugin("ansible")
-    adhoc = plugin.initialize(request.config, request, **inventory)
+    adhoc = plugin.initialize(request.config, request, **dict(inventory, **kwargs))
     # * Inject our environment
     hosts = adhoc["options"]["inventory_manager"]._inventory.hosts
     for host in hosts.values():
         host.vars["ansible_python_interpreter"] = interpreter
         host.vars["ansible_connection"] = "zos_ssh"
-    yield adhoc
+    return adhoc
+
+
+@pytest.fixture(scope="function")
+def ansible_zos_module(request, z_python_interpreter):
+    """ Initialize pytest-ansible plugin with values from
+    our YAML config and inject interpreter path into inventory. """
+    yield initialize_zos_hosts(request, z_python_interpreter)
+
+
+@pytest.fixture(scope="function")
+def ansible_zos_module_check_mode(request, z_python_interpreter):
+    """ Like ansible_zos_module, but modules are run in check mode. """
+    yield initialize_zos_hosts(request, z_python_interpreter, check=True)
 
 
 # * We no longer edit sys.modules directly to add zoautil_py mock
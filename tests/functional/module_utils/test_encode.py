@@ -0,0 +1,67 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) IBM Corporation 2020
+# Apache License, Version 2.0 (see https://opensource.org/licenses/Apache-2.0)
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+from ibm_zos_core.plugins.module_utils.encode import (
+    DECODING_TABLES,
+    EncodeError,
+    from_ebcdic,
+    to_ebcdic,
+)
+import pytest
+
+JCL = u"//HELLO    JOB (T043JM),'HELLO [1]',CLASS=R\n//STEP1 EXEC PGM=IEFBR14\n"
+
+
+@pytest.mark.parametrize("code_page", ["IBM-037", "IBM-1047"])
+def test_code_page_tables_are_one_to_one(code_page):
+    table = DECODING_TABLES.get(code_page)
+    assert len(table) == 256
+    assert len(set(table)) == 256
+
+
+def test_ibm_1047_code_points():
+    converted = to_ebcdic(u"[]^\n".encode("utf-8"))
+    assert converted == b"\xad\xbd\x5f\x15"
+
+
+def test_ibm_037_code_points():
+    converted = to_ebcdic(u"[]^\n".encode("utf-8"), to_code_page="IBM-037")
+    assert converted == b"\xba\xbb\xb0\x15"
+
+
+def test_new_line_matches_iconv():
+    converted = to_ebcdic(JCL.encode("utf-8"))
+    assert converted.count(b"\x15") == 2
+    assert b"\x25" not in converted
+
+
+@pytest.mark.parametrize("encoding", ["UTF-8", "ASCII", "ISO-8859-1"])
+def test_round_trip(encoding):
+    converted = to_ebcdic(JCL.encode("ascii"), encoding)
+    assert from_ebcdic(converted) == JCL
+
+
+def test_latin_1_characters():
+    converted = to_ebcdic(u"\xa2\xac".encode("latin-1"), "ISO-8859-1")
+    assert converted == b"\x4a\xb0"
+
+
+def test_unrepresentable_character_fails():
+    with pytest.raises(EncodeError):
+        to_ebcdic(u"€".encode("utf-8"))
+
+
+def test_invalid_source_bytes_fail():
+    with pytest.raises(EncodeError):
+        to_ebcdic(b"\xff\xfe", "ASCII")
+
+
+def test_unsupported_code_page_fails():
+    with pytest.raises(EncodeError):
+        to_ebcdic(b"HELLO", to_code_page="IBM-500")
@@ -0,0 +1,141 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) IBM Corporation 2020
+# Apache License, Version 2.0 (see https://opensource.org/licenses/Apache-2.0)
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+from ibm_zos_core.plugins.module_utils.encode import to_ebcdic
+from ibm_zos_core.plugins.module_utils.jcl import decode_jcl, jcl_errors, validate_jcl
+import pytest
+
+JOB_CARD = """//HELLO    JOB (T043JM,JM00,1,0,0,0),'HELLO WORLD - JRM',CLASS=R,
+//             MSGCLASS=X,MSGLEVEL=1,NOTIFY=S0JM
+"""
+
+VALID_JCL = JOB_CARD + """//         SET HLQ=TEST
+//STEP0001 EXEC PGM=IEBGENER,PARM='A LONG PARAMETER THAT IS CONTINUED
+//             ON THE NEXT LINE'
+//SYSIN    DD DUMMY
+//SYSPRINT DD SYSOUT=*
+//SYSUT1   DD DATA
+//NOT A JCL STATEMENT, AN IN-STREAM RECORD
+/*
+//SYSUT2   DD DSN=&HLQ..OUTPUT,DISP=(NEW,CATLG),
+//            SPACE=(TRK,(1,1)),UNIT=SYSDA                              00010000
+//         IF (STEP0001.RC = 0
+//             & STEP0001.RC < 4) THEN
+//STEP0002 EXEC PGM=IEFBR14
+//TEMP     DD DSN=&&TEMP,DISP=(NEW,DELETE)
+//         ENDIF
+"""
+
+
+def messages(findings, severity):
+    return [f.get("message") for f in findings if f.get("severity") == severity]
+
+
+def test_valid_jcl():
+    assert validate_jcl(VALID_JCL) == []
+
+
+def test_in_stream_data_with_delimiter():
+    jcl = JOB_CARD + """//STEP1    EXEC PGM=IEBGENER
+//SYSUT1   DD DATA,DLM=$$
+//SYSUT2 DD SYSOUT=*
+/*
+$$
+//SYSUT2   DD SYSOUT=*
+"""
+    assert validate_jcl(jcl) == []
+
+
+@pytest.mark.parametrize(
+    "statement,message",
+    [
+        ("//STEP1 EXEC PGM=IEFBR14,PARM=(A,B", "The parentheses are not balanced."),
+        ("//STEP1 EXEC PARM=X", "The EXEC statement needs PGM=, PROC= or a procedure name."),
+        ("//STEP1 RUN PGM=IEFBR14", "Unknown operation RUN."),
+        ("//STEP1 exec PGM=IEFBR14", "The name and operation fields must be in upper case."),
+        ("//STEP12345 EXEC PGM=IEFBR14", "Invalid step name STEP12345."),
+        ("//STEP1 EXEC PGM=PROGRAM01", "Invalid program name PROGRAM01."),
+        ("//STEP1 EXEC PGM=IEFBR14,X" + " " * 60 + "XX", "The line is longer than 80 columns."),
+        ("// ENDIF", "ENDIF without IF."),
+    ],
+)
+def test_statement_errors(statement, message):
+    findings = validate_jcl(JOB_CARD + statement + "\n")
+    assert message in messages(findings, "error")
+    assert findings[0].get("line") == 3
+
+
+def test_continuation_columns():
+    jcl = JOB_CARD + """//STEP1 EXEC PGM=IEFBR14
+//DD1 DD DSN=A.B,
+//                  DISP=SHR
+"""
+    findings = validate_jcl(jcl)
+    assert findings == [
+        dict(
+            line=5,
+            severity="error",
+            message="A continued parameter must start in columns 4 through 16.",
+        )
+    ]
+
+
+def test_missing_continuation():
+    jcl = JOB_CARD + """//STEP1 EXEC PGM=IEFBR14
+//DD1 DD DSN=A.B,
+//DD2 DD DSN=C.D,DISP=SHR
+"""
+    assert "Expected the continuation" not in str(validate_jcl(jcl))
+    assert jcl_errors(validate_jcl(jcl + "//DD3 DD DSN=E.F,\n"))
+
+
+def test_job_statement_required():
+    findings = validate_jcl("//STEP1 EXEC PGM=IEFBR14\n")
+    assert messages(findings, "error") == ["The JCL must start with a JOB statement."]
+
+
+def test_unclosed_if():
+    findings = validate_jcl(JOB_CARD + "// IF RC = 0 THEN\n//STEP1 EXEC PGM=IEFBR14\n")
+    assert findings == [
+        dict(line=3, severity="error", message="The IF statement has no ENDIF.")
+    ]
+
+
+def test_warnings():
+    jcl = JOB_CARD + """//STEP1 EXEC PGM=IEFBR14
+//DD1 DD DSN=A.&LLQ,DISP=SHR,FOO=BAR
+//DD1 DD SYSOUT=&CLASS
+//* A COMMENT THAT USES &UNDEFINED
+"""
+    findings = validate_jcl(jcl)
+    assert jcl_errors(findings) == []
+    assert messages(findings, "warning") == [
+        "Unknown DD parameter FOO.",
+        "DD name DD1 is used more than once in the step.",
+        "Symbol &CLASS is not defined by a SET or PROC statement.",
+    ]
+
+
+def test_proc_symbols():
+    jcl = JOB_CARD + """//MYPROC PROC OUT=*
+//PSTEP EXEC PGM=IEFBR14
+//PDD   DD SYSOUT=&OUT
+//      PEND
+//STEP1 EXEC MYPROC,OUT=A
+"""
+    assert validate_jcl(jcl) == []
+
+
+@pytest.mark.parametrize("encoding", ["UTF-8", "IBM-1047"])
+def test_decode_jcl(encoding):
+    contents = VALID_JCL.encode("utf-8")
+    if encoding != "UTF-8":
+        contents = to_ebcdic(contents, "UTF-8", encoding)
+    assert decode_jcl(contents) == VALID_JCL
+    assert decode_jcl(contents, encoding) == VALID_JCL
@@ -0,0 +1,77 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) IBM Corporation 2020
+# Apache License, Version 2.0 (see https://opensource.org/licenses/Apache-2.0)
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+from ibm_zos_core.plugins.module_utils.job import (
+    job_status_class,
+    status_ret_code,
+    to_columnar,
+)
+import pytest
+
+
+@pytest.mark.parametrize(
+    "status,status_class",
+    [
+        ("AC", "active"),
+        ("CC", "completed"),
+        ("CC 0004", "completed"),
+        ("ABEND", "abended"),
+        ("ABENDU0012", "abended"),
+        ("JCLERR", "jcl_error"),
+        ("JCL ERROR", "jcl_error"),
+        ("CANCELED", "canceled"),
+        ("?", "other"),
+        (None, "other"),
+    ],
+)
+def test_job_status_class(status, status_class):
+    assert job_status_class(status) == status_class
+
+
+@pytest.mark.parametrize(
+    "status,return_code,ret_code",
+    [
+        ("CC", "0000", dict(msg="CC 0000", code=0, msg_code="0000", msg_txt="")),
+        ("CC", "0004", dict(msg="CC 0004", code=4, msg_code="0004", msg_txt="")),
+        ("ABEND", "U0012", dict(msg="ABEND U0012", code=None, msg_code="U0012", msg_txt="")),
+        ("ABENDU0012", "?", dict(msg="ABENDU0012", code=None, msg_code="U0012", msg_txt="")),
+        ("AC", "?", dict(msg="AC", code=None, msg_code=None, msg_txt="")),
+        ("JCLERR", None, dict(msg="JCLERR", code=None, msg_code=None, msg_txt="")),
+    ],
+)
+def test_status_ret_code(status, return_code, ret_code):
+    assert status_ret_code(status, return_code) == ret_code
+
+
+def test_to_columnar():
+    rows = [
+        dict(job_id="JOB00001", ret_code=dict(msg="CC 0000", code=0), ddnames=[]),
+        dict(job_id="JOB00002", ret_code=None, ddnames=[dict(ddname="JESJCL")]),
+        dict(job_id="JOB00003", ret_code=dict(msg="ABEND S0C4", code=None)),
+    ]
+    assert to_columnar(rows) == dict(
+        job_id=["JOB00001", "JOB00002", "JOB00003"],
+        ret_code=dict(msg=["CC 0000", None, "ABEND S0C4"], code=[0, None, None]),
+        ddnames=[[], [dict(ddname="JESJCL")], None],
+    )
+
+
+def test_to_columnar_keeps_non_dict_values():
+    rows = [
+        dict(job_id="JOB00001", ret_code=dict(msg="CC 0000", code=0)),
+        dict(job_id="JOB00002", ret_code="null"),
+    ]
+    assert to_columnar(rows) == dict(
+        job_id=["JOB00001", "JOB00002"],
+        ret_code=[dict(msg="CC 0000", code=0), "null"],
+    )
+
+
+def test_to_columnar_empty():
+    assert to_columnar([]) == {}
@@ -0,0 +1,74 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) IBM Corporation 2020
+# Apache License, Version 2.0 (see https://opensource.org/licenses/Apache-2.0)
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+from ibm_zos_core.plugins.module_utils import retry
+from ibm_zos_core.plugins.module_utils.retry import RetryPolicy
+import pytest
+
+
+@pytest.fixture
+def delays(monkeypatch):
+    slept = []
+    monkeypatch.setattr(retry, "sleep", slept.append)
+    monkeypatch.setattr(retry, "time", lambda: sum(slept))
+    return slept
+
+
+def failing(failures, result=None, error=IndexError):
+    calls = []
+
+    def operation():
+        calls.append(1)
+        if len(calls) <= failures:
+            raise error()
+        return result
+
+    return operation
+
+
+def test_returns_without_retry(delays):
+    policy = RetryPolicy()
+    assert policy.run(lambda: "ok") == "ok"
+    assert delays == []
+    assert policy.stats() == dict(attempts=1, retries=0, wait_s=0.0)
+
+
+def test_retries_until_success(delays):
+    policy = RetryPolicy(base_delay_s=0.1, jitter=False)
+    assert policy.run(failing(3, result="ok")) == "ok"
+    assert delays == [0.1, 0.2, 0.4]
+    assert policy.stats() == dict(attempts=4, retries=3, wait_s=0.7)
+
+
+def test_delay_is_capped_and_jittered():
+    policy = RetryPolicy(base_delay_s=1, max_delay_s=4)
+    for attempt in range(1, 10):
+        delay = policy.delay(attempt)
+        expected = min(4, 2 ** (attempt - 1))
+        assert expected / 2 <= delay <= expected
+
+
+def test_deadline_raises_last_error(delays):
+    policy = RetryPolicy(base_delay_s=1, max_delay_s=1, deadline_s=3, jitter=False)
+    with pytest.raises(IndexError):
+        policy.run(failing(10))
+    assert len(delays) <= 3
+
+
+def test_other_errors_are_not_retried(delays):
+    policy = RetryPolicy()
+    with pytest.raises(ValueError):
+        policy.run(failing(1, error=ValueError))
+    assert delays == []
+
+
+def test_retry_if_returns_last_result(delays):
+    policy = RetryPolicy(base_delay_s=1, max_delay_s=1, deadline_s=2, jitter=False)
+    assert policy.run(lambda: [], retry_if=lambda jobs: not jobs) == []
+    assert policy.retries > 0
@@ -0,0 +1,50 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) IBM Corporation 2020
+# Apache License, Version 2.0 (see https://opensource.org/licenses/Apache-2.0)
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+from ibm_zos_core.plugins.module_utils.state_file import (
+    StateFileError,
+    read_state,
+    update_state,
+)
+import os
+import pytest
+
+
+def test_read_missing_state_file(tmpdir):
+    assert read_state(str(tmpdir.join("missing.json"))) == {}
+
+
+def test_update_creates_directory_and_file(tmpdir):
+    state_path = str(tmpdir.join("nested", "state.json"))
+    update_state(state_path, lambda state: state.update(a=1))
+    assert read_state(state_path) == {"a": 1}
+
+
+def test_update_sees_previous_state(tmpdir):
+    state_path = str(tmpdir.join("state.json"))
+    update_state(state_path, lambda state: state.update(a=1))
+    written = update_state(state_path, lambda state: state.update(b=state.get("a") + 1))
+    assert written == {"a": 1, "b": 2}
+    assert read_state(state_path) == written
+
+
+def test_failed_update_keeps_old_state(tmpdir):
+    state_path = str(tmpdir.join("state.json"))
+    update_state(state_path, lambda state: state.update(a=1))
+    with pytest.raises(TypeError):
+        update_state(state_path, lambda state: state.update(a=object()))
+    assert read_state(state_path) == {"a": 1}
+    assert sorted(os.listdir(str(tmpdir))) == ["state.json", "state.json.lock"]
+
+
+def test_invalid_state_file(tmpdir):
+    state_path = tmpdir.join("state.json")
+    state_path.write("[1, 2]")
+    with pytest.raises(StateFileError):
+        read_state(str(state_path))
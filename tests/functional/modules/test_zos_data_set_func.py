@@ -406,3 +406,176 @@ def test_repeated_operations(ansible_zos_module):
     for result in results.contacted.values():
         assert result.get("changed") is False
         assert result.get("module_stderr") is None
+
+
+def test_batch_data_set_catalog_and_uncatalog(ansible_zos_module):
+    hosts = ansible_zos_module
+    names = ["USER.PRIVATE.BATCH1", "USER.PRIVATE.BATCH2"]
+    hosts.all.zos_data_set(
+        batch=[{"name": name, "type": "seq", "replace": True} for name in names]
+    )
+    results = hosts.all.zos_data_set(
+        batch=[{"name": name, "state": "uncataloged"} for name in names]
+    )
+    for result in results.contacted.values():
+        assert result.get("changed") is True
+        assert result.get("module_stderr") is None
+    results = hosts.all.zos_data_set(
+        batch=[
+            {"name": name, "state": "cataloged", "volume": DEFAULT_VOLUME}
+            for name in names
+        ]
+    )
+    for result in results.contacted.values():
+        assert result.get("changed") is True
+        assert result.get("module_stderr") is None
+    results = hosts.all.zos_data_set(
+        batch=[
+            {"name": name, "state": "cataloged", "volume": DEFAULT_VOLUME}
+            for name in names
+        ]
+    )
+    hosts.all.zos_data_set(
+        batch=[{"name": name, "state": "absent"} for name in names]
+    )
+    for result in results.contacted.values():
+        assert result.get("changed") is False
+
+
+def test_batch_data_set_parallel(ansible_zos_module):
+    hosts = ansible_zos_module
+    names = ["USER.PRIVATE.PARA1", "USER.PRIVATE.PARA2", "USER.PRIVATE.PARA3"]
+    batch = [{"name": name, "type": "pds", "replace": True} for name in names]
+    batch.append({"name": names[0] + "(MEM1)", "type": "member"})
+    results = hosts.all.zos_data_set(parallel=2, batch=batch)
+    for result in results.contacted.values():
+        assert result.get("changed") is True
+        assert [entry.get("name") for entry in result.get("results")] == [
+            entry.get("name").upper() for entry in batch
+        ]
+        assert not [entry for entry in result.get("results") if entry.get("failed")]
+    results = hosts.all.zos_data_set(
+        parallel=2, batch=[{"name": name, "state": "absent"} for name in names]
+    )
+    for result in results.contacted.values():
+        assert result.get("changed") is True
+        assert all([entry.get("changed") for entry in result.get("results")])
+
+
+def test_data_set_replacement_when_attributes_match(ansible_zos_module):
+    hosts = ansible_zos_module
+    hosts.all.zos_data_set(
+        name=DEFAULT_DATA_SET_NAME, type="seq", format="fb", record_length=80, replace=True
+    )
+    results = hosts.all.zos_data_set(
+        name=DEFAULT_DATA_SET_NAME, type="seq", format="fb", record_length=80, replace=True
+    )
+    for result in results.contacted.values():
+        assert result.get("changed") is False
+        assert result.get("diff")[0].get("before") == result.get("diff")[0].get("after")
+    results = hosts.all.zos_data_set(
+        name=DEFAULT_DATA_SET_NAME, type="seq", format="vb", record_length=137, replace=True
+    )
+    hosts.all.zos_data_set(name=DEFAULT_DATA_SET_NAME, state="absent")
+    for result in results.contacted.values():
+        assert result.get("changed") is True
+        assert result.get("diff")[0].get("before").get("format") == "FB"
+
+
+@pytest.mark.parametrize("dstype", ["seq", "ksds"])
+def test_data_set_replacement_when_size_matches(ansible_zos_module, dstype):
+    hosts = ansible_zos_module
+    hosts.all.zos_data_set(
+        name=DEFAULT_DATA_SET_NAME, type=dstype, size="1CYL", record_length=80, replace=True
+    )
+    results = hosts.all.zos_data_set(
+        name=DEFAULT_DATA_SET_NAME, type=dstype, size="1CYL", record_length=80, replace=True
+    )
+    for result in results.contacted.values():
+        assert result.get("changed") is False
+    results = hosts.all.zos_data_set(
+        name=DEFAULT_DATA_SET_NAME, type=dstype, size="5CYL", record_length=80, replace=True
+    )
+    hosts.all.zos_data_set(name=DEFAULT_DATA_SET_NAME, state="absent")
+    for result in results.contacted.values():
+        assert result.get("changed") is True
+
+
+def test_data_set_deletion_by_pattern(ansible_zos_module):
+    hosts = ansible_zos_module
+    names = ["USER.PRIVATE.PATT.ONE", "USER.PRIVATE.PATT.TWO.SEQ"]
+    hosts.all.zos_data_set(batch=[{"name": name, "type": "seq"} for name in names])
+    results = hosts.all.zos_data_set(pattern="user.private.patt.**", state="absent")
+    for result in results.contacted.values():
+        assert result.get("changed") is True
+        assert sorted(result.get("data_sets")) == names
+    results = hosts.all.zos_data_set(pattern="user.private.patt.**", state="absent")
+    for result in results.contacted.values():
+        assert result.get("changed") is False
+        assert result.get("data_sets") == []
+
+
+def test_batch_member_creation_and_deletion(ansible_zos_module):
+    hosts = ansible_zos_module
+    members = ["USER.PRIVATE.MEMBERS(MEM{0})".format(index) for index in range(1, 4)]
+    hosts.all.zos_data_set(name="USER.PRIVATE.MEMBERS", type="pds", replace=True)
+    results = hosts.all.zos_data_set(
+        batch=[{"name": member, "type": "member"} for member in members]
+    )
+    for result in results.contacted.values():
+        assert result.get("changed") is True
+        assert result.get("module_stderr") is None
+    results = hosts.all.zos_data_set(
+        batch=[{"name": member, "type": "member"} for member in members]
+    )
+    for result in results.contacted.values():
+        assert result.get("changed") is False
+    results = hosts.all.zos_data_set(
+        batch=[
+            {"name": member, "type": "member", "state": "absent"} for member in members
+        ]
+    )
+    hosts.all.zos_data_set(name="USER.PRIVATE.MEMBERS", state="absent")
+    for result in results.contacted.values():
+        assert result.get("changed") is True
+        assert result.get("module_stderr") is None
+
+
+def test_batch_check_mode_plan(ansible_zos_module, ansible_zos_module_check_mode):
+    hosts = ansible_zos_module
+    existing = "USER.PRIVATE.CHECK.SEQ"
+    new = "USER.PRIVATE.CHECK.PDS"
+    hosts.all.zos_data_set(name=new, state="absent")
+    hosts.all.zos_data_set(
+        name=existing, type="seq", format="fb", record_length=80, replace=True
+    )
+    results = ansible_zos_module_check_mode.all.zos_data_set(
+        batch=[
+            {
+                "name": existing,
+                "type": "seq",
+                "format": "fb",
+                "record_length": 80,
+                "replace": True,
+            },
+            {"name": new, "type": "pds"},
+            {"name": new + "(MEM1)", "type": "member"},
+            {"name": existing, "state": "absent"},
+        ]
+    )
+    for result in results.contacted.values():
+        assert result.get("changed") is True
+        assert result.get("module_stderr") is None
+        assert [entry.get("actions") for entry in result.get("plan")] == [
+            [],
+            ["create"],
+            ["create"],
+            ["delete"],
+        ]
+    # nothing was allocated or deleted
+    results = hosts.all.zos_data_set(name=new, state="absent")
+    for result in results.contacted.values():
+        assert result.get("changed") is False
+    results = hosts.all.zos_data_set(name=existing, state="absent")
+    for result in results.contacted.values():
+        assert result.get("changed") is True
@@ -0,0 +1,51 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) IBM Corporation 2020
+# Apache License, Version 2.0 (see https://opensource.org/licenses/Apache-2.0)
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+from shellescape import quote
+
+JCL_FILE_CONTENTS = """//HELLO    JOB (T043JM,JM00,1,0,0,0),'HELLO WORLD - JRM',CLASS=R,
+//             MSGCLASS=X,MSGLEVEL=1,NOTIFY=S0JM
+//STEP0001 EXEC PGM=IEBGENER
+//SYSIN    DD DUMMY
+//SYSPRINT DD SYSOUT=*
+//SYSUT1   DD *
+HELLO, WORLD
+/*
+//SYSUT2   DD SYSOUT=*
+//
+"""
+
+TEMP_PATH = "/tmp/ansible/jcl"
+
+
+def test_job_harvest_submitted_handles(ansible_zos_module):
+    hosts = ansible_zos_module
+    hosts.all.file(path=TEMP_PATH, state="directory")
+    hosts.all.shell(
+        cmd="echo {0} > {1}/SAMPLE".format(quote(JCL_FILE_CONTENTS), TEMP_PATH)
+    )
+    submitted = hosts.all.zos_job_submit(
+        src="{0}/SAMPLE".format(TEMP_PATH), location="USS", wait=False
+    )
+    handles = []
+    for result in submitted.contacted.values():
+        handles.extend(result.get("handles"))
+    results = hosts.all.zos_job_harvest(handles=handles, wait_time_s=60, max_rc=0)
+    hosts.all.file(path=TEMP_PATH, state="absent")
+    for result in results.contacted.values():
+        assert result.get("changed") is False
+        assert result.get("pending") == []
+        assert result.get("jobs")[0].get("ret_code").get("code") == 0
+
+
+def test_job_harvest_invalid_handle(ansible_zos_module):
+    hosts = ansible_zos_module
+    results = hosts.all.zos_job_harvest(handles=["NOTAJOB"])
+    for result in results.contacted.values():
+        assert result.get("failed") is True
@@ -0,0 +1,54 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) IBM Corporation 2020
+# Apache License, Version 2.0 (see https://opensource.org/licenses/Apache-2.0)
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+from shellescape import quote
+
+JCL_FILE_CONTENTS = """//PURGEME  JOB (T043JM,JM00,1,0,0,0),'PURGE TEST',CLASS=R,
+//             MSGCLASS=X,MSGLEVEL=1
+//STEP0001 EXEC PGM=IEFBR14
+//
+"""
+
+TEMP_PATH = "/tmp/ansible/jcl"
+
+
+def test_job_purge_dry_run_and_purge(ansible_zos_module):
+    hosts = ansible_zos_module
+    hosts.all.file(path=TEMP_PATH, state="directory")
+    hosts.all.shell(
+        cmd="echo {0} > {1}/SAMPLE".format(quote(JCL_FILE_CONTENTS), TEMP_PATH)
+    )
+    submitted = hosts.all.zos_job_submit(
+        src="{0}/SAMPLE".format(TEMP_PATH), location="USS", wait=True
+    )
+    hosts.all.file(path=TEMP_PATH, state="absent")
+    job_ids = [result.get("job_id") for result in submitted.contacted.values()]
+
+    results = hosts.all.zos_job_purge(job_name="PURGEME", dry_run=True)
+    for result in results.contacted.values():
+        assert result.get("changed") is False
+        assert result.get("purged") == 0
+        assert set(job_ids) <= set(result.get("jobs"))
+
+    results = hosts.all.zos_job_purge(job_name="PURGEME", status=["completed"])
+    for result in results.contacted.values():
+        assert result.get("changed") is True
+        assert set(job_ids) <= set(result.get("jobs"))
+        assert result.get("not_purged") == []
+
+    results = hosts.all.zos_job_query(job_id=job_ids[0])
+    for result in results.contacted.values():
+        assert result.get("failed") is True
+
+
+def test_job_purge_requires_filter(ansible_zos_module):
+    hosts = ansible_zos_module
+    results = hosts.all.zos_job_purge()
+    for result in results.contacted.values():
+        assert result.get("failed") is True
@@ -25,3 +25,117 @@ def test_zos_job_query_func(ansible_zos_module):
     for result in results.contacted.values():
         assert result.get("changed") is False
         assert result.get("jobs") is not None
+
+
+def test_zos_job_query_paged(ansible_zos_module):
+    hosts = ansible_zos_module
+    results = hosts.all.zos_job_query(
+        job_name="*", owner="*", sort="job_id", sort_order="descending", limit=2
+    )
+    for result in results.contacted.values():
+        assert len(result.get("jobs")) <= 2
+        assert result.get("total") >= len(result.get("jobs"))
+        if result.get("total") > 2:
+            assert result.get("next_offset") == 2
+        else:
+            assert result.get("next_offset") is None
+
+
+def test_zos_job_query_multiple_filters(ansible_zos_module):
+    hosts = ansible_zos_module
+    results = hosts.all.zos_job_query(job_name=["*"], owner=["*"])
+    job_ids = []
+    for result in results.contacted.values():
+        job_ids = [job.get("job_id") for job in result.get("jobs")][:2]
+    results = hosts.all.zos_job_query(job_id=job_ids, owner=["*"])
+    for result in results.contacted.values():
+        assert sorted([job.get("job_id") for job in result.get("jobs")]) == sorted(
+            set(job_ids)
+        )
+
+
+def test_zos_job_query_wildcards(ansible_zos_module):
+    hosts = ansible_zos_module
+    results = hosts.all.zos_job_query(job_name="*", owner="*")
+    job_name = None
+    for result in results.contacted.values():
+        job_name = result.get("jobs")[0].get("job_name")
+    single_char = job_name[:1] + "%" + job_name[2:] if len(job_name) > 1 else "%"
+    results = hosts.all.zos_job_query(
+        job_name=[single_char, job_name[:1] + "*", job_name], owner="*"
+    )
+    for result in results.contacted.values():
+        assert job_name in [job.get("job_name") for job in result.get("jobs")]
+        job_ids = [job.get("job_id") for job in result.get("jobs")]
+        assert len(job_ids) == len(set(job_ids))
+
+
+def test_zos_job_query_status_and_time_filters(ansible_zos_module):
+    hosts = ansible_zos_module
+    results = hosts.all.zos_job_query(
+        job_name="*",
+        owner="*",
+        status=["completed"],
+        max_rc=0,
+        submitted_after="2000-01-01",
+    )
+    for result in results.contacted.values():
+        for job in result.get("jobs", []):
+            assert job.get("ret_code").get("msg").startswith("CC")
+            assert int(job.get("ret_code").get("code")) == 0
+
+
+def test_zos_job_query_invalid_time_filter(ansible_zos_module):
+    hosts = ansible_zos_module
+    results = hosts.all.zos_job_query(job_name="*", ended_after="yesterday")
+    for result in results.contacted.values():
+        assert result.get("failed") is True
+
+
+def test_zos_job_query_sdsf_backend(ansible_zos_module):
+    hosts = ansible_zos_module
+    results = hosts.all.zos_job_query(job_name="*", owner="*", backend="sdsf", limit=5)
+    for result in results.contacted.values():
+        assert result.get("changed") is False
+        for job in result.get("jobs"):
+            assert "job_class" in job
+            assert "system" in job
+            assert "elapsed_s" in job
+
+
+def test_zos_job_query_sdsf_sorted_page(ansible_zos_module):
+    hosts = ansible_zos_module
+    results = hosts.all.zos_job_query(
+        job_name="*", owner="*", backend="sdsf", sort="job_name", limit=3
+    )
+    for result in results.contacted.values():
+        job_names = [job.get("job_name") for job in result.get("jobs")]
+        assert len(job_names) <= 3
+        assert job_names == sorted(job_names)
+        assert result.get("total") >= len(job_names)
+        if result.get("total") > 3:
+            assert result.get("next_offset") == 3
+
+
+def test_zos_job_query_snapshot(ansible_zos_module):
+    hosts = ansible_zos_module
+    snapshot_file = "/tmp/ansible/zos_job_query_snapshots.json"
+    results = hosts.all.zos_job_query(
+        job_name="*", owner="*", snapshot=True, snapshot_file=snapshot_file
+    )
+    state_token = None
+    for result in results.contacted.values():
+        assert result.get("full_refresh") is True
+        state_token = result.get("state_token")
+    results = hosts.all.zos_job_query(
+        job_name="*",
+        owner="*",
+        snapshot=True,
+        snapshot_file=snapshot_file,
+        state_token=state_token,
+    )
+    hosts.all.file(path=snapshot_file, state="absent")
+    for result in results.contacted.values():
+        assert result.get("full_refresh") is False
+        assert result.get("state_token") != state_token
+        assert isinstance(result.get("purged"), list)
@@ -90,6 +90,93 @@ def test_job_submit_LOCAL(ansible_zos_module):
         assert result.get("changed") is True
 
 
+def test_job_submit_batch(ansible_zos_module):
+    hosts = ansible_zos_module
+    hosts.all.file(path=TEMP_PATH, state="directory")
+    hosts.all.shell(
+        cmd="echo {0} > {1}/SAMPLE".format(quote(JCL_FILE_CONTENTS), TEMP_PATH)
+    )
+    hosts.all.zos_data_set(
+        name=DATA_SET_NAME, state="present", type="pds", replace=True
+    )
+    hosts.all.shell(
+        cmd="cp {0}/SAMPLE \"//'{1}(SAMPLE)'\"".format(TEMP_PATH, DATA_SET_NAME)
+    )
+    results = hosts.all.zos_job_submit(
+        batch=[
+            dict(src="{0}(SAMPLE)".format(DATA_SET_NAME), location="DATA_SET"),
+            dict(src="{0}/SAMPLE".format(TEMP_PATH), location="USS"),
+        ],
+        wait=True,
+    )
+    hosts.all.file(path=TEMP_PATH, state="absent")
+    for result in results.contacted.values():
+        assert len(result.get("jobs")) == 2
+        for job in result.get("jobs"):
+            assert job.get("ret_code").get("code") == 0
+        assert result.get("changed") is True
+
+
+
+def test_job_submit_member_pattern(ansible_zos_module):
+    hosts = ansible_zos_module
+    hosts.all.file(path=TEMP_PATH, state="directory")
+    hosts.all.shell(
+        cmd="echo {0} > {1}/SAMPLE".format(quote(JCL_FILE_CONTENTS), TEMP_PATH)
+    )
+    hosts.all.zos_data_set(
+        name=DATA_SET_NAME, state="present", type="pds", replace=True
+    )
+    for member in ["NIGHT01", "NIGHT02", "DAY01"]:
+        hosts.all.shell(
+            cmd="cp {0}/SAMPLE \"//'{1}({2})'\"".format(
+                TEMP_PATH, DATA_SET_NAME, member
+            )
+        )
+    results = hosts.all.zos_job_submit(
+        src="{0}(NIGHT*)".format(DATA_SET_NAME),
+        location="DATA_SET",
+        member_order="descending",
+        max_active=1,
+        wait=True,
+    )
+    hosts.all.file(path=TEMP_PATH, state="absent")
+    for result in results.contacted.values():
+        assert result.get("members") == [
+            "{0}(NIGHT02)".format(DATA_SET_NAME.upper()),
+            "{0}(NIGHT01)".format(DATA_SET_NAME.upper()),
+        ]
+        assert len(result.get("jobs")) == 2
+        assert result.get("changed") is True
+
+
+def test_job_submit_validate(ansible_zos_module):
+    hosts = ansible_zos_module
+    hosts.all.file(path=TEMP_PATH, state="directory")
+    hosts.all.shell(
+        cmd="echo {0} > {1}/SAMPLE".format(quote(JCL_FILE_CONTENTS), TEMP_PATH)
+    )
+    hosts.all.shell(
+        cmd="echo {0} > {1}/BROKEN".format(
+            quote(JCL_FILE_CONTENTS.replace("EXEC PGM=", "EXEC PRG=")), TEMP_PATH
+        )
+    )
+    results = hosts.all.zos_job_submit(
+        src="{0}/SAMPLE".format(TEMP_PATH), location="USS", validate=True, wait=True
+    )
+    for result in results.contacted.values():
+        assert result.get("validation") == []
+        assert result.get("changed") is True
+    results = hosts.all.zos_job_submit(
+        src="{0}/BROKEN".format(TEMP_PATH), location="USS", validate=True, wait=True
+    )
+    hosts.all.file(path=TEMP_PATH, state="absent")
+    for result in results.contacted.values():
+        assert result.get("failed") is True
+        assert result.get("validation")[0].get("severity") == "error"
+        assert result.get("jobs") is None
+
+
 # * currently don't have volume support from ZOAU python API, so this will not be reproduceable
 # * in CI/CD testing environment (for now)
 # def test_job_submit_PDS_volume(ansible_zos_module):